@@ -16,6 +16,7 @@ from utils.helpers import (
     format_number,
     get_role_by_id
 )
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +29,9 @@ class AdminCog(commands.Cog):
     async def assign_level_role(self, member: discord.Member, level: int) -> bool:
         """레벨에 따른 역할 자동 부여 (attendance.py와 동일한 로직)"""
         try:
-            # 현재 레벨에 맞는 역할 ID 가져오기
-            target_role_id = Config.get_role_for_level(level)
+            # 현재 레벨에 맞는 역할 ID 가져오기 (길드 설정)
+            settings = self.bot.settings.get(member.guild.id)
+            target_role_id = settings.get_role_for_level(level)
             if not target_role_id:
                 return False
             
@@ -47,9 +49,8 @@ class AdminCog(commands.Cog):
             # 기존 레벨 역할 제거
             roles_to_remove = []
             for role in member.roles:
-                for role_level_range, role_id in Config.ROLE_LEVELS.items():
-                    if role.id == role_id and role.id != target_role_id:
-                        roles_to_remove.append(role)
+                if role.id in settings.level_role_ids and role.id != target_role_id:
+                    roles_to_remove.append(role)
             
             if roles_to_remove:
                 await member.remove_roles(*roles_to_remove, reason="레벨 변경으로 인한 역할 변경")
@@ -131,7 +132,7 @@ class AdminCog(commands.Cog):
             role_assigned = await self.assign_level_role(유저, 레벨)
             role_message = ""
             if role_assigned:
-                role_id = Config.get_role_for_level(레벨)
+                role_id = self.bot.settings.get(interaction.guild.id).get_role_for_level(레벨)
                 if role_id is not None:
                     role = get_role_by_id(interaction.guild, role_id)
                     if role:
@@ -191,10 +192,147 @@ class AdminCog(commands.Cog):
         )
         
         # 확인/취소 버튼 생성
-        view = DataResetConfirmView(유저, self.bot.db)
+        view = DataResetConfirmView(유저, self.bot.db, self.bot.settings)
         
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
     
+    async def _ensure_admin(self, interaction: discord.Interaction) -> bool:
+        """서버 관리자인지 확인 (아니면 오류 응답 후 False)"""
+        if interaction.guild is None or not isinstance(interaction.user, discord.Member):
+            await interaction.response.send_message("❌ 이 명령어는 서버에서만 사용할 수 있습니다.", ephemeral=True)
+            return False
+        if not await has_admin_permissions(interaction.user):
+            embed = create_error_embed(
+                "❌ 권한 없음",
+                "이 명령어는 관리자만 사용할 수 있습니다."
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return False
+        return True
+    
+    async def _update_settings(self, interaction: discord.Interaction, title: str, description: str, **changes) -> None:
+        """길드 설정 저장 후 결과 응답"""
+        if await self.bot.settings.update(interaction.guild.id, **changes):
+            embed = create_success_embed(title, description)
+            logger.info(f"길드 {interaction.guild.id} 설정 변경: {changes}")
+        else:
+            embed = create_error_embed("❌ 저장 실패", "설정을 저장하는 중 오류가 발생했습니다.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="서버설정", description="이 서버의 봇 설정을 확인합니다 (관리자 전용)")
+    async def show_settings(self, interaction: discord.Interaction):
+        """길드 설정 확인"""
+        if not await self._ensure_admin(interaction):
+            return
+        
+        settings = self.bot.settings.get(interaction.guild.id)
+        embed = discord.Embed(
+            title="⚙️ 서버 설정",
+            color=Config.COLORS['info']
+        )
+        embed.add_field(name="🔊 자동 참여", value="ON" if settings.auto_join else "OFF", inline=True)
+        embed.add_field(
+            name="🗣️ TTS 엔진",
+            value=settings.tts_engine or f"기본값 ({Config.get_tts_engine()})",
+            inline=True
+        )
+        xp_text = f"{settings.get_xp_per_attendance()} XP"
+        if settings.xp_per_attendance is None:
+            xp_text += " (기본값)"
+        embed.add_field(name="✅ 출석 경험치", value=xp_text, inline=True)
+        
+        role_lines = []
+        for min_level, max_level, role_id in settings.get_role_levels():
+            role = get_role_by_id(interaction.guild, role_id)
+            role_text = role.mention if role else f"알 수 없는 역할 ({role_id})"
+            role_lines.append(f"• Lv.{min_level}~{max_level}: {role_text}")
+        role_title = "🎭 레벨 역할" + (" (기본값)" if settings.role_levels is None else "")
+        embed.add_field(name=role_title, value="\n".join(role_lines)[:1024] or "없음", inline=False)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="출석경험치", description="출석 시 획득하는 경험치를 설정합니다 (관리자 전용)")
+    @app_commands.describe(경험치="출석 시 획득 XP (0이면 기본값으로 되돌림)")
+    async def set_attendance_xp(self, interaction: discord.Interaction, 경험치: app_commands.Range[int, 0, 10000]):
+        """출석 경험치 설정"""
+        if not await self._ensure_admin(interaction):
+            return
+        
+        xp_per_attendance = 경험치 or None
+        value = 경험치 or Config.XP_PER_ATTENDANCE
+        await self._update_settings(
+            interaction,
+            "✅ 출석 경험치 설정 완료",
+            f"이제 출석 시 **{value} XP**를 획득합니다.",
+            xp_per_attendance=xp_per_attendance
+        )
+    
+    @app_commands.command(name="레벨역할설정", description="레벨 구간에 부여할 역할을 설정합니다 (관리자 전용)")
+    @app_commands.describe(
+        시작레벨="구간 시작 레벨",
+        끝레벨="구간 끝 레벨",
+        역할="해당 구간에 부여할 역할"
+    )
+    async def set_level_role(
+        self,
+        interaction: discord.Interaction,
+        시작레벨: app_commands.Range[int, 1, 999],
+        끝레벨: app_commands.Range[int, 1, 999],
+        역할: discord.Role
+    ):
+        """레벨 구간 역할 설정 (겹치는 기존 구간은 대체)"""
+        if not await self._ensure_admin(interaction):
+            return
+        
+        if 시작레벨 > 끝레벨:
+            embed = create_error_embed("❌ 잘못된 값", "시작 레벨은 끝 레벨보다 클 수 없습니다.")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        settings = self.bot.settings.get(interaction.guild.id)
+        role_levels = [
+            (min_level, max_level, role_id)
+            for min_level, max_level, role_id in settings.get_role_levels()
+            if role_id != 역할.id and (max_level < 시작레벨 or min_level > 끝레벨)
+        ]
+        role_levels.append((시작레벨, 끝레벨, 역할.id))
+        
+        await self._update_settings(
+            interaction,
+            "✅ 레벨 역할 설정 완료",
+            f"레벨 **{시작레벨}~{끝레벨}** 구간에 {역할.mention} 역할을 부여합니다.",
+            role_levels=tuple(sorted(role_levels))
+        )
+    
+    @app_commands.command(name="레벨역할삭제", description="레벨 역할 설정에서 역할을 제외합니다 (관리자 전용)")
+    @app_commands.describe(역할="레벨 역할에서 제외할 역할")
+    async def remove_level_role(self, interaction: discord.Interaction, 역할: discord.Role):
+        """레벨 역할 구간 삭제"""
+        if not await self._ensure_admin(interaction):
+            return
+        
+        settings = self.bot.settings.get(interaction.guild.id)
+        role_levels = tuple(entry for entry in settings.get_role_levels() if entry[2] != 역할.id)
+        await self._update_settings(
+            interaction,
+            "✅ 레벨 역할 삭제 완료",
+            f"{역할.mention} 역할을 레벨 역할에서 제외했습니다.",
+            role_levels=role_levels
+        )
+    
+    @app_commands.command(name="레벨역할초기화", description="레벨 역할 설정을 기본값으로 되돌립니다 (관리자 전용)")
+    async def reset_level_roles(self, interaction: discord.Interaction):
+        """레벨 역할 설정 초기화"""
+        if not await self._ensure_admin(interaction):
+            return
+        
+        await self._update_settings(
+            interaction,
+            "✅ 레벨 역할 초기화 완료",
+            "레벨 역할 설정을 기본값으로 되돌렸습니다.",
+            role_levels=None
+        )
+    
     @app_commands.command(name="명령어목록", description="등록된 모든 명령어를 확인합니다 (개발자용)")
     async def list_commands(self, interaction: discord.Interaction):
         """등록된 모든 슬래시 명령어 목록 표시"""
@@ -357,15 +495,155 @@ class AdminCog(commands.Cog):
         embed.add_field(name="🏠 서버 수", value=f"{total_guilds}", inline=True)
         embed.add_field(name="👥 사용자 수", value=f"{total_users}", inline=True)
         
+        # 이벤트 루프 지연 (게이트웨이 레이턴시와 별개로 봇 내부 처리 지연)
+        loop_monitor = getattr(self.bot, 'loop_monitor', None)
+        if loop_monitor:
+            lag = loop_monitor.metrics()
+            lines = [
+                f"지연 p50 {lag['p50_ms']}ms · p95 {lag['p95_ms']}ms · "
+                f"p99 {lag['p99_ms']}ms · 최대 {lag['max_ms']}ms (표본 {lag['samples']})",
+            ]
+            if loop_monitor.slow_threshold > 0:
+                lines.append(f"느린 콜백 {lag['slow_total']}회")
+            for slow in lag['slow_recent'][:3]:
+                lines.append(f"• <t:{int(slow['at'])}:R> {slow['callback'][:80]} ({slow['ms']}ms)")
+            embed.add_field(name="⏱️ 이벤트 루프", value="\n".join(lines)[:1024], inline=False)
+        
+        # 길드별 TTS 재생 큐 지표
+        voice_cog = self.bot.get_cog('VoiceCog')
+        tts_queues = getattr(voice_cog, 'tts_queues', None)
+        if tts_queues:
+            lines = []
+            for guild_id, queue in tts_queues.items():
+                guild = self.bot.get_guild(guild_id)
+                queue_stats = queue.metrics()
+                lines.append(
+                    f"• {guild.name if guild else guild_id}: 대기 {queue_stats['depth']} · "
+                    f"재생 {queue_stats['played']} · 버림 {queue_stats['dropped']} · "
+                    f"실패 {queue_stats['failed']} · 미리 합성 {queue_stats['prefetched']} · "
+                    f"병합 {queue_stats['coalesced']} · "
+                    f"평균 대기 {queue_stats['avg_wait_ms']}ms · 첫 음성 {queue_stats['avg_first_audio_ms']}ms"
+                )
+            spam_guard = getattr(voice_cog, 'tts_spam_guard', None)
+            if spam_guard:
+                spam = spam_guard.metrics()
+                lines.append(f"• 도배 방지: 중복 {spam['duplicates']} · 한도 초과 {spam['over_budget']}")
+            embed.add_field(name="🔊 TTS 큐", value="\n".join(lines)[:1024], inline=False)
+        
+        # 음성 연결 재사용 및 연결 지연 지표
+        voice_sessions = getattr(voice_cog, 'voice_sessions', None)
+        if voice_sessions:
+            session = voice_sessions.metrics()
+            embed.add_field(
+                name="🎧 음성 연결",
+                value=(
+                    f"새 연결 {session['connects']} (평균 {session['avg_connect_ms']}ms · "
+                    f"최대 {session['max_connect_ms']}ms)\n"
+                    f"이동 {session['moves']} (평균 {session['avg_move_ms']}ms) · "
+                    f"재사용 {session['reuses']} · 복귀 {session['rejoins']}\n"
+                    f"퇴장 대기 {session['lingering']} · 대기 후 퇴장 {session['lingered_leaves']} · "
+                    f"실패 {session['failures']}"
+                ),
+                inline=False
+            )
+        
+        # TTS 엔진별 서킷 브레이커 상태
+        tts_breakers = getattr(voice_cog, 'tts_breakers', None)
+        if tts_breakers:
+            lines = []
+            for name, breaker in tts_breakers.items():
+                status = breaker.status()
+                if status['state'] == 'open':
+                    state = f"🔴 차단 ({status['open_seconds']}초째, 복구 확인 중)"
+                else:
+                    state = "🟢 정상"
+                lines.append(
+                    f"• {name}: {state} · 연속 실패 {status['consecutive_failures']} · "
+                    f"누적 실패 {status['total_failures']} · 차단 {status['trips']}회"
+                )
+            tts_worker = getattr(voice_cog, 'tts_worker', None)
+            if tts_worker:
+                worker = tts_worker.metrics()
+                state = f"PID {worker['pid']}" if worker['pid'] else "재시작 대기"
+                lines.append(
+                    f"• 작업 프로세스: {state} · 처리 중 {worker['pending']} · 요청 {worker['requests']} · "
+                    f"실패 {worker['failures']} · 재시작 {worker['restarts']}회"
+                )
+            embed.add_field(name="🛡️ TTS 엔진", value="\n".join(lines)[:1024], inline=False)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(
+        name="메트릭",
+        description="명령어/DB/API/TTS 처리 지표 요약 (관리자 전용)"
+    )
+    async def metrics_summary(self, interaction: discord.Interaction):
+        """수집된 메트릭 요약"""
+        if interaction.guild is None or not isinstance(interaction.user, discord.Member):
+            await interaction.response.send_message("❌ 이 명령어는 서버에서만 사용할 수 있습니다.", ephemeral=True)
+            return
+        if not await has_admin_permissions(interaction.user):
+            embed = create_error_embed(
+                "❌ 권한 없음",
+                "이 명령어는 관리자만 사용할 수 있습니다."
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        if not metrics.enabled:
+            embed = create_error_embed(
+                "❌ 메트릭 꺼짐",
+                "`METRICS_ENABLED=1`로 설정하고 봇을 다시 시작하면 지표를 수집합니다."
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        def histogram_lines(name: str, limit: int = 5) -> str:
+            lines = [
+                f"• `{label[:40]}` {h.count}회 · 평균 {h.avg * 1000:.0f}ms · "
+                f"p95 ≤{h.quantile(0.95) * 1000:.0f}ms · 최대 {h.max * 1000:.0f}ms"
+                for label, h in metrics.top(name, limit)
+            ]
+            return "\n".join(lines)[:1024] or "기록 없음"
+        
+        embed = discord.Embed(title="📈 메트릭", color=Config.COLORS['info'])
+        command_errors = metrics.counter_total("siri_commands_total", status="error")
+        embed.add_field(
+            name=f"⌨️ 명령어 (오류 {command_errors:g})", value=histogram_lines("siri_command_seconds"), inline=False
+        )
+        embed.add_field(name="🗄️ DB", value=histogram_lines("siri_db_seconds"), inline=False)
+        
+        rest_lines = histogram_lines("siri_discord_request_seconds")
+        limited = sorted(
+            metrics.counters("siri_discord_ratelimited_total").items(), key=lambda item: item[1], reverse=True
+        )
+        if limited:
+            rest_lines += "\n429: " + ", ".join(
+                f"`{dict(key).get('route', '?')[:40]}` {count:g}" for key, count in limited[:3]
+            )
+        embed.add_field(name="🌐 디스코드 API", value=rest_lines[:1024], inline=False)
+        
+        tts_lines = histogram_lines("siri_tts_synthesis_seconds", 3)
+        playback = metrics.top("siri_tts_playback_seconds", 1)
+        if playback:
+            _, h = playback[0]
+            tts_lines += f"\n• 재생 {h.count}회 · 평균 {h.avg:.1f}초 · 최대 {h.max:.1f}초"
+        embed.add_field(name="🔊 TTS 합성/재생", value=tts_lines[:1024], inline=False)
+        
+        backlog = metrics.gauge_value("siri_cleanup_backlog")
+        embed.add_field(
+            name="🧹 삭제 대기 메시지", value=f"{backlog:g}" if backlog is not None else "-", inline=True
+        )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 class DataResetConfirmView(discord.ui.View):
     """데이터 초기화 확인 뷰"""
     
-    def __init__(self, target_user: discord.Member, database):
+    def __init__(self, target_user: discord.Member, database, settings):
         super().__init__(timeout=30)  # 30초 타임아웃
         self.target_user = target_user
         self.database = database
+        self.settings = settings
     
     @discord.ui.button(label="✅ 확인", style=discord.ButtonStyle.danger)
     async def confirm_reset(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -402,15 +680,7 @@ class DataResetConfirmView(discord.ui.View):
     
     async def remove_level_roles(self, guild: discord.Guild, member: discord.Member) -> int:
         """레벨 관련 역할들을 제거"""
-        level_role_ids = [
-            1392422549174091868,  # 초보자
-            1392431487697293465,  # 입문자
-            1392431532592857182,  # 숙련자
-            1392431564574687323,  # 전문가
-            1392431591304990730,  # 마스터
-            1392431665376264192,  # 그랜드마스터
-            1392431727292448922,  # 레전드
-        ]
+        level_role_ids = self.settings.get(guild.id).level_role_ids
         
         roles_to_remove = []
         removed_count = 0
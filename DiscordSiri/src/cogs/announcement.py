@@ -6,8 +6,10 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import hashlib
 import json
 import logging
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -23,31 +25,159 @@ class AnnouncementCog(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        self.rules_file_path = Path(__file__).resolve().parent.parent / "data" / "rules.json"
+        data_dir = Path(__file__).resolve().parent.parent / "data"
+        self.rules_file_path = data_dir / "rules.json"
+        # 서버별 규칙 파일 디렉토리 (data/rules/<길드 ID>.json, 없으면 기본 rules.json 사용)
+        self.guild_rules_dir = data_dir / "rules"
+        # 규칙 캐시 (파일 경로: {'stamp': (mtime_ns, size), 'data': 규칙, 'embed': 임베드})
+        self._rules_cache: dict[Path, dict] = {}
+        # 게시된 규칙 메시지 ID (채널 ID: 메시지 ID, 삭제 이벤트마다 DB를 조회하지 않도록 메모리에 유지)
+        self._rules_messages: dict[int, int] = {}
     
-    def load_rules_from_json(self) -> dict:
-        """JSON 파일에서 규칙 데이터 로드"""
+    async def cog_load(self):
+        """게시된 규칙 메시지 위치 불러오기"""
+        for row in await self.bot.db.get_rules_messages():
+            self._rules_messages[row['channel_id']] = row['message_id']
+    
+    async def _save_rules_message(self, channel_id: int, guild_id: int, message_id: int, content_hash: str) -> None:
+        await self.bot.db.set_rules_message(channel_id, guild_id, message_id, content_hash)
+        self._rules_messages[channel_id] = message_id
+    
+    async def _forget_rules_message(self, channel_id: int) -> None:
+        self._rules_messages.pop(channel_id, None)
+        await self.bot.db.delete_rules_message(channel_id)
+    
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """규칙 메시지가 지워지면 저장된 위치도 삭제 (다음 /규칙에서 새로 게시)"""
+        if self._rules_messages.get(payload.channel_id) == payload.message_id:
+            await self._forget_rules_message(payload.channel_id)
+    
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """여러 메시지를 한 번에 지운 경우도 같은 방식으로 처리"""
+        if self._rules_messages.get(payload.channel_id) in payload.message_ids:
+            await self._forget_rules_message(payload.channel_id)
+    
+    def get_rules_path(self, guild_id: Optional[int] = None) -> Path:
+        """길드별 규칙 파일 경로 반환 (없으면 기본 규칙 파일)"""
+        if guild_id is not None:
+            guild_path = self.guild_rules_dir / f"{guild_id}.json"
+            if guild_path.exists():
+                return guild_path
+        return self.rules_file_path
+    
+    @staticmethod
+    def validate_rules(data) -> dict:
+        """
+        규칙 데이터 스키마 검증 (로드 시 1회)
+        
+        Raises:
+            ValueError: 필수 항목이 없거나 타입이 잘못된 경우
+        """
+        if not isinstance(data, dict):
+            raise ValueError("규칙 파일의 최상위 값은 객체여야 합니다")
+        
+        title = data.get("title")
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError("'title'은 비어있지 않은 문자열이어야 합니다")
+        
+        rules = data.get("rules")
+        if not isinstance(rules, list) or not all(isinstance(rule, str) for rule in rules):
+            raise ValueError("'rules'는 문자열 목록이어야 합니다")
+        
+        color = data.get("color", Config.COLORS['info'])
+        if isinstance(color, bool) or not isinstance(color, int) or not 0 <= color <= 0xFFFFFF:
+            raise ValueError("'color'는 0 ~ 16777215 범위의 정수여야 합니다")
+        
+        footer = data.get("footer", "Siri Bot")
+        if not isinstance(footer, str):
+            raise ValueError("'footer'는 문자열이어야 합니다")
+        
+        last_updated = data.get("last_updated")
+        if last_updated is not None and not isinstance(last_updated, str):
+            raise ValueError("'last_updated'는 문자열이어야 합니다")
+        
+        # 디스코드 임베드 설명 최대 길이 (4096자)
+        if len("\n\n".join(rules)) > 4096:
+            raise ValueError("규칙 내용이 임베드 최대 길이(4096자)를 초과합니다")
+        
+        validated = {
+            "title": title,
+            "color": color,
+            "rules": rules,
+            "footer": footer,
+        }
+        if last_updated is not None:
+            validated["last_updated"] = last_updated
+        return validated
+    
+    def _load_rules_entry(self, guild_id: Optional[int] = None, force: bool = False) -> dict:
+        """
+        규칙 캐시 항목 반환
+        
+        파일의 (mtime, size)가 바뀌지 않았다면 다시 읽지 않고 캐시된 규칙과 임베드를 사용합니다.
+        """
+        path = self.get_rules_path(guild_id)
+        
         try:
-            if self.rules_file_path.exists():
-                with open(self.rules_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                # 기본 규칙 데이터 (파일이 없을 경우)
-                logger.warning(f"규칙 파일 {self.rules_file_path}를 찾을 수 없음. 기본 규칙 사용")
-                return {
-                    "title": "📋 서버 규칙",
-                    "color": Config.COLORS['info'],
-                    "rules": ["규칙 파일이 없습니다. 관리자에게 문의하세요."],
-                    "footer": "Siri Bot"
-                }
-        except Exception as e:
-            logger.error(f"규칙 파일 로드 실패: {e}")
-            return {
+            stat = path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stat = None
+            stamp = None
+        
+        cached = self._rules_cache.get(path)
+        if not force and cached is not None and cached['stamp'] == stamp:
+            return cached
+        
+        timestamp = None
+        if stamp is None:
+            # 기본 규칙 데이터 (파일이 없을 경우)
+            logger.warning(f"규칙 파일 {path}를 찾을 수 없음. 기본 규칙 사용")
+            rules_data = {
                 "title": "📋 서버 규칙",
-                "color": Config.COLORS['error'],
-                "rules": ["규칙을 불러올 수 없습니다. 관리자에게 문의하세요."],
-                "footer": "Siri Bot - 오류 발생"
+                "color": Config.COLORS['info'],
+                "rules": ["규칙 파일이 없습니다. 관리자에게 문의하세요."],
+                "footer": "Siri Bot"
             }
+            error = None
+        else:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    rules_data = self.validate_rules(json.load(f))
+                timestamp = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+                error = None
+                logger.info(f"규칙 파일 로드: {path} (규칙 {len(rules_data['rules'])}개)")
+            except Exception as e:
+                logger.error(f"규칙 파일 로드 실패: {e}")
+                rules_data = {
+                    "title": "📋 서버 규칙",
+                    "color": Config.COLORS['error'],
+                    "rules": ["규칙을 불러올 수 없습니다. 관리자에게 문의하세요."],
+                    "footer": "Siri Bot - 오류 발생"
+                }
+                error = e
+        
+        # 게시된 메시지 수정 여부 판단용 내용 해시
+        content_hash = hashlib.sha256(
+            json.dumps(rules_data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        
+        entry = {
+            'stamp': stamp,
+            'path': path,
+            'data': rules_data,
+            'hash': content_hash,
+            'embed': self._build_rules_embed(rules_data, timestamp),
+            'error': error,
+        }
+        self._rules_cache[path] = entry
+        return entry
+    
+    def load_rules_from_json(self, guild_id: Optional[int] = None) -> dict:
+        """JSON 파일에서 규칙 데이터 로드 (변경되지 않았다면 캐시 사용)"""
+        return self._load_rules_entry(guild_id)['data']
     
     @app_commands.command(name="규칙", description="서버 규칙을 게시합니다 (관리자 전용)")
     @app_commands.describe(채널="규칙을 게시할 채널 (선택사항)")
@@ -78,16 +208,48 @@ class AnnouncementCog(commands.Cog):
             return
         target_channel: discord.TextChannel = target_channel_raw
         
-        # 기존 봇 메시지 삭제
-        await self.delete_bot_messages(target_channel)
-        
-        # 규칙 임베드 생성 및 전송
-        embed = self.create_rules_embed()
+        # 규칙 임베드 (파일이 바뀌지 않았다면 캐시된 임베드)
+        entry = self._load_rules_entry(interaction.guild.id)
+        embed = entry['embed']
         
         try:
+            # 이미 게시된 규칙 메시지가 있으면 수정 (링크 유지)
+            stored = await self.bot.db.get_rules_message(target_channel.id)
+            if stored is not None:
+                # 메시지가 지워졌다면 삭제 이벤트에서 이미 위치를 지웠으므로 저장된 ID를 그대로 신뢰
+                if stored['content_hash'] == entry['hash']:
+                    info_embed = create_success_embed(
+                        "✅ 규칙이 이미 최신입니다",
+                        f"{target_channel.mention} 채널의 규칙이 변경되지 않아 수정하지 않았습니다."
+                    )
+                    await interaction.followup.send(embed=info_embed, ephemeral=True)
+                    return
+                
+                try:
+                    await target_channel.get_partial_message(stored['message_id']).edit(embed=embed)
+                    await self._save_rules_message(
+                        target_channel.id, interaction.guild.id, stored['message_id'], entry['hash']
+                    )
+                    success_embed = create_success_embed(
+                        "✅ 규칙 수정 완료",
+                        f"{target_channel.mention} 채널의 기존 규칙 메시지를 수정했습니다."
+                    )
+                    await interaction.followup.send(embed=success_embed, ephemeral=True)
+                    return
+                except discord.NotFound:
+                    # 저장된 메시지가 삭제된 경우에만 기존 방식으로 대체
+                    logger.info(f"{target_channel.name} 채널의 저장된 규칙 메시지가 없어 새로 게시합니다")
+                    await self._forget_rules_message(target_channel.id)
+            
+            # 기존 봇 메시지 삭제
+            await self.delete_bot_messages(target_channel)
+            
             posted_message = await target_channel.send(embed=embed)
             if hasattr(self.bot, "cleanup_manager"):
                 self.bot.cleanup_manager.mark_persistent(posted_message)
+            await self._save_rules_message(
+                target_channel.id, interaction.guild.id, posted_message.id, entry['hash']
+            )
             
             success_embed = create_success_embed(
                 "✅ 규칙 게시 완료",
@@ -110,10 +272,9 @@ class AnnouncementCog(commands.Cog):
             )
             await interaction.followup.send(embed=error_embed, ephemeral=True)
     
-    def create_rules_embed(self) -> discord.Embed:
-        """규칙 임베드 생성 (JSON에서 동적 로드)"""
-        rules_data = self.load_rules_from_json()
-        
+    @staticmethod
+    def _build_rules_embed(rules_data: dict, timestamp: Optional[datetime] = None) -> discord.Embed:
+        """규칙 데이터로 임베드 생성 (로드 시 1회)"""
         embed = discord.Embed(
             title=rules_data["title"],
             color=rules_data["color"]
@@ -129,10 +290,15 @@ class AnnouncementCog(commands.Cog):
             footer_text += f" | 최종 업데이트: {rules_data['last_updated']}"
         
         embed.set_footer(text=footer_text)
-        embed.timestamp = discord.utils.utcnow()
+        # 규칙 파일 수정 시각 (파일이 없으면 생성 시각)
+        embed.timestamp = timestamp or discord.utils.utcnow()
         
         return embed
     
+    def create_rules_embed(self, guild_id: Optional[int] = None) -> discord.Embed:
+        """규칙 임베드 반환 (파일이 바뀌었을 때만 다시 생성)"""
+        return self._load_rules_entry(guild_id)['embed']
+    
     @app_commands.command(name="규칙수정", description="규칙을 JSON 파일에서 다시 로드합니다 (관리자 전용)")
     async def reload_rules(self, interaction: discord.Interaction):
         """규칙 JSON 파일 새로고침"""
@@ -148,13 +314,17 @@ class AnnouncementCog(commands.Cog):
             return
         
         try:
-            rules_data = self.load_rules_from_json()
+            # 캐시를 무시하고 파일을 다시 읽음
+            entry = self._load_rules_entry(interaction.guild.id, force=True)
+            if entry['error'] is not None:
+                raise entry['error']
+            rules_data = entry['data']
             
             embed = create_success_embed(
                 "✅ 규칙 파일 새로고침 완료",
                 f"**{rules_data['title']}**\n"
                 f"규칙 {len(rules_data['rules'])}개가 로드되었습니다.\n"
-                f"파일 위치: `{self.rules_file_path}`"
+                f"파일 위치: `{entry['path']}`"
             )
             
             if "last_updated" in rules_data:
@@ -173,7 +343,7 @@ class AnnouncementCog(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=True)
     
     async def delete_bot_messages(self, channel: discord.TextChannel, limit: int = 50):
-        """해당 채널에서 봇이 보낸 임베드 메시지 삭제"""
+        """해당 채널에서 봇이 보낸 임베드 메시지 삭제 (저장된 규칙 메시지가 없을 때만 사용)"""
         try:
             async for message in channel.history(limit=limit):
                 if (message.author == self.bot.user and 
@@ -57,6 +57,8 @@ class AttendanceCog(commands.Cog):
         user_id = member.id
         guild = member.guild
         guild_id = guild.id
+        settings = self.bot.settings.get(guild_id)
+        xp_gain = settings.get_xp_per_attendance()
 
         user_data = await self.bot.db.get_user_data(user_id, guild_id)
         if not user_data:
@@ -64,7 +66,7 @@ class AttendanceCog(commands.Cog):
             user_data = await self.bot.db.get_user_data(user_id, guild_id)
 
         success, _, _ = await self.bot.db.update_attendance(
-            user_id, guild_id, Config.XP_PER_ATTENDANCE
+            user_id, guild_id, xp_gain
         )
 
         if not success:
@@ -81,7 +83,7 @@ class AttendanceCog(commands.Cog):
         updated_user_data = await self.bot.db.get_user_data(user_id, guild_id)
         current_xp = updated_user_data['xp']
 
-        actual_old_level = Config.calculate_level_from_xp(current_xp - Config.XP_PER_ATTENDANCE)
+        actual_old_level = Config.calculate_level_from_xp(current_xp - xp_gain)
         actual_new_level = Config.calculate_level_from_xp(current_xp)
         current_level = actual_new_level
 
@@ -126,7 +128,7 @@ class AttendanceCog(commands.Cog):
 
             role_assigned = await self.assign_level_role(member, actual_new_level)
             if role_assigned:
-                role_id = Config.get_role_for_level(actual_new_level)
+                role_id = settings.get_role_for_level(actual_new_level)
                 if role_id is not None:
                     role = get_role_by_id(guild, role_id)
                     if role:
@@ -279,15 +281,7 @@ class AttendanceCog(commands.Cog):
     
     def get_user_level_roles(self, member: discord.Member) -> list:
         """사용자가 가진 레벨 관련 역할들 반환"""
-        level_role_ids = [
-            1392422549174091868,  # 초보자
-            1392431487697293465,  # 입문자
-            1392431532592857182,  # 숙련자
-            1392431564574687323,  # 전문가
-            1392431591304990730,  # 마스터
-            1392431665376264192,  # 그랜드마스터
-            1392431727292448922,  # 레전드
-        ]
+        level_role_ids = self.bot.settings.get(member.guild.id).level_role_ids
         
         user_level_roles = []
         for role in member.roles:
@@ -299,8 +293,9 @@ class AttendanceCog(commands.Cog):
     async def assign_level_role(self, member: discord.Member, level: int) -> bool:
         """레벨에 따른 역할 자동 부여"""
         try:
-            # 현재 레벨에 맞는 역할 ID 가져오기
-            target_role_id = Config.get_role_for_level(level)
+            # 현재 레벨에 맞는 역할 ID 가져오기 (길드 설정)
+            settings = self.bot.settings.get(member.guild.id)
+            target_role_id = settings.get_role_for_level(level)
             if not target_role_id:
                 return False
             
@@ -318,9 +313,8 @@ class AttendanceCog(commands.Cog):
             # 기존 레벨 역할 제거
             roles_to_remove = []
             for role in member.roles:
-                for role_level_range, role_id in Config.ROLE_LEVELS.items():
-                    if role.id == role_id and role.id != target_role_id:
-                        roles_to_remove.append(role)
+                if role.id in settings.level_role_ids and role.id != target_role_id:
+                    roles_to_remove.append(role)
             
             if roles_to_remove:
                 await member.remove_roles(*roles_to_remove, reason="레벨업으로 인한 역할 변경")
@@ -6,82 +6,485 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
+import heapq
 import logging
+import time
+from typing import Optional
 
 from utils.config import Config
-from utils.helpers import create_embed, format_number
+from utils.helpers import (
+    create_embed,
+    create_success_embed,
+    create_error_embed,
+    format_number,
+    has_admin_permissions
+)
 
 logger = logging.getLogger(__name__)
 
 class LeaderboardCog(commands.Cog):
     """리더보드 시스템"""
-    
+
     def __init__(self, bot):
         self.bot = bot
-    
-    @app_commands.command(name="리더보드", description="서버 레벨 순위를 확인합니다")
-    async def leaderboard(self, interaction: discord.Interaction):
-        """리더보드 표시"""
-        await interaction.response.defer()
-        
-        # 리더보드 데이터 조회
-        leaderboard_data = await self.bot.db.get_leaderboard(interaction.guild.id, 10)
-        
-        if not leaderboard_data:
-            embed = create_embed(
+        # 길드별 렌더링된 리더보드 캐시
+        # (길드 ID: {'embed': 임베드, 'user_ids': 상위 N명 ID, 'floor': N번째 (레벨, XP) 또는 None})
+        self._cache: dict[int, dict] = {}
+        # 길드별 쓰기 버전 (조회 도중 발생한 변경 감지용)
+        self._versions: dict[int, int] = {}
+        # 길드별 자동 갱신 리더보드 메시지
+        # (길드 ID: {'channel_id', 'message_id', 'signature', 'last_edit', 'dirty'})
+        self._live: dict[int, dict] = {}
+        self._live_tasks: dict[int, asyncio.Task] = {}
+        self._restore_task: Optional[asyncio.Task] = None
+        # 전체 서버 통합 리더보드 캐시 (길드 캐시가 무효화되면 함께 무효화)
+        self._global_embed: Optional[discord.Embed] = None
+        self._global_version = 0
+
+        # 순위별 이모지
+        self.rank_emojis = {
+            1: "🥇",
+            2: "🥈",
+            3: "🥉"
+        }
+
+    async def cog_load(self):
+        """DB XP 변경 리스너 등록 및 자동 갱신 리더보드 복구"""
+        self.bot.db.add_xp_listener(self._on_xp_change)
+
+        for row in await self.bot.db.get_live_leaderboards():
+            self._live[row['guild_id']] = {
+                'channel_id': row['channel_id'],
+                'message_id': row['message_id'],
+                'signature': None,  # 재시작 후 첫 갱신은 항상 수정
+                'last_edit': 0.0,
+                'dirty': False,
+            }
+        if self._live:
+            self._restore_task = asyncio.create_task(self._restore_live_messages())
+
+    async def cog_unload(self):
+        """DB XP 변경 리스너 해제 및 갱신 작업 취소"""
+        if self.bot.db:
+            self.bot.db.remove_xp_listener(self._on_xp_change)
+
+        if self._restore_task and not self._restore_task.done():
+            self._restore_task.cancel()
+        for task in list(self._live_tasks.values()):
+            task.cancel()
+        self._live_tasks.clear()
+
+    def _on_xp_change(self, guild_id: int, user_id: int, level: int, xp: int):
+        """
+        XP 변경 시 캐시 무효화 여부 판단
+
+        캐시된 상위 N명에 속한 유저이거나, N번째 점수 이상으로 올라온 경우에만 무효화합니다.
+        """
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+
+        entry = self._cache.get(guild_id)
+        if entry is None:
+            # 캐시되지 않은 길드의 변경은 전체 리더보드에 영향을 줄 수 있음
+            self._invalidate_global()
+            # 고정 리더보드가 캐시를 다시 만드는 중이었다면 (버전이 바뀌어 캐시되지 않음) 다시 갱신해야 함
+            self._schedule_live_update(guild_id)
+            return
+
+        floor = entry['floor']
+        if floor is None or user_id in entry['user_ids'] or (level, xp) >= floor:
+            del self._cache[guild_id]
+            self._invalidate_global()
+            self._schedule_live_update(guild_id)
+
+    def _invalidate_global(self):
+        """전체 리더보드 캐시 무효화"""
+        self._global_version += 1
+        self._global_embed = None
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        """참여한 서버를 전체 리더보드에 반영"""
+        self._invalidate_global()
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """떠난 서버를 전체 리더보드에서 제외"""
+        self._cache.pop(guild.id, None)
+        self._invalidate_global()
+
+    async def _resolve_username(self, guild: discord.Guild, user_id: int) -> str:
+        """서버 닉네임 우선으로 유저 이름 조회"""
+        try:
+            member = guild.get_member(user_id)
+            if member:
+                return member.display_name  # 서버 닉네임 우선
+            # 서버에 없는 경우 일반 유저 정보로 fallback
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            return user.display_name
+        except Exception:
+            return f"User {user_id}"
+
+    async def _build_entry(self, guild_id: int) -> dict:
+        """DB에서 상위 N명을 조회하여 캐시 항목 생성 (임베드는 필요할 때 렌더링)"""
+        limit = Config.LEADERBOARD_SIZE
+        leaderboard_data = await self.bot.db.get_leaderboard(guild_id, limit)
+
+        # 인원이 다 차지 않았다면 누구든 진입할 수 있으므로 floor 없음
+        floor = None
+        if len(leaderboard_data) >= limit:
+            last = leaderboard_data[-1]
+            floor = (last['level'], last['xp'])
+
+        return {
+            'embed': None,
+            'user_ids': frozenset(row['user_id'] for row in leaderboard_data),
+            'floor': floor,
+            # 정렬된 (유저 ID, 레벨, XP) 목록 - 순위 변화 비교 및 전체 리더보드 병합용
+            'signature': tuple(
+                (row['user_id'], row['level'], row['xp']) for row in leaderboard_data
+            ),
+        }
+
+    async def _render_embed(self, guild: discord.Guild, rows: tuple) -> discord.Embed:
+        """상위 N명 목록으로 리더보드 임베드 렌더링"""
+        if not rows:
+            return create_embed(
                 "📊 리더보드",
                 "아직 레벨 데이터가 없습니다.\n`/ㅊㅊ` 명령어로 출석 체크를 시작해보세요!",
                 Config.COLORS['warning']
             )
-            await interaction.followup.send(embed=embed)
-            return
-        
+
         # 임베드 생성
         embed = discord.Embed(
             title="🏆 서버 레벨 리더보드",
-            description="상위 10명의 레벨 순위",
             color=Config.COLORS['info']
         )
-        
-        # 순위별 이모지
-        rank_emojis = {
-            1: "🥇",
-            2: "🥈", 
-            3: "🥉"
-        }
-        
-        leaderboard_text = ""
-        
-        for rank, user_data in enumerate(leaderboard_data, 1):
-            user_id = user_data['user_id']
-            xp = user_data['xp']
-            
+
+        lines = []
+        for rank, (user_id, _, xp) in enumerate(rows, 1):
             # XP를 기반으로 레벨 계산
             level = Config.calculate_level_from_xp(xp)
-            
-            # 서버 멤버 정보 가져오기 (서버 닉네임 사용)
-            try:
-                member = interaction.guild.get_member(user_id)
-                if member:
-                    username = member.display_name  # 서버 닉네임 우선
-                else:
-                    # 서버에 없는 경우 일반 유저 정보로 fallback
-                    user = await self.bot.fetch_user(user_id)
-                    username = user.display_name
-            except Exception:
-                username = f"User {user_id}"
-            
+            username = await self._resolve_username(guild, user_id)
+
             # 순위 이모지
-            rank_emoji = rank_emojis.get(rank, f"{rank}️⃣")
-            
-            leaderboard_text += f"{rank_emoji} **{username}**\n"
-            leaderboard_text += f"     Level {level} | {format_number(xp)} XP\n\n"
-        
-        embed.description = leaderboard_text
+            rank_emoji = self.rank_emojis.get(rank, f"{rank}️⃣")
+
+            lines.append(f"{rank_emoji} **{username}**")
+            lines.append(f"     Level {level} | {format_number(xp)} XP\n")
+
+        embed.description = "\n".join(lines)
         embed.set_footer(text="Siri Bot • 매일 출석체크로 레벨업!")
-        
+        return embed
+
+    async def _get_entry(self, guild_id: int) -> dict:
+        """캐시된 리더보드 항목 반환 (없으면 새로 조회)"""
+        entry = self._cache.get(guild_id)
+        if entry is not None:
+            return entry
+
+        version = self._versions.get(guild_id, 0)
+        entry = await self._build_entry(guild_id)
+
+        # 조회 중 쓰기가 있었다면 캐시에 저장하지 않음
+        if self._versions.get(guild_id, 0) == version:
+            self._cache[guild_id] = entry
+        return entry
+
+    async def get_leaderboard_embed(self, guild: discord.Guild) -> discord.Embed:
+        """캐시된 리더보드 임베드 반환 (없으면 렌더링 후 캐시)"""
+        entry = await self._get_entry(guild.id)
+        if entry['embed'] is None:
+            entry['embed'] = await self._render_embed(guild, entry['signature'])
+        return entry['embed']
+
+    async def _merge_global_rows(self) -> list:
+        """
+        길드별 상위 N명 목록을 k-way 병합하여 전체 상위 N명 계산
+
+        각 길드 목록은 이미 (레벨, XP) 내림차순이므로 heapq.merge로 앞에서부터 꺼내며,
+        여러 서버에 있는 유저는 가장 높은 기록 하나만 남깁니다.
+        길드별 상위 N명만으로도 중복 제거 후 전체 상위 N명을 정확히 구할 수 있습니다.
+        """
+        limit = Config.LEADERBOARD_SIZE
+        guild_ids = [guild.id for guild in self.bot.guilds]
+        # 캐시가 비었을 때 길드 수만큼 DB 연결이 한꺼번에 열리지 않도록 동시 조회 수 제한
+        semaphore = asyncio.Semaphore(Config.GLOBAL_LEADERBOARD_CONCURRENCY)
+
+        async def get_entry(guild_id: int) -> dict:
+            async with semaphore:
+                return await self._get_entry(guild_id)
+
+        entries = await asyncio.gather(*(get_entry(guild_id) for guild_id in guild_ids))
+
+        per_guild = [
+            [(level, xp, user_id, guild_id) for user_id, level, xp in entry['signature']]
+            for guild_id, entry in zip(guild_ids, entries)
+        ]
+
+        merged = []
+        seen_users = set()
+        for level, xp, user_id, guild_id in heapq.merge(
+            *per_guild, key=lambda row: (row[0], row[1]), reverse=True
+        ):
+            if user_id in seen_users:
+                continue
+            seen_users.add(user_id)
+            merged.append((user_id, guild_id, level, xp))
+            if len(merged) >= limit:
+                break
+        return merged
+
+    async def get_global_leaderboard_embed(self) -> discord.Embed:
+        """전체 서버 통합 리더보드 임베드 반환 (길드 캐시 무효화 시 함께 무효화)"""
+        if self._global_embed is not None:
+            return self._global_embed
+
+        version = self._global_version
+        rows = await self._merge_global_rows()
+
+        if not rows:
+            embed = create_embed(
+                "🌐 전체 리더보드",
+                "아직 레벨 데이터가 없습니다.",
+                Config.COLORS['warning']
+            )
+        else:
+            embed = discord.Embed(
+                title="🌐 전체 서버 통합 리더보드",
+                color=Config.COLORS['info']
+            )
+
+            lines = []
+            for rank, (user_id, guild_id, _, xp) in enumerate(rows, 1):
+                level = Config.calculate_level_from_xp(xp)
+                guild = self.bot.get_guild(guild_id)
+                if guild is not None:
+                    username = await self._resolve_username(guild, user_id)
+                    guild_name = guild.name
+                else:
+                    username = f"User {user_id}"
+                    guild_name = str(guild_id)
+
+                rank_emoji = self.rank_emojis.get(rank, f"{rank}️⃣")
+
+                lines.append(f"{rank_emoji} **{username}** · {guild_name}")
+                lines.append(f"     Level {level} | {format_number(xp)} XP\n")
+
+            embed.description = "\n".join(lines)
+            embed.set_footer(text=f"Siri Bot • {len(self.bot.guilds)}개 서버 통합 순위")
+
+        if self._global_version == version:
+            self._global_embed = embed
+        return embed
+
+    def _schedule_live_update(self, guild_id: int):
+        """자동 갱신 리더보드 수정 예약 (최소 간격 디바운스)"""
+        live = self._live.get(guild_id)
+        if live is None:
+            return
+
+        task = self._live_tasks.get(guild_id)
+        if task and not task.done():
+            # 진행 중인 갱신이 끝난 뒤 다시 확인
+            live['dirty'] = True
+            return
+
+        delay = max(0.0, live['last_edit'] + Config.LIVE_LEADERBOARD_INTERVAL - time.monotonic())
+        self._live_tasks[guild_id] = asyncio.create_task(
+            self._update_live_message(guild_id, delay),
+            name=f"siri-live-leaderboard-{guild_id}"
+        )
+
+    async def _update_live_message(self, guild_id: int, delay: float):
+        """상위 N명이 바뀐 경우에만 고정 리더보드 메시지를 수정"""
+        cancelled = False
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            live = self._live.get(guild_id)
+            guild = self.bot.get_guild(guild_id)
+            if live is None or guild is None:
+                return
+            live['dirty'] = False
+
+            channel = self.bot.get_channel(live['channel_id'])
+            if not isinstance(channel, discord.TextChannel):
+                return
+
+            entry = await self._get_entry(guild_id)
+            if entry['signature'] == live['signature']:
+                return
+
+            embed = await self.get_leaderboard_embed(guild)
+            await channel.get_partial_message(live['message_id']).edit(embed=embed)
+            live['signature'] = entry['signature']
+            live['last_edit'] = time.monotonic()
+
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except discord.NotFound:
+            logger.warning(f"길드 {guild_id}: 자동 갱신 리더보드 메시지가 삭제되어 고정을 해제합니다")
+            self._live.pop(guild_id, None)
+            await self.bot.db.delete_live_leaderboard(guild_id)
+        except discord.Forbidden:
+            logger.warning(f"길드 {guild_id}: 자동 갱신 리더보드 메시지를 수정할 권한 없음")
+        except Exception as e:
+            logger.error(f"자동 갱신 리더보드 수정 중 오류: {e}")
+        finally:
+            if self._live_tasks.get(guild_id) is asyncio.current_task():
+                del self._live_tasks[guild_id]
+            live = self._live.get(guild_id)
+            if not cancelled and live is not None and live['dirty']:
+                self._schedule_live_update(guild_id)
+
+    async def _restore_live_messages(self):
+        """재시작 후 저장된 리더보드 메시지를 정리 대상에서 제외하고 최신 상태로 갱신"""
+        await self.bot.wait_until_ready()
+
+        for guild_id, live in list(self._live.items()):
+            channel = self.bot.get_channel(live['channel_id'])
+            if isinstance(channel, discord.TextChannel) and hasattr(self.bot, "cleanup_manager"):
+                self.bot.cleanup_manager.mark_persistent(
+                    channel.get_partial_message(live['message_id'])
+                )
+            self._schedule_live_update(guild_id)
+
+    @app_commands.command(name="리더보드", description="서버 레벨 순위를 확인합니다")
+    async def leaderboard(self, interaction: discord.Interaction):
+        """리더보드 표시"""
+        if interaction.guild is None:
+            await interaction.response.send_message("❌ 이 명령어는 서버에서만 사용할 수 있습니다.", ephemeral=True)
+            return
+
+        # 캐시 적중 시 defer 없이 바로 응답
+        entry = self._cache.get(interaction.guild.id)
+        if entry is not None and entry['embed'] is not None:
+            await interaction.response.send_message(embed=entry['embed'])
+            return
+
+        await interaction.response.defer()
+        embed = await self.get_leaderboard_embed(interaction.guild)
+        await interaction.followup.send(embed=embed)
+
+    @app_commands.command(name="전체리더보드", description="봇이 참여한 모든 서버의 통합 레벨 순위를 확인합니다")
+    async def global_leaderboard(self, interaction: discord.Interaction):
+        """전체 서버 통합 리더보드 표시"""
+        if self._global_embed is not None:
+            await interaction.response.send_message(embed=self._global_embed)
+            return
+
+        await interaction.response.defer()
+        embed = await self.get_global_leaderboard_embed()
         await interaction.followup.send(embed=embed)
 
+    @app_commands.command(name="리더보드고정", description="자동으로 갱신되는 리더보드 메시지를 게시합니다 (관리자 전용)")
+    @app_commands.describe(채널="리더보드를 게시할 채널 (선택사항)")
+    async def pin_leaderboard(
+        self,
+        interaction: discord.Interaction,
+        채널: Optional[discord.TextChannel] = None
+    ):
+        """자동 갱신 리더보드 게시"""
+        if interaction.guild is None or not isinstance(interaction.user, discord.Member):
+            await interaction.response.send_message("❌ 이 명령어는 서버에서만 사용할 수 있습니다.", ephemeral=True)
+            return
+        if not await has_admin_permissions(interaction.user):
+            embed = create_error_embed(
+                "❌ 권한 없음",
+                "이 명령어는 관리자만 사용할 수 있습니다."
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        target_channel = 채널 or interaction.channel
+        if not isinstance(target_channel, discord.TextChannel):
+            await interaction.response.send_message("❌ 텍스트 채널에서만 리더보드를 게시할 수 있습니다.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        guild_id = interaction.guild.id
+
+        try:
+            entry = await self._get_entry(guild_id)
+            embed = await self.get_leaderboard_embed(interaction.guild)
+            posted_message = await target_channel.send(embed=embed)
+            if hasattr(self.bot, "cleanup_manager"):
+                self.bot.cleanup_manager.mark_persistent(posted_message)
+        except discord.Forbidden:
+            error_embed = create_error_embed(
+                "❌ 권한 부족",
+                f"{target_channel.mention} 채널에 메시지를 보낼 권한이 없습니다."
+            )
+            await interaction.followup.send(embed=error_embed, ephemeral=True)
+            return
+
+        # 이전 고정 메시지 정리
+        previous = self._live.get(guild_id)
+        task = self._live_tasks.pop(guild_id, None)
+        if task:
+            task.cancel()
+        if previous:
+            old_channel = self.bot.get_channel(previous['channel_id'])
+            if isinstance(old_channel, discord.TextChannel):
+                try:
+                    await old_channel.get_partial_message(previous['message_id']).delete()
+                except discord.HTTPException:
+                    pass
+
+        self._live[guild_id] = {
+            'channel_id': target_channel.id,
+            'message_id': posted_message.id,
+            'signature': entry['signature'],
+            'last_edit': time.monotonic(),
+            'dirty': False,
+        }
+        await self.bot.db.set_live_leaderboard(guild_id, target_channel.id, posted_message.id)
+
+        success_embed = create_success_embed(
+            "✅ 리더보드 고정 완료",
+            f"{target_channel.mention} 채널의 리더보드가 순위 변동 시 자동으로 갱신됩니다.\n"
+            f"(최소 {Config.LIVE_LEADERBOARD_INTERVAL}초 간격)"
+        )
+        await interaction.followup.send(embed=success_embed, ephemeral=True)
+        logger.info(f"길드 {guild_id}: 자동 갱신 리더보드 게시 ({target_channel.name})")
+
+    @app_commands.command(name="리더보드고정해제", description="자동 갱신 리더보드를 해제합니다 (관리자 전용)")
+    async def unpin_leaderboard(self, interaction: discord.Interaction):
+        """자동 갱신 리더보드 해제 (메시지는 그대로 남김)"""
+        if interaction.guild is None or not isinstance(interaction.user, discord.Member):
+            await interaction.response.send_message("❌ 이 명령어는 서버에서만 사용할 수 있습니다.", ephemeral=True)
+            return
+        if not await has_admin_permissions(interaction.user):
+            embed = create_error_embed(
+                "❌ 권한 없음",
+                "이 명령어는 관리자만 사용할 수 있습니다."
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        guild_id = interaction.guild.id
+        if self._live.pop(guild_id, None) is None:
+            embed = create_error_embed(
+                "❌ 고정된 리더보드 없음",
+                "이 서버에는 자동 갱신 리더보드가 없습니다."
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        task = self._live_tasks.pop(guild_id, None)
+        if task:
+            task.cancel()
+        await self.bot.db.delete_live_leaderboard(guild_id)
+
+        embed = create_success_embed(
+            "✅ 리더보드 고정 해제",
+            "더 이상 리더보드 메시지를 자동으로 갱신하지 않습니다."
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 async def setup(bot):
     """Cog 로드"""
     await bot.add_cog(LeaderboardCog(bot))
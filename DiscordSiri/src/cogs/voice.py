@@ -12,29 +12,83 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
-from gtts import gTTS
 import asyncio
-import os
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 import re
-import warnings
+import time
+from typing import Optional, cast
 
 from utils.config import Config
+from utils.circuit_breaker import CircuitBreaker
 from utils.helpers import has_admin_permissions
+from utils.metrics import metrics
+from utils.tts_audio import TTSAudio, transcode_to_opus
+from utils.tts_cache import TTSCache
+from utils.tts_engines import TTSEngine, create_tts_engines
+from utils.tts_queue import GuildTTSQueue
+from utils.tts_spam import TTSSpamGuard
+from utils.tts_worker import TTSWorkerClient, TTSWorkerUnavailable
+from utils.voice_session import VoiceSessionManager
 
 logger = logging.getLogger(__name__)
+# 메시지마다 찍히는 합성 로그 (로그 샘플링 대상)
+tts_logger = logging.getLogger(f"{__name__}.tts")
+
+# TTS 전처리용 정규식 (모듈 로드 시 한 번만 컴파일)
+CUSTOM_EMOJI_PATTERN = re.compile(r'<a?:\w+:\d+>')
+URL_PATTERN = re.compile(r'https?://\S+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
 
 class VoiceCog(commands.Cog):
     """Google TTS 음성 기능"""
     
+    # 자주 쓰는 고정 문구 (시작 시 미리 합성)
+    FIXED_PHRASES = ("안녕하세요!", "안녕히 계세요!", "다시 올게요", "잠시 후 돌아올게요")
+    
     def __init__(self, bot):
         self.bot = bot
-        # 서버별 자동 참여 설정 저장 (길드 ID: bool)
-        self.auto_join_settings = {}
-        # 임시 파일 저장 경로
+        # TTS 캐시 저장 경로
         self.temp_dir = Path(tempfile.gettempdir()) / "siri_tts"
         self.temp_dir.mkdir(exist_ok=True)
+        # TTS 오디오 캐시 (temp_dir 내 콘텐츠 주소 기반 파일)
+        self.tts_cache = TTSCache(self.temp_dir, Config.TTS_CACHE_MAX_BYTES)
+        # TTS 엔진 (이름: 엔진), 길드별 선택 엔진은 길드 설정(bot.settings)에 저장
+        self.tts_engines = create_tts_engines()
+        # 엔진별 서킷 브레이커 (연속 실패 시 차단) 및 복구 확인 작업
+        self.tts_breakers = {
+            name: CircuitBreaker(f"tts:{name}", Config.TTS_BREAKER_THRESHOLD)
+            for name in self.tts_engines
+        }
+        self._tts_probe_tasks: dict[str, asyncio.Task] = {}
+        self._tts_engine_available: dict[str, bool] = {}
+        # TTS 합성 전용 스레드 풀 (기본 풀을 쓰는 DB 백업 등과 분리)
+        self.tts_executor = ThreadPoolExecutor(
+            max_workers=Config.TTS_EXECUTOR_WORKERS, thread_name_prefix="siri-tts"
+        )
+        # 캐시 저장/Opus 변환 전용 스레드 (합성 스레드가 응답 없는 서버에 묶여도 캐시 쓰기는 계속)
+        self.tts_cache_executor = ThreadPoolExecutor(
+            max_workers=Config.TTS_CACHE_WORKERS, thread_name_prefix="siri-tts-cache"
+        )
+        # 별도 프로세스에서 합성/Opus 인코딩 (TTS_WORKER=1일 때만, 게이트웨이와 GIL 분리)
+        self.tts_worker: Optional[TTSWorkerClient] = None
+        if Config.get_tts_worker():
+            self.tts_worker = TTSWorkerClient(Config.TTS_WORKER_MAX_PENDING, Config.TTS_WORKER_RESTART_MAX_DELAY)
+        # 합성 중인 캐시 키 (같은 문장 중복 합성 방지)
+        self._tts_inflight: dict[str, asyncio.Future] = {}
+        self._prewarm_task: asyncio.Task | None = None
+        # 길드별 TTS 재생 큐 (길드 ID: GuildTTSQueue)
+        self.tts_queues: dict[int, GuildTTSQueue] = {}
+        # 음성 채널별 사람(봇 제외) 수 (채널 ID: 인원), 음성 상태 변경 시 증감으로 갱신
+        self._channel_humans: dict[int, int] = {}
+        # 길드별 음성 연결 재사용 및 빈 채널 퇴장 대기
+        self.voice_sessions = VoiceSessionManager(Config.VOICE_LINGER_SECONDS, Config.VOICE_CONNECT_TIMEOUT)
+        # 채팅 도배 방지 (중복 문장, 사용자별 글자 수 한도)
+        self.tts_spam_guard = TTSSpamGuard(Config.TTS_DEDUP_WINDOW, Config.TTS_USER_CHARS_PER_MINUTE)
+        # 전체 길드 공통 TTS 합성 동시 실행 제한 (미리 합성 포함)
+        self._synthesis_semaphore = asyncio.Semaphore(Config.TTS_SYNTH_CONCURRENCY)
         # gTTS 관련 세션 정리를 위한 플래그
         self._cleanup_done = False
         
@@ -90,6 +144,31 @@ class VoiceCog(commands.Cog):
             'ㅠ': '흑흑흑',
             'ㅜ': '흑흑흑',
         }
+        
+        # 이모티콘과 반복 문자를 한 번에 찾는 정규식
+        # (긴 이모티콘부터 시도해야 '☹️'가 다른 항목보다 먼저 매칭됨)
+        emoji_alternation = '|'.join(
+            re.escape(emoji) for emoji in sorted(self.emoji_mapping, key=len, reverse=True)
+        )
+        repeat_chars = ''.join(re.escape(char) for char in self.repeat_char_mapping)
+        self._tts_token_pattern = re.compile(
+            f'(?P<emoji>{emoji_alternation})|(?P<repeat>([{repeat_chars}])\\3+)'
+        )
+    
+    def _replace_tts_token(self, match: re.Match) -> str:
+        """이모티콘은 한글 단어로, 반복 문자는 반복 횟수에 맞는 소리로 변환"""
+        emoji = match.group('emoji')
+        if emoji is not None:
+            return f' {self.emoji_mapping[emoji]} '
+        
+        run = match.group('repeat')
+        replacement = self.repeat_char_mapping[run[0]]
+        # 반복 횟수에 따라 다르게 처리
+        if len(run) <= 3:
+            return replacement
+        if len(run) <= 6:
+            return replacement + ' ' + replacement
+        return replacement + ' ' + replacement + ' ' + replacement
     
     def process_message_for_tts(self, text: str) -> str:
         """
@@ -107,145 +186,293 @@ class VoiceCog(commands.Cog):
             처리된 텍스트
         """
         # 디스코드 커스텀 이모티콘 제거 (<:이름:ID> 또는 <a:이름:ID> 형식)
-        text = re.sub(r'<a?:\w+:\d+>', '', text)
+        text = CUSTOM_EMOJI_PATTERN.sub('', text)
         
         # URL 제거 (http:// 또는 https://)
-        text = re.sub(r'https?://\S+', '링크', text)
-        
-        # 유니코드 이모티콘을 한글로 변환
-        for emoji, korean in self.emoji_mapping.items():
-            text = text.replace(emoji, f' {korean} ')
-        
-        # 반복되는 자음/모음 패턴 처리 (ㅋㅋㅋ, ㅎㅎㅎ 등)
-        for char, replacement in self.repeat_char_mapping.items():
-            # 2개 이상 반복되는 패턴을 찾아서 변환
-            pattern = f'{char}{{2,}}'
-            if re.search(pattern, text):
-                # 반복 횟수에 따라 다르게 처리
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    repeat_count = len(match.group())
-                    if repeat_count <= 3:
-                        tts_text = replacement
-                    elif repeat_count <= 6:
-                        tts_text = replacement + ' ' + replacement
-                    else:
-                        tts_text = replacement + ' ' + replacement + ' ' + replacement
-                    text = text.replace(match.group(), tts_text, 1)
+        text = URL_PATTERN.sub('링크', text)
+        
+        # 유니코드 이모티콘 변환 및 반복 자음/모음 처리 (ㅋㅋㅋ, ㅎㅎㅎ 등)를 한 번에 수행
+        text = self._tts_token_pattern.sub(self._replace_tts_token, text)
         
         # 여러 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         # 앞뒤 공백 제거
         text = text.strip()
         
         return text
     
-    async def generate_tts(self, text: str) -> str:
+    def is_cacheable_tts(self, text: str) -> bool:
+        """디스크 캐시에 보관할 문장인지 확인 (고정 문구 및 짧은 문장)"""
+        return (
+            text in self.FIXED_PHRASES
+            or len(TTSCache.normalize_text(text)) <= Config.TTS_CACHE_MAX_TEXT_LENGTH
+        )
+    
+    def get_guild_tts_engine(self, guild_id: Optional[int]) -> str:
+        """길드에서 사용할 TTS 엔진 이름 (설정이 없으면 기본 엔진)"""
+        settings = getattr(self.bot, 'settings', None)
+        if guild_id is not None and settings is not None:
+            engine_name = settings.get(guild_id).tts_engine
+            if engine_name:
+                return engine_name
+        return Config.get_tts_engine()
+    
+    def is_tts_engine_available(self, engine: TTSEngine) -> bool:
+        """엔진 설치 여부 (처음 한 번만 확인)"""
+        available = self._tts_engine_available.get(engine.name)
+        if available is None:
+            available = self._tts_engine_available[engine.name] = engine.is_available()
+        return available
+    
+    def get_tts_engine_chain(self, guild_id: Optional[int] = None) -> list[TTSEngine]:
+        """선택된 엔진과 대체 엔진 목록 (시도할 순서대로, 사용 불가능하거나 차단된 엔진 제외)"""
+        names = [self.get_guild_tts_engine(guild_id), Config.get_tts_engine(), *Config.TTS_FALLBACK_ENGINES]
+        chain = []
+        for name in dict.fromkeys(names):
+            engine = self.tts_engines.get(name)
+            if engine is None or not self.is_tts_engine_available(engine):
+                continue
+            breaker = self.tts_breakers.get(name)
+            if breaker is not None and breaker.is_open:
+                continue
+            chain.append(engine)
+        return chain
+    
+    async def _synthesize(self, engine: TTSEngine, text: str) -> tuple[bytes, str]:
         """
-        gTTS를 사용하여 음성 파일 생성
+        엔진으로 합성하여 (오디오 데이터, 형식) 반환
         
-        Args:
-            text: 변환할 텍스트
-            
-        Returns:
-            생성된 오디오 파일의 경로
+        작업 프로세스를 쓰면 재생 가능한 Opus까지 만들어 받고,
+        작업 프로세스가 재시작 중이면 이 프로세스의 스레드 풀에서 직접 합성합니다.
         """
+        if self.tts_worker is not None:
+            try:
+                return await self.tts_worker.synthesize(engine.name, text, Config.TTS_LANGUAGE)
+            except TTSWorkerUnavailable as e:
+                logger.warning(f"TTS 작업 프로세스 사용 불가, 직접 합성합니다: {e}")
+        data = await engine.synthesize_async(text, Config.TTS_LANGUAGE, self.tts_executor)
+        return data, engine.output_format
+    
+    async def _run_tts_engine(self, engine: TTSEngine, text: str) -> tuple[bytes, str]:
+        """시간 제한을 두고 엔진 호출 (결과를 서킷 브레이커에 기록)"""
+        breaker = self.tts_breakers.get(engine.name)
+        started = time.perf_counter()
         try:
-            # 텍스트 전처리 및 검증
-            text = text.strip()
-            
-            # 빈 텍스트 체크
-            if not text:
-                logger.warning("TTS 생성: 빈 텍스트")
-                raise ValueError("빈 텍스트는 TTS로 변환할 수 없습니다")
-            
-            # 특수문자만 있는지 체크 (한글, 영문, 숫자가 하나도 없으면)
-            if not re.search(r'[가-힣a-zA-Z0-9]', text):
-                logger.warning(f"TTS 생성: 특수문자만 포함된 텍스트 - {text}")
-                raise ValueError("특수문자만 포함된 텍스트는 TTS로 변환할 수 없습니다")
-            
-            # 임시 파일 경로 생성
-            import time
-            timestamp = int(time.time() * 1000)
-            temp_file = self.temp_dir / f"tts_{timestamp}_{id(text)}.mp3"
-            
-            logger.info(f"TTS 생성 시도 (gTTS-한국어): '{text[:50]}'")
-            
-            # gTTS로 음성 생성 (비동기 실행을 위해 run_in_executor 사용)
-            loop = asyncio.get_event_loop()
-            
-            # ResourceWarning 경고 억제 (gTTS 내부 세션 경고)
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=ResourceWarning)
-                await loop.run_in_executor(
-                    None,
-                    lambda: gTTS(text=text, lang='ko', slow=False).save(str(temp_file))
-                )
-            
-            # 파일이 실제로 생성되었는지 확인
-            if not temp_file.exists():
-                logger.error(f"TTS 파일이 생성되지 않음: {temp_file}")
-                raise ValueError("TTS 파일 생성 실패 - 파일 없음")
-            
-            file_size = temp_file.stat().st_size
-            if file_size == 0:
-                logger.error(f"TTS 파일이 비어있음: {temp_file}")
-                temp_file.unlink()  # 빈 파일 삭제
-                raise ValueError("TTS 파일 생성 실패 - 빈 파일")
-            
-            logger.info(f"TTS 파일 생성 완료: {temp_file.name} (크기: {file_size} bytes)")
-            return str(temp_file)
-            
+            result = await asyncio.wait_for(self._synthesize(engine, text), timeout=Config.TTS_SYNTH_TIMEOUT)
         except ValueError:
-            # ValueError는 그대로 전파
+            # 텍스트 문제는 엔진 장애가 아님
             raise
         except Exception as e:
-            logger.error(f"TTS 생성 중 오류 발생: {e}")
-            raise
+            if metrics.enabled:
+                metrics.inc("siri_tts_synthesis_failures_total", engine=engine.name)
+            error = e
+            if isinstance(e, asyncio.TimeoutError):
+                error = RuntimeError(f"합성 시간 초과 ({Config.TTS_SYNTH_TIMEOUT:g}초)")
+            if breaker is not None and breaker.record_failure(error):
+                self._start_tts_probe(engine)
+            if error is e:
+                raise
+            raise error from e
+        
+        if breaker is not None:
+            breaker.record_success()
+        if metrics.enabled:
+            metrics.observe("siri_tts_synthesis_seconds", time.perf_counter() - started, engine=engine.name)
+        return result
     
-    async def play_tts(self, voice_client: discord.VoiceClient, text: str):
+    def _start_tts_probe(self, engine: TTSEngine):
+        """차단된 엔진의 복구 확인 작업 시작"""
+        task = self._tts_probe_tasks.get(engine.name)
+        if task is None or task.done():
+            self._tts_probe_tasks[engine.name] = asyncio.create_task(
+                self._probe_tts_engine(engine), name=f"siri-tts-probe-{engine.name}"
+            )
+    
+    async def _probe_tts_engine(self, engine: TTSEngine):
+        """차단된 엔진을 주기적으로 시험 호출하여 복구되면 차단 해제"""
+        breaker = self.tts_breakers[engine.name]
+        interval = Config.TTS_BREAKER_PROBE_INTERVAL
+        while breaker.is_open:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.wait_for(self._synthesize(engine, "테스트"), timeout=Config.TTS_SYNTH_TIMEOUT)
+            except Exception as e:
+                breaker.record_failure(e)
+                interval = min(interval * 2, Config.TTS_BREAKER_PROBE_MAX_INTERVAL)
+                logger.debug(f"TTS 엔진 '{engine.name}' 복구 확인 실패 (다음 확인 {interval:.0f}초 후): {e}")
+                continue
+            breaker.record_success()
+    
+    async def generate_tts(self, text: str, guild_id: Optional[int] = None) -> TTSAudio:
         """
-        음성 채널에서 TTS 재생
+        길드에 설정된 TTS 엔진으로 음성 생성 (캐시 우선)
+        
+        선택된 엔진이 실패하면 대체 엔진으로 다시 시도합니다.
+        고정 문구와 짧은 문장은 디스크 캐시에 저장하고,
+        그 외의 문장은 파일을 만들지 않고 메모리 버퍼로 반환합니다.
         
         Args:
-            voice_client: 음성 클라이언트
-            text: 재생할 텍스트
-        """
-        try:
-            # TTS 파일 생성
-            audio_file = await self.generate_tts(text)
-            
-            # 오디오 소스 생성
-            audio_source = discord.FFmpegPCMAudio(audio_file)
-            
-            # 재생 완료를 기다리기 위한 이벤트
-            done = asyncio.Event()
+            text: 변환할 텍스트
+            guild_id: 엔진 설정을 적용할 길드 ID (없으면 기본 엔진)
             
-            def after_playing(error):
-                if error:
-                    logger.error(f"재생 중 오류: {error}")
-                # 파일 삭제
-                try:
-                    os.remove(audio_file)
-                    logger.info(f"임시 파일 삭제: {audio_file}")
-                except Exception as e:
-                    logger.error(f"임시 파일 삭제 실패: {e}")
-                done.set()
+        Returns:
+            재생 준비된 TTS 오디오
+        """
+        # 텍스트 전처리 및 검증
+        text = text.strip()
+        
+        # 빈 텍스트 체크
+        if not text:
+            logger.warning("TTS 생성: 빈 텍스트")
+            raise ValueError("빈 텍스트는 TTS로 변환할 수 없습니다")
+        
+        # 특수문자만 있는지 체크 (한글, 영문, 숫자가 하나도 없으면)
+        if not re.search(r'[가-힣a-zA-Z0-9]', text):
+            logger.warning(f"TTS 생성: 특수문자만 포함된 텍스트 - {text}")
+            raise ValueError("특수문자만 포함된 텍스트는 TTS로 변환할 수 없습니다")
+        
+        engines = self.get_tts_engine_chain(guild_id)
+        if not engines:
+            # 모든 엔진이 차단된 상태면 기다리지 않고 바로 실패
+            raise RuntimeError("사용 가능한 TTS 엔진이 없습니다")
+        
+        last_error: Optional[Exception] = None
+        for engine in engines:
+            try:
+                return await self._generate_with_engine(engine, text)
+            except ValueError:
+                # ValueError는 그대로 전파
+                raise
+            except Exception as e:
+                last_error = e
+                logger.warning(f"TTS 엔진 '{engine.name}' 실패: {e}")
+        
+        logger.error(f"TTS 생성 중 오류 발생: {last_error}")
+        raise RuntimeError(f"모든 TTS 엔진이 실패했습니다: {last_error}") from last_error
+    
+    def _get_cached_audio(self, engine: TTSEngine, text: str) -> Optional[TTSAudio]:
+        """엔진의 캐시된 음성 반환 (없으면 None)"""
+        key = TTSCache.make_key(text, Config.TTS_LANGUAGE, engine.name)
+        # Opus 모드(또는 작업 프로세스 사용 시)면 미리 인코딩된 파일을 우선 사용
+        if Config.get_tts_opus_cache() or self.tts_worker is not None:
+            cached = self.tts_cache.get(key, suffix=".opus")
+            if cached is not None:
+                logger.debug(f"TTS 캐시 사용 (Opus): '{text[:50]}'")
+                return TTSAudio(path=cached, fmt="opus")
+        cached = self.tts_cache.get(key, suffix=f".{engine.output_format}")
+        if cached is not None:
+            logger.debug(f"TTS 캐시 사용: '{text[:50]}'")
+            return TTSAudio(path=cached, fmt=engine.output_format)
+        return None
+    
+    def get_cached_tts(self, text: str, guild_id: Optional[int] = None) -> Optional[TTSAudio]:
+        """합성하지 않고 캐시된 음성만 반환 (종료 인사 등 네트워크를 기다릴 수 없을 때)"""
+        for engine in self.get_tts_engine_chain(guild_id):
+            audio = self._get_cached_audio(engine, text)
+            if audio is not None:
+                return audio
+        return None
+    
+    async def _generate_with_engine(self, engine: TTSEngine, text: str) -> TTSAudio:
+        """지정한 엔진으로 음성 생성 (캐시 및 중복 합성 방지 포함)"""
+        key = TTSCache.make_key(text, Config.TTS_LANGUAGE, engine.name)
+        suffix = f".{engine.output_format}"
+        cacheable = self.is_cacheable_tts(text)
+        use_opus = cacheable and Config.get_tts_opus_cache()
+        if cacheable:
+            # 캐시 확인 (같은 엔진의 같은 문장은 합성하지 않음)
+            cached = self._get_cached_audio(engine, text)
+            if cached is not None:
+                return cached
+        
+        # 같은 문장을 이미 합성 중이면 그 결과를 기다림
+        pending = self._tts_inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        tts_logger.info(f"TTS 생성 시도 ({engine.name}): '{text[:50]}'")
+        
+        async def synthesize() -> TTSAudio:
+            data, fmt = await self._run_tts_engine(engine, text)
+            if not cacheable:
+                # 캐시 대상이 아니면 파일을 만들지 않고 메모리 버퍼로 재생
+                return TTSAudio(data=data, fmt=fmt)
             
-            # 음성 재생
-            voice_client.play(audio_source, after=after_playing)
+            def store() -> TTSAudio:
+                if fmt == "opus":
+                    # 작업 프로세스가 이미 Opus로 인코딩함
+                    return TTSAudio(path=self.tts_cache.put(key, data, suffix=".opus"), fmt="opus")
+                if use_opus:
+                    # 한 번만 Opus로 인코딩해 두면 이후 재생은 인코딩 비용이 없음
+                    try:
+                        opus_data = transcode_to_opus(data)
+                        return TTSAudio(path=self.tts_cache.put(key, opus_data, suffix=".opus"), fmt="opus")
+                    except Exception as e:
+                        logger.warning(f"Opus 변환 실패, {engine.output_format.upper()}로 캐시합니다: {e}")
+                # 캐시 대상은 원자적으로 저장 후 파일로 재생
+                return TTSAudio(path=self.tts_cache.put(key, data, suffix=suffix), fmt=engine.output_format)
             
-            # 재생 완료 대기 (최대 10초)
+            return await asyncio.get_running_loop().run_in_executor(self.tts_cache_executor, store)
+        
+        task = asyncio.ensure_future(synthesize())
+        self._tts_inflight[key] = task
+        try:
+            audio = await asyncio.shield(task)
+        finally:
+            self._tts_inflight.pop(key, None)
+        
+        tts_logger.info(f"TTS 생성 완료: {audio!r}")
+        return audio
+    
+    async def _prewarm_tts(self):
+        """고정 문구를 미리 합성하여 캐시에 고정"""
+        for phrase in self.FIXED_PHRASES:
             try:
-                await asyncio.wait_for(done.wait(), timeout=10.0)
-            except asyncio.TimeoutError:
-                logger.warning("TTS 재생 타임아웃")
-                voice_client.stop()
+                audio = await self.generate_tts(phrase)
+                if audio.path is not None:
+                    self.tts_cache.pin(audio.path.stem, suffix=audio.path.suffix)
+            except Exception as e:
+                logger.warning(f"TTS 고정 문구 준비 실패 ({phrase}): {e}")
+        logger.info(f"TTS 고정 문구 {len(self.FIXED_PHRASES)}개 준비 완료 (캐시 {len(self.tts_cache)}개)")
+    
+    def get_tts_queue(self, guild: discord.Guild) -> GuildTTSQueue:
+        """길드별 TTS 재생 큐 반환 (없으면 생성)"""
+        queue = self.tts_queues.get(guild.id)
+        if queue is None:
+            queue = GuildTTSQueue(
+                guild.id,
+                functools.partial(self.generate_tts, guild_id=guild.id),
+                lambda: cast(Optional[discord.VoiceClient], guild.voice_client),
+                max_depth=Config.TTS_QUEUE_MAX_DEPTH,
+                drop_policy=Config.TTS_QUEUE_DROP_POLICY,
+                playback_timeout=Config.TTS_PLAYBACK_TIMEOUT,
+                prefetch=Config.TTS_PREFETCH,
+                semaphore=self._synthesis_semaphore,
+                chunk_chars=Config.TTS_CHUNK_MAX_CHARS,
+                coalesce_chars=Config.TTS_COALESCE_MAX_CHARS,
+            )
+            self.tts_queues[guild.id] = queue
+        return queue
+    
+    async def stop_tts_queues(self):
+        """모든 길드의 TTS 큐 소비자 종료"""
+        for queue in list(self.tts_queues.values()):
+            await queue.stop()
+        self.tts_queues.clear()
+    
+    async def play_tts(self, voice_client: discord.VoiceClient, text: str) -> bool:
+        """
+        음성 채널에서 TTS 재생 (길드 큐를 거쳐 순서대로 재생)
+        
+        Args:
+            voice_client: 음성 클라이언트
+            text: 재생할 텍스트
             
-        except Exception as e:
-            logger.error(f"TTS 재생 중 오류: {e}")
-            raise
+        Returns:
+            재생 완료 여부
+        """
+        return await self.get_tts_queue(voice_client.guild).speak(text)
     
     @app_commands.command(
         name="자동참여",
@@ -281,7 +508,14 @@ class VoiceCog(commands.Cog):
         # 설정 저장
         guild_id = interaction.guild.id
         is_enabled = bool(활성화.value)
-        self.auto_join_settings[guild_id] = is_enabled
+        if not await self.bot.settings.update(guild_id, auto_join=is_enabled):
+            embed = discord.Embed(
+                title="❌ 저장 실패",
+                description="설정을 저장하는 중 오류가 발생했습니다.",
+                color=Config.COLORS['error']
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
         
         # 응답 생성
         status = "활성화" if is_enabled else "비활성화"
@@ -301,6 +535,66 @@ class VoiceCog(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=True)
         logger.info(f"길드 {guild_id}의 자동 참여 모드: {status}")
     
+    @app_commands.command(
+        name="tts엔진",
+        description="이 서버에서 사용할 TTS 음성 엔진을 설정합니다 (관리자 전용)"
+    )
+    @app_commands.describe(
+        엔진="사용할 TTS 엔진 (실패 시 다른 엔진으로 자동 전환)"
+    )
+    @app_commands.choices(엔진=[
+        app_commands.Choice(name="Google TTS (온라인)", value="gtts"),
+        app_commands.Choice(name="로컬 합성기 (오프라인)", value="local")
+    ])
+    async def set_tts_engine(
+        self,
+        interaction: discord.Interaction,
+        엔진: app_commands.Choice[str]
+    ):
+        """
+        TTS 엔진 설정 (관리자 전용)
+        
+        선택한 엔진을 사용할 수 없거나 합성에 실패하면 대체 엔진으로 자동 전환됩니다.
+        """
+        # 관리자 권한 확인
+        if not await has_admin_permissions(interaction.user):
+            embed = discord.Embed(
+                title="❌ 권한 없음",
+                description="이 명령어는 관리자만 사용할 수 있습니다.",
+                color=Config.COLORS['error']
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        # 설정 저장
+        guild_id = interaction.guild.id
+        if not await self.bot.settings.update(guild_id, tts_engine=엔진.value):
+            embed = discord.Embed(
+                title="❌ 저장 실패",
+                description="설정을 저장하는 중 오류가 발생했습니다.",
+                color=Config.COLORS['error']
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title="🔊 TTS 엔진 설정",
+            description=f"TTS 엔진을 **{엔진.name}**(으)로 설정했어요!",
+            color=Config.COLORS['success']
+        )
+        engine = self.tts_engines.get(엔진.value)
+        if engine is None or not engine.is_available():
+            embed.add_field(
+                name="⚠️ 주의",
+                value="현재 이 엔진을 사용할 수 없어 대체 엔진으로 읽어드려요.",
+                inline=False
+            )
+        chain = " → ".join(engine.name for engine in self.get_tts_engine_chain(guild_id)) or "없음"
+        embed.add_field(name="📌 사용 순서", value=chain, inline=False)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        logger.info(f"길드 {guild_id}의 TTS 엔진: {엔진.value}")
+    
     @app_commands.command(
         name="시리야",
         description="시리를 음성 채널로 불러옵니다"
@@ -331,6 +625,7 @@ class VoiceCog(commands.Cog):
             if interaction.guild.voice_client:
                 # 같은 채널인 경우
                 if interaction.guild.voice_client.channel == channel:
+                    self.voice_sessions.keep_alive(interaction.guild.id)
                     embed = discord.Embed(
                         title="ℹ️ 이미 참여 중",
                         description="이미 이 음성 채널에 있어요!",
@@ -338,14 +633,9 @@ class VoiceCog(commands.Cog):
                     )
                     await interaction.followup.send(embed=embed, ephemeral=True)
                     return
-                # 다른 채널인 경우 이동
-                else:
-                    await interaction.guild.voice_client.move_to(channel)
-            # 연결되어 있지 않은 경우 새로 연결
-            else:
-                voice_client = await channel.connect()
-                # 연결 직후 약간의 대기 시간
-                await asyncio.sleep(0.5)
+            
+            # 다른 채널이면 이동, 연결되어 있지 않으면 새로 연결 (연결 완료까지 대기)
+            voice_client = await self.voice_sessions.connect(channel)
             
             # 입장 메시지 전송
             embed = discord.Embed(
@@ -358,14 +648,14 @@ class VoiceCog(commands.Cog):
             
             # TTS 인사말 재생
             try:
-                await self.play_tts(interaction.guild.voice_client, "안녕하세요!")
+                await self.play_tts(voice_client, "안녕하세요!")
             except Exception as e:
                 logger.error(f"TTS 재생 실패: {e}")
             
             logger.info(f"음성 채널 참여: {channel.name} (길드: {interaction.guild.name})")
             
-        except discord.ClientException as e:
-            logger.error(f"음성 채널 참여 실패 (ClientException): {e}")
+        except (discord.ClientException, asyncio.TimeoutError) as e:
+            logger.error(f"음성 채널 참여 실패 ({e.__class__.__name__}): {e}")
             embed = discord.Embed(
                 title="❌ 참여 실패",
                 description="음성 채널 참여에 실패했습니다. 잠시 후 다시 시도해주세요.",
@@ -416,7 +706,10 @@ class VoiceCog(commands.Cog):
             embed.set_footer(text=f"{channel_name} 채널에서 나갑니다")
             await interaction.followup.send(embed=embed)
             
-            # TTS 작별 인사 재생
+            # 대기 중인 메시지는 버리고 작별 인사 재생
+            self.voice_sessions.cancel_leave(interaction.guild.id)
+            self.get_tts_queue(interaction.guild).clear()
+            self.tts_spam_guard.forget_guild(interaction.guild.id)
             try:
                 await self.play_tts(interaction.guild.voice_client, "안녕히 계세요!")
             except Exception as e:
@@ -435,6 +728,26 @@ class VoiceCog(commands.Cog):
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
     
+    def count_humans(self, channel: discord.abc.GuildChannel) -> int:
+        """음성 채널의 사람 수 (처음 조회할 때만 멤버 목록을 세고 이후에는 증감으로 유지)"""
+        count = self._channel_humans.get(channel.id)
+        if count is None:
+            count = self._channel_humans[channel.id] = sum(
+                1 for m in getattr(channel, 'members', []) if not m.bot
+            )
+        return count
+    
+    def _adjust_humans(self, channel: Optional[discord.abc.GuildChannel], delta: int):
+        """이미 집계 중인 채널의 사람 수 증감 (집계 전 채널은 조회 시점에 새로 셈)"""
+        if channel is None or channel.id not in self._channel_humans:
+            return
+        self._channel_humans[channel.id] = max(0, self._channel_humans[channel.id] + delta)
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """재연결 후에는 음성 상태 이벤트를 놓쳤을 수 있으므로 인원 집계 초기화"""
+        self._channel_humans.clear()
+    
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """
@@ -455,12 +768,13 @@ class VoiceCog(commands.Cog):
         if not voice_client or not voice_client.is_connected():
             return
         
-        # 메시지 작성자가 음성 채널에 있는지 확인
-        if not message.author.voice or not message.author.voice.channel:
+        # 봇이 있는 채널에 사람이 없으면 작성자를 확인할 필요도 없음
+        if self.count_humans(voice_client.channel) == 0:
             return
         
-        # 봇과 같은 음성 채널에 있는지 확인
-        if message.author.voice.channel != voice_client.channel:
+        # 메시지 작성자가 봇과 같은 음성 채널에 있는지 확인
+        author_voice = getattr(message.author, 'voice', None)
+        if not author_voice or not author_voice.channel or author_voice.channel.id != voice_client.channel.id:
             return
         
         # 명령어는 읽지 않음
@@ -471,11 +785,12 @@ class VoiceCog(commands.Cog):
         if not message.content.strip():
             return
         
+        # 모든 TTS 엔진이 차단된 상태면 채팅 읽기를 건너뜀
+        if not self.get_tts_engine_chain(message.guild.id):
+            logger.debug("TTS 건너뜀: 사용 가능한 TTS 엔진 없음 (서킷 브레이커 차단)")
+            return
+        
         try:
-            # 현재 재생 중이면 대기
-            while voice_client.is_playing():
-                await asyncio.sleep(0.5)
-            
             # 메시지 전처리 (이모티콘, 반복 문자 등 처리)
             tts_text = self.process_message_for_tts(message.content)
             
@@ -498,14 +813,21 @@ class VoiceCog(commands.Cog):
             if len(tts_text) > 200:
                 tts_text = tts_text[:200] + "... 이하 생략"
             
-            await self.play_tts(voice_client, tts_text)
-            logger.info(f"TTS 메시지 읽음: {message.author.display_name} - {tts_text[:50]}")
+            # 도배 방지 (중복 문장, 사용자별 글자 수 한도)
+            reason = self.tts_spam_guard.check(message.guild.id, message.author.id, tts_text)
+            if reason:
+                logger.debug(f"TTS 건너뜀: {reason} ({message.author.display_name}: {tts_text[:50]})")
+                return
+            
+            # 길드 큐에 추가 (재생은 큐 소비자가 순서대로 처리, 같은 작성자의 연속 메시지는 병합)
+            queued = self.get_tts_queue(message.guild).put(
+                tts_text, label=message.author.display_name, source=message.author.id
+            )
+            if not queued:
+                logger.debug(f"TTS 큐가 가득 차 메시지를 건너뜀: {tts_text[:50]}")
             
-        except ValueError as e:
-            # TTS 변환 불가능한 텍스트 (로그만 남기고 조용히 무시)
-            logger.debug(f"TTS 건너뜀 (ValueError): {e} - 원본: {message.content[:50]}")
         except Exception as e:
-            logger.error(f"메시지 TTS 재생 중 오류: {e}")
+            logger.error(f"메시지 TTS 처리 중 오류: {e}")
     
     @commands.Cog.listener()
     async def on_voice_state_update(
@@ -527,8 +849,20 @@ class VoiceCog(commands.Cog):
         if member.bot:
             return
         
+        # 마이크/스피커 음소거, 화면 공유 등 채널 이동이 없는 변경은 무시
+        if before.channel == after.channel:
+            return
+        
+        # 채널별 사람 수 갱신
+        self._adjust_humans(before.channel, -1)
+        self._adjust_humans(after.channel, +1)
+        
+        # 퇴장 대기 중인 채널로 사람이 돌아오면 연결 유지
+        if guild.voice_client and after.channel == guild.voice_client.channel:
+            self.voice_sessions.keep_alive(guild.id)
+        
         # 자동 참여 설정 확인
-        auto_join_enabled = self.auto_join_settings.get(guild.id, False)
+        auto_join_enabled = self.bot.settings.get(guild.id).auto_join
         
         # 사용자가 음성 채널에 입장한 경우
         if after.channel and not before.channel and auto_join_enabled:
@@ -537,17 +871,13 @@ class VoiceCog(commands.Cog):
                 return
             
             try:
-                # 봇이 다른 채널에 있으면 이동, 없으면 입장
-                if guild.voice_client:
-                    await guild.voice_client.move_to(after.channel)
-                else:
-                    await after.channel.connect()
-                    await asyncio.sleep(0.5)
+                # 봇이 다른 채널에 있으면 이동, 없으면 입장 (연결 완료까지 대기)
+                voice_client = await self.voice_sessions.connect(after.channel)
                 
                 # TTS 인사말 재생
                 try:
                     await self.play_tts(
-                        guild.voice_client,
+                        voice_client,
                         f"{member.display_name}님, 안녕하세요!"
                     )
                 except Exception as e:
@@ -558,72 +888,136 @@ class VoiceCog(commands.Cog):
             except Exception as e:
                 logger.error(f"자동 참여 중 오류: {e}")
         
-        # 채널에 아무도 없으면 봇 퇴장
+        # 채널에 아무도 없으면 잠시 기다렸다가 봇 퇴장 (곧 돌아오면 연결 재사용)
         if guild.voice_client:
-            voice_channel = guild.voice_client.channel
             # 봇을 제외한 멤버 수 확인
-            members = [m for m in voice_channel.members if not m.bot]
-            if len(members) == 0:
-                try:
-                    await guild.voice_client.disconnect()
-                    logger.info(f"빈 채널에서 자동 퇴장: {voice_channel.name}")
-                except Exception as e:
-                    logger.error(f"자동 퇴장 중 오류: {e}")
+            if self.count_humans(guild.voice_client.channel) == 0:
+                self.get_tts_queue(guild).clear()
+                self.voice_sessions.schedule_leave(
+                    guild,
+                    still_idle=lambda: self._is_idle(guild),
+                    on_leave=functools.partial(self._leave_idle_channel, guild),
+                )
     
-    async def cog_unload(self):
-        """Cog 언로드 시 정리 작업"""
-        if self._cleanup_done:
+    def _is_idle(self, guild: discord.Guild) -> bool:
+        """봇이 연결된 채널에 사람이 없는지 여부"""
+        voice_client = guild.voice_client
+        return voice_client is not None and self.count_humans(voice_client.channel) == 0
+    
+    async def _leave_idle_channel(self, guild: discord.Guild):
+        """퇴장 대기 시간이 지나도 비어 있는 채널에서 퇴장"""
+        voice_client = guild.voice_client
+        if voice_client is None:
+            return
+        channel_name = voice_client.channel.name
+        self.get_tts_queue(guild).clear()
+        self.tts_spam_guard.forget_guild(guild.id)
+        await voice_client.disconnect()
+        logger.info(f"빈 채널에서 자동 퇴장: {channel_name} ({Config.VOICE_LINGER_SECONDS:g}초 대기 후)")
+    
+    async def cog_load(self):
+        """Cog 로드 시 TTS 작업 프로세스 시작 및 고정 문구 TTS 사전 준비 (백그라운드)"""
+        if self.tts_worker is not None:
+            try:
+                await self.tts_worker.start()
+            except Exception as e:
+                # 첫 합성 요청 때 다시 시도하고, 그래도 안 되면 직접 합성
+                logger.error(f"TTS 작업 프로세스 시작 실패: {e}")
+        self._prewarm_task = asyncio.create_task(self._prewarm_tts(), name="siri-tts-prewarm")
+    
+    async def _play_farewell(self, guild: discord.Guild, text: str):
+        """캐시된 작별 인사를 재생하고 끝날 때까지 대기"""
+        voice_client = cast(Optional[discord.VoiceClient], guild.voice_client)
+        if voice_client is None or not voice_client.is_connected():
             return
+        if voice_client.is_playing():
+            voice_client.stop()
         
-        self._cleanup_done = True
-        logger.info("VoiceCog 언로드 시작 - 음성 채널 정리 중...")
+        # 종료 중에는 합성(네트워크)을 기다리지 않고 미리 준비된 음성만 사용
+        audio = self.get_cached_tts(text, guild.id)
+        if audio is None:
+            logger.debug(f"{guild.name}: 캐시된 작별 인사가 없어 생략")
+            return
         
-        # 모든 음성 연결 정리
-        for guild in self.bot.guilds:
-            if guild.voice_client:
-                try:
-                    # 현재 재생 중이면 중지
-                    if guild.voice_client.is_playing():
-                        guild.voice_client.stop()
-                        logger.info(f"{guild.name}: 재생 중인 오디오 중지")
-                        await asyncio.sleep(0.2)
-                    
-                    # 간단한 작별 인사 (언로드 시에는 빠르게)
-                    try:
-                        await self.play_tts(guild.voice_client, "다시 올게요")
-                        await asyncio.sleep(2.0)  # 최대 2초 대기
-                    except Exception as e:
-                        logger.warning(f"{guild.name}: 작별 인사 실패 - {e}")
-                    
-                    # 연결 종료
-                    await guild.voice_client.disconnect()
-                    logger.info(f"Cog 언로드: {guild.name}에서 연결 종료")
-                    
-                except Exception as e:
-                    logger.error(f"{guild.name} 연결 종료 중 오류: {e}")
+        loop = asyncio.get_running_loop()
+        finished = loop.create_future()
+        
+        def after_playing(error):
+            loop.call_soon_threadsafe(lambda: finished.done() or finished.set_result(None))
         
-        # 임시 파일 정리
+        voice_client.play(audio.create_source(), after=after_playing)
+        await finished
+    
+    async def _disconnect_guild(self, guild: discord.Guild):
+        """길드 음성 연결 종료"""
+        voice_client = guild.voice_client
+        if voice_client is None:
+            return
         try:
-            cleaned_count = 0
-            for file in self.temp_dir.glob("tts_*.mp3"):
-                try:
-                    file.unlink()
-                    cleaned_count += 1
-                except Exception as e:
-                    logger.warning(f"파일 삭제 실패 {file}: {e}")
-            
-            if cleaned_count > 0:
-                logger.info(f"임시 TTS 파일 {cleaned_count}개 정리 완료")
+            if voice_client.is_playing():
+                voice_client.stop()
+            await voice_client.disconnect(force=True)
+            logger.info(f"{guild.name}: 음성 채널 연결 종료")
         except Exception as e:
-            logger.error(f"임시 파일 정리 중 오류: {e}")
+            logger.error(f"{guild.name} 연결 종료 중 오류: {e}")
+    
+    async def shutdown_voice(self, farewell: str, timeout: float):
+        """
+        모든 길드에서 동시에 작별 인사 후 음성 연결 종료
         
-        # gTTS가 사용하는 aiohttp 세션 정리를 위한 충분한 대기
-        # 가비지 컬렉션 강제 실행
-        import gc
-        gc.collect()
-        await asyncio.sleep(0.5)
-        gc.collect()
+        작별 인사와 연결 종료를 합쳐 길드 수와 관계없이 전체 timeout초 안에 끝나며,
+        시간 안에 끝나지 않은 재생은 중단하고 바로 연결을 종료합니다.
+        남은 시간 안에 끊지 못한 연결은 봇 종료(Client.close) 시 강제로 정리됩니다.
+        """
+        if self._cleanup_done:
+            return
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._cleanup_done = True
+        self.voice_sessions.close()
+        if self._prewarm_task and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+        for task in self._tts_probe_tasks.values():
+            task.cancel()
+        
+        # TTS 큐 소비자가 작별 인사 재생과 겹치지 않도록 먼저 종료
+        await self.stop_tts_queues()
         
+        guilds = [guild for guild in self.bot.guilds if guild.voice_client]
+        if guilds:
+            logger.info(f"음성 채널 정리 시작: {len(guilds)}개 길드")
+            farewells = {
+                asyncio.create_task(self._play_farewell(guild, farewell)): guild
+                for guild in guilds
+            }
+            done, pending = await asyncio.wait(farewells, timeout=max(0.0, deadline - loop.time()))
+            for task in pending:
+                task.cancel()
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    logger.warning(f"{farewells[task].name}: 작별 인사 실패 - {task.exception()}")
+            if pending:
+                logger.warning(f"작별 인사 {len(pending)}개가 {timeout:g}초 안에 끝나지 않아 중단")
+            
+            disconnects = [asyncio.create_task(self._disconnect_guild(guild)) for guild in guilds]
+            # 작별 인사가 시간을 다 썼어도 연결 종료 요청을 보낼 최소한의 여유는 둠
+            _, pending = await asyncio.wait(disconnects, timeout=max(0.5, deadline - loop.time()))
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"음성 연결 {len(pending)}개를 제한 시간 안에 종료하지 못해 봇 종료 시 정리")
+        
+        # 남은 합성 작업은 기다리지 않음 (대기 중인 작업은 취소)
+        if self.tts_worker is not None:
+            await self.tts_worker.close()
+        self.tts_executor.shutdown(wait=False, cancel_futures=True)
+        self.tts_cache_executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def cog_unload(self):
+        """Cog 언로드 시 정리 작업"""
+        logger.info("VoiceCog 언로드 시작 - 음성 채널 정리 중...")
+        await self.shutdown_voice("다시 올게요", Config.SHUTDOWN_FAREWELL_TIMEOUT)
         logger.info("VoiceCog 언로드 완료")
 
 
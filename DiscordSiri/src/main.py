@@ -12,38 +12,58 @@ Siri Discord Bot - 통합 실행 파일
 
 import asyncio
 import logging
-import os
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
 
-import discord
-from discord.ext import commands
-from dotenv import load_dotenv
+from utils.startup_timer import StartupTimer
 
-from utils.database import DatabaseManager
-from utils.config import Config
-from utils.helpers import MessageCleanupManager
+# 시작 시간 측정 (무거운 모듈 import 시간 포함)
+startup_timer = StartupTimer()
+
+with startup_timer.measure("import discord"):
+    import discord
+    from discord.ext import commands
+
+with startup_timer.measure("import dotenv"):
+    from dotenv import load_dotenv
+
+with startup_timer.measure("import utils"):
+    from utils.command_sync import CommandSyncManager
+    from utils.database import DatabaseManager
+    from utils.guild_settings import GuildSettingsStore
+    from utils.config import Config
+    from utils.helpers import MessageCleanupManager
+    from utils.logging_setup import setup_logging
+    from utils.loop_monitor import LoopMonitor
+    from utils.metrics import MetricsCommandTree, MetricsServer, create_http_trace, enable_metrics
 
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
 ENV_PATH = PROJECT_ROOT / ".env"
 
-# 환경 변수 로드
-load_dotenv(ENV_PATH)
-
-# 로깅 설정 - 통합된 단일 로그 파일 사용
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(PROJECT_ROOT / 'discord_siri_bot.log'),  # 통합 로그 파일
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# asyncio 경고 레벨 조정 (aiohttp 세션 경고 억제)
-logging.getLogger('asyncio').setLevel(logging.CRITICAL)
+
+def setup_environment():
+    """
+    환경 변수 로드 및 로깅 설정
+    
+    import 시점이나 main()이 아니라 실행 진입점(main.py 직접 실행, run.py)에서 한 번만 호출합니다.
+    """
+    load_dotenv(ENV_PATH)
+    
+    # 로깅 설정 - 통합된 단일 로그 파일 사용 (쓰기는 백그라운드 스레드, 크기/시간 기준 교체)
+    setup_logging(
+        PROJECT_ROOT / 'discord_siri_bot.log',
+        max_bytes=Config.LOG_MAX_BYTES,
+        backup_count=Config.LOG_BACKUP_COUNT,
+        rotate_when=Config.get_log_rotate_when(),
+        json_lines=Config.get_log_json(),
+        sample_rates=Config.LOG_SAMPLE_RATES,
+    )
+    
+    # asyncio 경고 레벨 조정 (aiohttp 세션 경고 억제)
+    logging.getLogger('asyncio').setLevel(logging.CRITICAL)
 
 
 def preflight_check() -> bool:
@@ -110,33 +130,60 @@ class SiriBot(commands.Bot):
         super().__init__(
             command_prefix=Config.get_command_prefix(),
             intents=intents,
-            help_command=None
+            help_command=None,
+            # 메트릭이 꺼져 있으면 플래그 확인 외에는 기본 트리와 같음
+            tree_cls=MetricsCommandTree,
+            # 재시도 중 받은 429까지 세기 위한 HTTP 응답 추적 (메트릭을 켰을 때만)
+            http_trace=create_http_trace() if Config.get_metrics_enabled() else None,
         )
         
         self.db = None
+        self.settings = None
         self._synced = False
+        # 명령어 구조 해시는 DB 옆에 저장 (변경이 있을 때만 동기화)
+        self.command_sync = CommandSyncManager(
+            self.tree,
+            Path(Config.get_database_path()).parent / "command_tree.json",
+            Config.get_dev_guild_id(),
+        )
         self.cleanup_manager = MessageCleanupManager()
+        # 이벤트 루프 지연 감시 (/시스템상태에서 확인, 느린 콜백 기록은 LOOP_SLOW_CALLBACKS=1일 때만)
+        self.loop_monitor = LoopMonitor(
+            interval=Config.LOOP_LAG_INTERVAL,
+            window=Config.LOOP_LAG_WINDOW,
+            slow_threshold=Config.LOOP_SLOW_CALLBACK_THRESHOLD if Config.get_loop_slow_callbacks() else 0.0,
+        )
+        self.metrics_server: MetricsServer | None = None
         
     async def setup_hook(self):
         """봇 시작 시 초기 설정"""
         logger.info("Siri Bot 초기화 중...")
         
         # 데이터베이스 초기화
-        self.db = DatabaseManager(Config.get_database_path())
-        await self.db.init_database()
+        with startup_timer.measure("DB 초기화"):
+            self.db = DatabaseManager(Config.get_database_path())
+            await self.db.init_database()
+        
+        # 메트릭 수집 (켜져 있을 때만 DB/HTTP 계측 설치)
+        if Config.get_metrics_enabled():
+            enable_metrics(self)
+            await self.start_metrics_server()
+        
+        # 길드 설정 스냅샷 로드 (이후 설정 조회는 DB에 접근하지 않음)
+        with startup_timer.measure("길드 설정 로드"):
+            self.settings = GuildSettingsStore(self.db)
+            await self.settings.load()
         
         # Cogs 로드
-        await self.load_cogs()
+        with startup_timer.measure("Cog 로드 (전체)"):
+            await self.load_cogs()
 
-        if not self._synced:
-            try:
-                synced = await self.tree.sync()
-                self._synced = True
-                logger.info(f"[Siri] 초기 슬래시 명령어 {len(synced)}개 동기화 완료")
-            except Exception as e:
-                logger.error(f"[Siri] 초기 명령어 동기화 실패: {e}")
+        # 명령어 구조가 바뀌었을 때만 동기화 (실패하면 on_ready에서 다시 시도)
+        with startup_timer.measure("명령어 동기화"):
+            await self.sync_commands()
 
         self.cleanup_manager.start()
+        self.loop_monitor.start()
 
         # 동기화 텍스트 명령어 등록 (봇 소유자 전용)
         async def sync_cmd(ctx: commands.Context):
@@ -144,10 +191,10 @@ class SiriBot(commands.Bot):
                 await ctx.send("❌ 이 명령어는 봇 소유자만 사용할 수 있습니다.")
                 return
             try:
-                synced = await self.tree.sync()
+                synced = await self.command_sync.sync(self.application_id, force=True)
                 self._synced = True
-                await ctx.send(f"✅ 슬래시 명령어 {len(synced)}개 동기화 완료!")
-                logger.info(f"[Siri] 수동 동기화: {len(synced)}개 명령어")
+                await ctx.send(f"✅ 슬래시 명령어 {synced}개 동기화 완료!")
+                logger.info(f"[Siri] 수동 동기화: {synced}개 명령어")
             except Exception as e:
                 await ctx.send(f"❌ 동기화 실패: {e}")
                 logger.error(f"[Siri] 수동 동기화 실패: {e}")
@@ -156,36 +203,58 @@ class SiriBot(commands.Bot):
         
         logger.info("Siri Bot 초기화 완료!")
     
+    async def sync_commands(self):
+        """슬래시 명령어 동기화 (시작 후 한 번만, 구조가 바뀌었을 때만 실제 요청)"""
+        if self._synced:
+            return
+        try:
+            await self.command_sync.sync(self.application_id)
+            self._synced = True
+        except Exception as e:
+            logger.error(f"[Siri] 명령어 동기화 실패: {e}")
+    
     async def load_cogs(self):
-        """모든 Cogs 로드"""
+        """
+        모든 Cogs 로드
+        
+        Cog끼리는 의존성이 없으므로 동시에 로드하고 (cog_load의 DB 조회 등이 겹침),
+        음성 기능은 VOICE_ENABLED=0이면 모듈 자체를 불러오지 않습니다.
+        """
         cog_files = [
             'cogs.attendance',
             'cogs.leaderboard', 
             'cogs.admin',
             'cogs.announcement',
-            'cogs.voice',
-            'cogs.maintenance'  # 유지보수 Cog 추가
         ]
+        if Config.get_voice_enabled():
+            cog_files.append('cogs.voice')
+        else:
+            logger.info("음성 기능 비활성화 (VOICE_ENABLED=0) - cogs.voice를 불러오지 않습니다")
         
-        for cog in cog_files:
-            try:
-                await self.load_extension(cog)
-                logger.info(f"Siri Cog {cog} 로드 완료")
-            except Exception as e:
-                logger.error(f"Siri Cog {cog} 로드 실패: {e}")
+        await asyncio.gather(*(self._load_cog(cog) for cog in cog_files))
+    
+    async def _load_cog(self, cog: str):
+        """Cog 하나 로드 (import 및 setup 시간 기록)"""
+        started = time.perf_counter()
+        try:
+            await self.load_extension(cog)
+            logger.info(f"Siri Cog {cog} 로드 완료")
+        except Exception as e:
+            logger.error(f"Siri Cog {cog} 로드 실패: {e}")
+        finally:
+            startup_timer.record(f"  {cog}", time.perf_counter() - started)
     
     async def on_ready(self):
         """봇이 준비되었을 때"""
         logger.info(f'[Siri] {self.user}가 {len(self.guilds)}개 서버에 연결되었습니다!')
         
-        # 슬래시 명령어 동기화
-        try:
-            if not self._synced:
-                synced = await self.tree.sync()
-                self._synced = True
-                logger.info(f"[Siri] 슬래시 명령어 {len(synced)}개 동기화 완료")
-        except Exception as e:
-            logger.error(f"[Siri] 명령어 동기화 실패: {e}")
+        # 첫 READY까지의 시간과 단계별 소요 시간 기록 (재연결 시에는 생략)
+        if not startup_timer.reported:
+            startup_timer.record("첫 READY (시작부터)", startup_timer.elapsed())
+            startup_timer.report()
+        
+        # 시작 시 동기화에 실패했으면 다시 시도
+        await self.sync_commands()
         
         # 봇 상태 설정
         activity = discord.Game(name="출석체크 /ㅊㅊ")
@@ -205,96 +274,53 @@ class SiriBot(commands.Bot):
     
     
 
+    async def start_metrics_server(self):
+        """Prometheus 엔드포인트 시작 (METRICS_PORT가 설정된 경우, 실패해도 봇은 계속 실행)"""
+        port = Config.get_metrics_port()
+        if port is None:
+            return
+        server = MetricsServer(Config.METRICS_HOST, port)
+        try:
+            await server.start()
+        except OSError as e:
+            logger.error(f"[Siri] 메트릭 엔드포인트 시작 실패 ({Config.METRICS_HOST}:{port}): {e}")
+            return
+        self.metrics_server = server
+
     async def close(self):
-        """봇 종료 시 정리 작업"""
+        """봇 종료 시 정리 작업 (전체 Config.SHUTDOWN_TIMEOUT초 안에 완료)"""
         logger.info("[Siri] 봇 종료 시작 - 정리 작업 수행 중...")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + Config.SHUTDOWN_TIMEOUT
 
+        self.loop_monitor.stop()
         await self.cleanup_manager.shutdown()
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
         
-        # 음성 시스템 정리
+        # 음성 시스템 정리 (모든 길드 작별 인사를 동시에)
         voice_cog = self.get_cog('VoiceCog')
         if voice_cog:
             try:
                 logger.info("[Siri] 음성 시스템 정리 시작...")
-                for guild in self.guilds:
-                    if guild.voice_client:
-                        try:
-                            vc = cast(discord.VoiceClient, guild.voice_client)
-                            if vc.is_playing():
-                                vc.stop()
-                                await asyncio.sleep(0.3)
-                            
-                            try:
-                                tts_text = "잠시 후 돌아올게요"
-                                # 타입 힌트: VoiceCog
-                                if TYPE_CHECKING:
-                                    from cogs.voice import VoiceCog  # pragma: no cover
-                                vcog = cast(object, voice_cog)
-                                audio_file = await getattr(vcog, 'generate_tts')(tts_text)
-                                audio_source = discord.FFmpegPCMAudio(audio_file)
-                                
-                                done = asyncio.Event()
-                                
-                                def cleanup_after(error):
-                                    try:
-                                        if os.path.exists(audio_file):
-                                            os.remove(audio_file)
-                                    except:
-                                        pass
-                                    done.set()
-                                
-                                vc.play(audio_source, after=cleanup_after)
-                                
-                                try:
-                                    await asyncio.wait_for(done.wait(), timeout=3.0)
-                                except asyncio.TimeoutError:
-                                    vc.stop()
-                                
-                            except Exception as e:
-                                logger.warning(f"[Siri] 작별 인사 TTS 실패: {e}")
-                            
-                            await vc.disconnect(force=False)
-                            logger.info(f"[Siri] 길드 {guild.name}: 음성 채널 연결 종료")
-                            
-                        except Exception as e:
-                            logger.error(f"[Siri] 길드 {guild.name} 음성 정리 중 오류: {e}")
-                
-                try:
-                    vcog = cast(object, voice_cog)
-                    temp_dir = getattr(vcog, 'temp_dir', None)
-                    if temp_dir is not None:
-                        for file in temp_dir.glob("tts_*.mp3"):
-                            file.unlink()
-                        logger.info("[Siri] 임시 TTS 파일 정리 완료")
-                except Exception as e:
-                    logger.error(f"[Siri] 임시 파일 정리 중 오류: {e}")
-                
+                farewell_timeout = min(Config.SHUTDOWN_FAREWELL_TIMEOUT, max(0.0, deadline - loop.time()))
+                await getattr(voice_cog, 'shutdown_voice')("잠시 후 돌아올게요", farewell_timeout)
                 logger.info("[Siri] 음성 시스템 정리 완료")
             except Exception as e:
                 logger.error(f"[Siri] 음성 시스템 정리 중 오류: {e}")
         
-        # 데이터베이스 연결 종료
+        # 상위 클래스의 close 호출 (Cog 언로드, 음성 연결, 게이트웨이, HTTP 세션 종료까지 대기)
+        # 새 이벤트가 들어오지 않게 된 뒤에 DB를 정리해야 실행 중인 핸들러가 닫힌 DB를 만나지 않음
+        await super().close()
+        
+        # 데이터베이스 정리 (이미 실행 중이던 핸들러의 쓰기/백업이 끝날 때까지 남은 시간만큼 대기)
         if self.db:
             try:
-                await self.db.close()
+                await self.db.close(timeout=max(0.1, deadline - loop.time()))
                 logger.info("[Siri] 데이터베이스 연결 종료")
             except Exception as e:
                 logger.error(f"[Siri] 데이터베이스 종료 중 오류: {e}")
         
-        # 상위 클래스의 close 호출 전에 대기 (HTTP 세션이 정리될 시간 확보)
-        await asyncio.sleep(0.3)
-        
-        # 상위 클래스의 close 호출 (HTTP 세션 정리 포함)
-        await super().close()
-        
-        # 모든 비동기 작업이 완료될 때까지 대기
-        await asyncio.sleep(0.5)
-        
-        # 가비지 컬렉션 강제 실행 (미사용 세션 정리)
-        import gc
-        gc.collect()
-        await asyncio.sleep(0.2)
-        
         logger.info("[Siri] 봇 정리 작업 완료")
 
     async def on_error(self, event: str, *args, **kwargs):
@@ -327,8 +353,13 @@ async def run_siri_bot(bot: SiriBot):
             await bot.close()
 
 
-async def main():
-    """메인 실행 함수"""
+async def main(preflight: bool = True):
+    """
+    메인 실행 함수
+    
+    Args:
+        preflight: 사전 점검 실행 여부 (run.py처럼 이미 점검한 경우 False)
+    """
     global siri_bot
     
     logger.info("=" * 50)
@@ -336,7 +367,7 @@ async def main():
     logger.info("=" * 50)
 
     # 환경 및 디렉토리 사전 점검
-    if not preflight_check():
+    if preflight and not preflight_check():
         logger.error("사전 점검 실패로 실행을 중단합니다.")
         return
     
@@ -367,14 +398,6 @@ async def main():
             except Exception as e:
                 logger.error(f"봇 종료 중 오류: {e}")
         
-        # 모든 리소스와 세션이 정리될 때까지 충분한 대기
-        await asyncio.sleep(1.0)
-        
-        # 가비지 컬렉션 강제 실행
-        import gc
-        gc.collect()
-        await asyncio.sleep(0.3)
-        
         logger.info("시스템 종료 완료")
     
     def signal_handler(signum, frame):
@@ -397,6 +420,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    setup_environment()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -0,0 +1 @@
+# Scripts 패키지 (벤치마크 등 개발용 스크립트)
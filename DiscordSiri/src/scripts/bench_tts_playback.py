@@ -0,0 +1,140 @@
+"""
+TTS 재생 CPU 벤치마크
+재생할 때마다 FFmpeg로 변환하는 경로(FFmpegPCMAudio + Opus 인코딩)와
+미리 인코딩한 Ogg/Opus를 그대로 전송하는 경로(OggOpusSource)의 CPU 시간을 비교
+
+디스코드 음성 재생 스레드와 같은 순서로 20ms 프레임을 끝까지 읽되 실제로 보내지는 않습니다.
+FFmpeg 프로세스가 쓴 CPU도 자식 프로세스 시간으로 포함합니다.
+
+실행: python -m scripts.bench_tts_playback [--input 파일] [--seconds N] [--plays N]
+(DiscordSiri/src에서 실행, FFmpeg 필요)
+"""
+
+import argparse
+import os
+import subprocess
+import time
+from typing import Callable, Optional
+
+import discord
+import discord.opus
+
+from utils.config import Config
+from utils.tts_audio import TTSAudio, transcode_to_opus
+
+
+def cpu_seconds() -> float:
+    """현재 프로세스와 종료된 자식 프로세스의 CPU 시간 합 (사용자 + 시스템)"""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def measure(func: Callable[[], None]) -> tuple[float, float]:
+    """(CPU 시간, 경과 시간) 측정"""
+    cpu_started = cpu_seconds()
+    wall_started = time.perf_counter()
+    func()
+    return cpu_seconds() - cpu_started, time.perf_counter() - wall_started
+
+
+def load_encoder() -> Optional[discord.opus.Encoder]:
+    """재생 스레드가 PCM을 보낼 때 쓰는 Opus 인코더 (libopus가 없으면 None)"""
+    if not discord.opus.is_loaded():
+        try:
+            discord.opus._load_default()
+        except Exception:
+            pass
+    if not discord.opus.is_loaded():
+        return None
+    return discord.opus.Encoder()
+
+
+def drain(audio: TTSAudio, encoder: Optional[discord.opus.Encoder]) -> int:
+    """
+    오디오 소스를 끝까지 읽음 (AudioPlayer와 같은 방식)
+
+    Opus가 아닌 소스는 프레임마다 인코딩합니다. 읽은 프레임 수를 반환합니다.
+    """
+    source = audio.create_source()
+    frames = 0
+    try:
+        while True:
+            data = source.read()
+            if not data:
+                break
+            if not source.is_opus() and encoder is not None:
+                encoder.encode(data, encoder.SAMPLES_PER_FRAME)
+            frames += 1
+    finally:
+        # FFmpeg 프로세스를 회수해야 자식 CPU 시간에 포함됨
+        source.cleanup()
+    return frames
+
+
+def generate_tone(seconds: float) -> bytes:
+    """측정용 MP3 생성 (TTS 출력과 같은 24kHz 모노)"""
+    result = subprocess.run(
+        [
+            Config.get_ffmpeg_path(), "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=24000:duration={seconds}",
+            "-ac", "1", "-c:a", "libmp3lame", "-b:a", "32k", "-f", "mp3", "pipe:1",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="측정할 오디오 파일 (없으면 사인파 MP3 생성)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="생성할 오디오 길이 (초)")
+    parser.add_argument("--plays", type=int, default=20, help="경로별 재생 횟수")
+    args = parser.parse_args()
+
+    try:
+        if args.input:
+            with open(args.input, "rb") as f:
+                source_data = f.read()
+        else:
+            source_data = generate_tone(args.seconds)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise SystemExit(f"입력 오디오 준비 실패 (FFmpeg 경로: {Config.get_ffmpeg_path()}): {e}")
+
+    encoder = load_encoder()
+    if encoder is None:
+        print("⚠️ libopus를 불러오지 못해 FFmpeg 경로의 Opus 인코딩 비용은 제외합니다 (실제보다 적게 측정됨)")
+
+    # 미리 인코딩 비용 (캐시 저장 시 한 번)
+    opus_data = b""
+
+    def pre_encode() -> None:
+        nonlocal opus_data
+        opus_data = transcode_to_opus(source_data)
+
+    encode_cpu, _ = measure(pre_encode)
+
+    paths = (
+        ("FFmpeg 변환 (재생마다)", TTSAudio(data=source_data, fmt="mp3")),
+        ("Ogg/Opus 그대로 전송", TTSAudio(data=opus_data, fmt="opus")),
+    )
+    per_play: dict[str, float] = {}
+    for name, audio in paths:
+        frames = drain(audio, encoder)  # 워밍업 (프레임 수 확인)
+        cpu, wall = measure(lambda: [drain(audio, encoder) for _ in range(args.plays)])
+        per_play[name] = cpu / args.plays
+        print(
+            f"{name}: 재생당 CPU {per_play[name] * 1000:.1f}ms · "
+            f"경과 {wall / args.plays * 1000:.1f}ms · 프레임 {frames}개 ({frames * 0.02:.1f}초 분량)"
+        )
+
+    ffmpeg_cpu, passthrough_cpu = per_play[paths[0][0]], per_play[paths[1][0]]
+    print(f"미리 인코딩 (한 번): CPU {encode_cpu * 1000:.1f}ms")
+    print(f"재생당 절약: {(ffmpeg_cpu - passthrough_cpu) * 1000:.1f}ms ({ffmpeg_cpu / max(passthrough_cpu, 1e-9):.0f}배)")
+    saved = ffmpeg_cpu - passthrough_cpu
+    if saved > 0:
+        print(f"손익분기: {encode_cpu / saved:.1f}회 재생")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+TTS 텍스트 전처리 벤치마크
+이전 구현(이모티콘마다 str.replace, 반복 문자마다 정규식 검색)과
+현재 구현(미리 컴파일한 정규식 한 번)의 메시지당 처리 시간을 비교
+
+실행: python -m scripts.bench_tts_text [--messages N] [--repeat N]
+(DiscordSiri/src에서 실행)
+"""
+
+import argparse
+import random
+import re
+import timeit
+
+from cogs.voice import VoiceCog
+
+# 실제 채팅과 비슷한 예시 문장
+SAMPLE_MESSAGES = (
+    "안녕하세요 ㅋㅋㅋㅋ 오늘 뭐해요?",
+    "ㅠㅠㅠ 시험 망했어요 😭😭",
+    "이거 봐봐 https://example.com/watch?v=abc123 ㅎㅎㅎ",
+    "<:pepe:123456789012345678> 진짜 웃기다 🤣🤣🤣",
+    "ㄷㄷㄷㄷㄷㄷㄷ 무섭다",
+    "좋아요 👍 내일 봐요 👋",
+    "오늘 저녁은 치킨 🍗 먹을까요? ㅋㅋ",
+    "아니 그게 아니라 ㅜㅜ 다시 설명할게요",
+)
+
+
+def legacy_process_message_for_tts(cog: VoiceCog, text: str) -> str:
+    """정규식 한 번 처리로 바꾸기 전의 구현 (비교 기준)"""
+    text = re.sub(r'<a?:\w+:\d+>', '', text)
+    text = re.sub(r'https?://\S+', '링크', text)
+
+    for emoji, korean in cog.emoji_mapping.items():
+        text = text.replace(emoji, f' {korean} ')
+
+    for char, replacement in cog.repeat_char_mapping.items():
+        pattern = f'{char}{{2,}}'
+        if re.search(pattern, text):
+            matches = re.finditer(pattern, text)
+            for match in matches:
+                repeat_count = len(match.group())
+                if repeat_count <= 3:
+                    tts_text = replacement
+                elif repeat_count <= 6:
+                    tts_text = replacement + ' ' + replacement
+                else:
+                    tts_text = replacement + ' ' + replacement + ' ' + replacement
+                text = text.replace(match.group(), tts_text, 1)
+
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def random_message(rng: random.Random, cog: VoiceCog, max_tokens: int = 12) -> str:
+    """이모티콘, 반복 자모, 이모티콘 변형 선택자, URL, 커스텀 이모티콘을 섞은 임의 문장"""
+    emojis = list(cog.emoji_mapping)
+    jamo = list(cog.repeat_char_mapping)
+    parts = []
+    for _ in range(rng.randint(0, max_tokens)):
+        kind = rng.random()
+        if kind < 0.3:
+            parts.append(rng.choice(emojis))
+        elif kind < 0.55:
+            parts.append(rng.choice(jamo) * rng.randint(1, 9))
+        elif kind < 0.6:
+            parts.append("\ufe0f")
+        elif kind < 0.65:
+            parts.append(f"https://example.com/{rng.randint(0, 999)}")
+        elif kind < 0.7:
+            parts.append(f"<{'a' if rng.random() < 0.5 else ''}:emoji:{rng.randint(10**17, 10**18)}>")
+        else:
+            parts.append(rng.choice(("안녕", "하세요", "오늘", "a", "!", "?", "  ", "\n", "ㄱ", "ㅋ하")))
+        if rng.random() < 0.5:
+            parts.append(" ")
+    return "".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="측정에 쓸 메시지 수 (예시 + 임의 문장)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args()
+
+    cog = VoiceCog(None)
+    try:
+        rng = random.Random(0)
+        messages = list(SAMPLE_MESSAGES) * (args.messages // (2 * len(SAMPLE_MESSAGES)) + 1)
+        messages += [random_message(rng, cog) for _ in range(args.messages // 2)]
+
+        # 결과가 다르면 속도 비교는 의미가 없음
+        for message in messages:
+            if legacy_process_message_for_tts(cog, message) != cog.process_message_for_tts(message):
+                raise SystemExit(f"이전 구현과 결과가 다릅니다: {message!r}")
+
+        results = {}
+        for name, func in (
+            ("이전 구현", lambda: [legacy_process_message_for_tts(cog, m) for m in messages]),
+            ("현재 구현", lambda: [cog.process_message_for_tts(m) for m in messages]),
+        ):
+            best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            results[name] = best
+            print(f"{name}: 메시지당 {best / len(messages) * 1e6:.1f}us ({len(messages)}개)")
+        print(f"속도 향상: {results['이전 구현'] / results['현재 구현']:.1f}배")
+    finally:
+        cog.tts_executor.shutdown(wait=False)
+        cog.tts_cache_executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+서킷 브레이커 모듈
+연속 실패가 일정 횟수를 넘은 외부 서비스 호출을 차단
+"""
+
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    - closed: 정상 상태, 호출 허용
+    - open: 연속 실패가 failure_threshold에 도달하면 차단 (호출 즉시 실패)
+
+    차단 해제는 호출하는 쪽의 복구 확인(probe) 성공 시 record_success로 이루어집니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+
+    def __init__(self, name: str, failure_threshold: int = 3):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+        # 누적 지표
+        self.total_failures = 0
+        self.trips = 0  # 차단된 횟수
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def record_success(self) -> None:
+        """호출 성공 기록 (차단 중이었다면 해제)"""
+        self.consecutive_failures = 0
+        if self.state == self.OPEN:
+            logger.info(f"서킷 브레이커 '{self.name}' 복구됨 (차단 {self.open_seconds():.0f}초)")
+            self.state = self.CLOSED
+            self.opened_at = None
+
+    def record_failure(self, error: Optional[BaseException] = None) -> bool:
+        """호출 실패 기록 (이번 실패로 차단되었으면 True)"""
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        if error is not None:
+            self.last_error = str(error) or error.__class__.__name__
+
+        if self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self.trips += 1
+            logger.warning(
+                f"서킷 브레이커 '{self.name}' 차단: 연속 {self.consecutive_failures}회 실패 "
+                f"(마지막 오류: {self.last_error})"
+            )
+            return True
+        return False
+
+    def open_seconds(self) -> float:
+        """차단된 지 경과한 시간 (초)"""
+        if self.opened_at is None:
+            return 0.0
+        return time.monotonic() - self.opened_at
+
+    def status(self) -> dict:
+        """상태 요약 반환"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "trips": self.trips,
+            "open_seconds": round(self.open_seconds()),
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,100 @@
+"""
+슬래시 명령어 동기화 모듈
+명령어 구조가 바뀌었을 때만 디스코드에 동기화 (전역 동기화는 요청 제한이 엄격함)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+
+def compute_tree_hash(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    """명령어 트리를 직렬화한 결과의 해시 (명령어 순서와 무관하게 같은 구조면 같은 값)"""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda data: (data.get("type", 1), data["name"]),
+    )
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class CommandSyncManager:
+    """
+    명령어 트리 해시 기반 동기화
+
+    마지막으로 동기화한 해시와 소요 시간을 state_path(JSON)에 저장하고,
+    해시가 같으면 동기화를 건너뜁니다. dev_guild_id가 있으면 전역 대신
+    해당 길드에만 동기화합니다 (길드 명령어는 즉시 반영되어 개발 중 반복에 적합).
+    """
+
+    def __init__(self, tree: app_commands.CommandTree, state_path: Path, dev_guild_id: Optional[int] = None):
+        self.tree = tree
+        self.state_path = Path(state_path)
+        self.dev_guild_id = dev_guild_id
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"명령어 동기화 기록을 읽지 못해 새로 동기화합니다: {e}")
+            return {}
+
+    def _save_state(self, state: dict) -> None:
+        # 임시 파일에 쓴 뒤 교체 (중간에 종료되어도 기록이 깨지지 않음)
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    async def sync(self, application_id: Optional[int], force: bool = False) -> Optional[int]:
+        """
+        명령어 구조가 바뀌었으면 동기화
+
+        Args:
+            application_id: 봇 애플리케이션 ID (다른 봇 토큰으로 실행하면 새로 동기화)
+            force: 해시와 관계없이 동기화
+
+        Returns:
+            동기화한 명령어 수 (변경이 없어 건너뛰면 None)
+        """
+        guild = discord.Object(id=self.dev_guild_id) if self.dev_guild_id else None
+        if guild is not None:
+            # 전역 명령어를 개발 길드 명령어로 복사해 즉시 반영
+            self.tree.copy_global_to(guild=guild)
+        scope = f"guild:{self.dev_guild_id}" if guild is not None else "global"
+        key = f"{application_id}:{scope}"
+
+        tree_hash = compute_tree_hash(self.tree, guild=guild)
+        state = self._load_state()
+        previous = state.get(key, {})
+        if not force and previous.get("hash") == tree_hash:
+            logger.info(
+                f"[Siri] 슬래시 명령어 변경 없음 ({scope}) - 동기화 생략 "
+                f"(약 {previous.get('seconds', 0.0):.1f}초 절약)"
+            )
+            return None
+
+        started = time.perf_counter()
+        synced = await self.tree.sync(guild=guild)
+        elapsed = time.perf_counter() - started
+
+        state[key] = {"hash": tree_hash, "seconds": round(elapsed, 3), "count": len(synced)}
+        try:
+            self._save_state(state)
+        except OSError as e:
+            logger.warning(f"명령어 동기화 기록 저장 실패 (다음 시작 시 다시 동기화): {e}")
+        logger.info(f"[Siri] 슬래시 명령어 {len(synced)}개 동기화 완료 ({scope}, {elapsed:.1f}초)")
+        return len(synced)
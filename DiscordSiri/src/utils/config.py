@@ -4,6 +4,7 @@
 """
 
 import os
+from typing import Optional
 
 class Config:
     """봇 설정 클래스"""
@@ -23,6 +24,12 @@ class Config:
     def get_database_path() -> str:
         return os.getenv("DATABASE_PATH", "./src/data/siri_bot.db")
     
+    @staticmethod
+    def get_dev_guild_id() -> Optional[int]:
+        """개발용 길드 ID (설정 시 슬래시 명령어를 전역 대신 이 길드에만 동기화)"""
+        value = os.getenv("DEV_GUILD_ID", "").strip()
+        return int(value) if value.isdigit() else None
+    
     @staticmethod
     def get_command_prefix() -> str:
         return os.getenv("COMMAND_PREFIX", "!")
@@ -32,6 +39,57 @@ class Config:
         """FFmpeg 실행 파일 경로 (TTS 음성 알림에 사용)"""
         return os.getenv("FFMPEG_PATH", "ffmpeg")
     
+    @staticmethod
+    def get_tts_opus_cache() -> bool:
+        """캐시된 TTS를 Ogg/Opus로 미리 인코딩해 둘지 여부 (FFmpeg libopus 필요)"""
+        return os.getenv("TTS_OPUS_CACHE", "0").lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def get_log_json() -> bool:
+        """파일 로그를 JSON Lines 형식으로 기록할지 여부"""
+        return os.getenv("LOG_JSON", "0").lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def get_log_rotate_when() -> Optional[str]:
+        """시간 기준 로그 파일 교체 주기 (예: midnight, 없으면 크기 기준 교체)"""
+        return os.getenv("LOG_ROTATE_WHEN") or None
+    
+    @staticmethod
+    def get_voice_enabled() -> bool:
+        """음성(TTS) 기능 사용 여부 (끄면 음성 Cog를 불러오지 않음)"""
+        return os.getenv("VOICE_ENABLED", "1").lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def get_tts_worker() -> bool:
+        """TTS 합성/Opus 인코딩을 별도 작업 프로세스에서 실행할지 여부"""
+        return os.getenv("TTS_WORKER", "0").lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def get_metrics_enabled() -> bool:
+        """명령어/DB/API/TTS 지표 수집 여부 (/메트릭, Prometheus 엔드포인트)"""
+        return os.getenv("METRICS_ENABLED", "0").lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def get_loop_slow_callbacks() -> bool:
+        """느린 콜백 기록 여부 (asyncio 디버그 모드를 켜므로 문제를 추적할 때만 사용)"""
+        return os.getenv("LOOP_SLOW_CALLBACKS", "0").lower() in ("1", "true", "yes", "on")
+    
+    @staticmethod
+    def get_metrics_port() -> Optional[int]:
+        """Prometheus 엔드포인트 포트 (METRICS_HOST에서만 열림, 없으면 엔드포인트를 열지 않음)"""
+        value = os.getenv("METRICS_PORT", "").strip()
+        return int(value) if value.isdigit() and int(value) > 0 else None
+    
+    @staticmethod
+    def get_tts_engine() -> str:
+        """기본 TTS 엔진 이름 (gtts, local, fake)"""
+        return os.getenv("TTS_ENGINE", "gtts").lower()
+    
+    @staticmethod
+    def get_local_tts_path() -> str:
+        """로컬 TTS 엔진이 사용할 오프라인 합성기 경로 (espeak-ng)"""
+        return os.getenv("LOCAL_TTS_PATH", "espeak-ng")
+    
     # 호환성을 위한 프로퍼티
     BOT_TOKEN = property(lambda self: Config.get_bot_token())
     DATABASE_PATH = property(lambda self: Config.get_database_path()) 
@@ -45,6 +103,11 @@ class Config:
     # 쿨다운 설정 (초 단위)
     ATTENDANCE_COOLDOWN = 24 * 60 * 60  # 24시간
     
+    # 리더보드 설정
+    LEADERBOARD_SIZE = 10  # 리더보드에 표시할 인원 수
+    LIVE_LEADERBOARD_INTERVAL = 60  # 자동 갱신 리더보드 최소 수정 간격 (초)
+    GLOBAL_LEADERBOARD_CONCURRENCY = 4  # 전체 리더보드 계산 시 길드별 순위 동시 조회 수
+    
     # 디스코드 색상 코드
     COLORS = {
         'success': 0x00ff00,    # 초록색
@@ -66,6 +129,33 @@ class Config:
         (70, 999): 1392431727292448922,   # 레전드 (70레벨 이상)
     }
     
+    # TTS 설정
+    TTS_LANGUAGE = 'ko'  # gTTS 언어 코드
+    TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024  # TTS 오디오 캐시 최대 용량 (50MB)
+    TTS_CACHE_MAX_TEXT_LENGTH = 30  # 디스크 캐시에 보관할 문장 최대 길이 (그 외는 메모리에서만 재생)
+    TTS_QUEUE_MAX_DEPTH = 10  # 길드별 TTS 대기열 최대 길이
+    TTS_QUEUE_DROP_POLICY = 'drop_oldest'  # 대기열이 가득 찼을 때: drop_oldest 또는 drop_newest
+    TTS_PLAYBACK_TIMEOUT = 30.0  # TTS 한 건의 최대 재생 시간 (초)
+    TTS_PREFETCH = 2  # 재생 중 미리 합성할 다음 대기열 항목 수
+    TTS_SYNTH_CONCURRENCY = 3  # 전체 길드 공통 TTS 동시 합성 수
+    TTS_FALLBACK_ENGINES = ('gtts', 'local')  # 선택한 엔진이 실패하면 순서대로 시도할 엔진
+    TTS_EXECUTOR_WORKERS = 4  # TTS 합성 전용 스레드 수 (기본 스레드 풀과 분리)
+    TTS_CACHE_WORKERS = 2  # TTS 캐시 저장/Opus 변환 전용 스레드 수 (합성 스레드와 분리)
+    TTS_SYNTH_TIMEOUT = 10.0  # TTS 합성 1회 최대 대기 시간 (초)
+    TTS_BREAKER_THRESHOLD = 3  # 엔진을 차단할 연속 실패 횟수
+    TTS_BREAKER_PROBE_INTERVAL = 30.0  # 차단된 엔진 복구 확인 간격 (초, 실패 시 두 배씩 증가)
+    TTS_BREAKER_PROBE_MAX_INTERVAL = 300.0  # 복구 확인 최대 간격 (초)
+    TTS_CHUNK_MAX_CHARS = 60  # 긴 메시지를 문장/절 단위로 나눠 합성할 조각 최대 길이
+    TTS_COALESCE_MAX_CHARS = 60  # 같은 작성자의 연속 메시지를 합쳐 읽을 최대 길이
+    TTS_DEDUP_WINDOW = 30.0  # 같은 문장을 다시 읽지 않을 시간 (초, 길드별)
+    TTS_USER_CHARS_PER_MINUTE = 300  # 사용자별 분당 읽을 최대 글자 수
+    TTS_WORKER_MAX_PENDING = 16  # 작업 프로세스에 동시에 보낼 최대 요청 수 (초과 시 대기)
+    TTS_WORKER_RESTART_MAX_DELAY = 30.0  # 작업 프로세스가 반복해서 죽을 때 최대 재시작 간격 (초)
+    
+    # 음성 연결 설정
+    VOICE_LINGER_SECONDS = 60.0  # 채널이 빈 뒤 퇴장까지 연결을 유지할 시간 (초)
+    VOICE_CONNECT_TIMEOUT = 15.0  # 음성 연결/채널 이동 최대 대기 시간 (초)
+    
     # 백업 설정
     BACKUP_ENABLED = True
     BACKUP_RETENTION_DAYS = 30  # 30일간 백업 보관
@@ -75,6 +165,26 @@ class Config:
     MAX_LEVEL = 100  # 최대 레벨 제한
     DATABASE_POOL_SIZE = 10  # 향후 확장 시
     
+    # 로깅 설정
+    LOG_MAX_BYTES = 10 * 1024 * 1024  # 로그 파일 교체 크기 (10MB)
+    LOG_BACKUP_COUNT = 5  # 보관할 이전 로그 파일 수
+    LOG_SAMPLE_RATES = {  # 자주 찍히는 INFO 로그는 N개 중 1개만 기록 (경고 이상은 모두 기록)
+        'utils.tts_queue': 10,  # TTS 메시지 읽음
+        'cogs.voice.tts': 10,  # TTS 생성 시도/완료
+    }
+    
+    # 이벤트 루프 모니터 설정
+    LOOP_LAG_INTERVAL = 0.5  # 스케줄링 지연 측정 간격 (초)
+    LOOP_LAG_WINDOW = 600  # 백분위수 계산에 쓰는 최근 표본 수 (0.5초 간격이면 5분)
+    LOOP_SLOW_CALLBACK_THRESHOLD = 0.1  # 이 시간(초) 이상 루프를 막은 콜백을 기록 (LOOP_SLOW_CALLBACKS=1일 때)
+    
+    # 메트릭 설정
+    METRICS_HOST = "127.0.0.1"  # Prometheus 엔드포인트 바인드 주소 (외부에 노출하지 않음)
+    
+    # 종료 설정
+    SHUTDOWN_TIMEOUT = 10.0  # 봇 종료 정리 작업 전체 제한 시간 (초)
+    SHUTDOWN_FAREWELL_TIMEOUT = 3.0  # 모든 길드 작별 인사 제한 시간 (초, 길드별이 아닌 전체)
+    
     # 레이트 리밋 설정 (남용 방지)
     COMMAND_COOLDOWN = 3  # 일반 명령어 쿨다운 (초)
     ATTENDANCE_COOLDOWN = 24 * 60 * 60  # 출석 쿨다운 (24시간)
@@ -9,7 +9,8 @@ import sqlite3
 import aiosqlite
 import logging
 from datetime import date, datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,11 +20,35 @@ class DatabaseManager:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # XP 변경 리스너 목록 - (길드 ID, 사용자 ID, 레벨, XP)를 전달받음
+        self._xp_listeners: List[Callable[[int, int, int, int], None]] = []
+        # 진행 중인 DB 작업 수 (종료 시 모두 끝날 때까지 대기)
+        self._inflight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+    
+    def add_xp_listener(self, listener: Callable[[int, int, int, int], None]):
+        """XP/레벨이 변경될 때 호출될 리스너 등록 (캐시 무효화 등)"""
+        if listener not in self._xp_listeners:
+            self._xp_listeners.append(listener)
+    
+    def remove_xp_listener(self, listener: Callable[[int, int, int, int], None]):
+        """XP 변경 리스너 해제"""
+        if listener in self._xp_listeners:
+            self._xp_listeners.remove(listener)
+    
+    def _notify_xp_change(self, guild_id: int, user_id: int, level: int, xp: int):
+        """커밋된 XP 변경을 리스너에 전달"""
+        for listener in list(self._xp_listeners):
+            try:
+                listener(guild_id, user_id, level, xp)
+            except Exception as e:
+                logger.error(f"XP 변경 리스너 실행 실패: {e}")
         
     async def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 # users 테이블 생성
                 await db.execute("""
                     CREATE TABLE IF NOT EXISTS users (
@@ -44,6 +69,39 @@ class DatabaseManager:
                     ON users(guild_id, level DESC)
                 """)
                 
+                # 자동 갱신 리더보드 메시지 위치 (재시작 후 복구용)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS live_leaderboards (
+                        guild_id INTEGER PRIMARY KEY,
+                        channel_id INTEGER NOT NULL,
+                        message_id INTEGER NOT NULL,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # 채널별 게시된 규칙 메시지 (수정 시 재전송 대신 edit 사용)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS rules_messages (
+                        channel_id INTEGER PRIMARY KEY,
+                        guild_id INTEGER NOT NULL,
+                        message_id INTEGER NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # 길드별 설정 (NULL이면 Config 기본값 사용)
+                await db.execute("""
+                    CREATE TABLE IF NOT EXISTS guild_settings (
+                        guild_id INTEGER PRIMARY KEY,
+                        auto_join INTEGER NOT NULL DEFAULT 0,
+                        tts_engine TEXT,
+                        xp_per_attendance INTEGER,
+                        role_levels TEXT,
+                        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
                 await db.commit()
                 logger.info("데이터베이스 초기화 완료")
                 
@@ -54,7 +112,7 @@ class DatabaseManager:
     async def get_user_data(self, user_id: int, guild_id: int) -> Optional[Dict[str, Any]]:
         """사용자 데이터 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 
                 cursor = await db.execute("""
@@ -72,13 +130,15 @@ class DatabaseManager:
     async def create_user(self, user_id: int, guild_id: int) -> bool:
         """새 사용자 생성"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
+            async with self._connect() as db:
+                cursor = await db.execute("""
                     INSERT OR IGNORE INTO users (user_id, guild_id, xp, level)
                     VALUES (?, ?, 0, 1)
                 """, (user_id, guild_id))
                 
                 await db.commit()
+                if cursor.rowcount > 0:
+                    self._notify_xp_change(guild_id, user_id, 1, 0)
                 return True
                 
         except Exception as e:
@@ -88,10 +148,10 @@ class DatabaseManager:
     async def update_user_xp(self, user_id: int, guild_id: int, xp_change: int) -> bool:
         """사용자 XP 업데이트"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 # 현재 XP 조회
                 cursor = await db.execute("""
-                    SELECT xp FROM users 
+                    SELECT xp, level FROM users 
                     WHERE user_id = ? AND guild_id = ?
                 """, (user_id, guild_id))
                 
@@ -110,6 +170,7 @@ class DatabaseManager:
                 """, (new_xp, user_id, guild_id))
                 
                 await db.commit()
+                self._notify_xp_change(guild_id, user_id, row[1], new_xp)
                 return True
                 
         except Exception as e:
@@ -135,7 +196,7 @@ class DatabaseManager:
             game_reference_time = kst_time - timedelta(hours=7)
             today = game_reference_time.date().isoformat()
             
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 # 사용자 데이터 조회
                 cursor = await db.execute("""
                     SELECT xp, level, last_attendance FROM users 
@@ -175,6 +236,7 @@ class DatabaseManager:
                     """, (new_level, user_id, guild_id))
                 
                 await db.commit()
+                self._notify_xp_change(guild_id, user_id, new_level, new_xp)
                 return True, old_level, new_level
                 
         except Exception as e:
@@ -184,7 +246,7 @@ class DatabaseManager:
     async def get_leaderboard(self, guild_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """리더보드 데이터 조회"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 db.row_factory = aiosqlite.Row
                 
                 cursor = await db.execute("""
@@ -202,10 +264,180 @@ class DatabaseManager:
             logger.error(f"리더보드 조회 실패: {e}")
             return []
     
+    async def set_live_leaderboard(self, guild_id: int, channel_id: int, message_id: int) -> bool:
+        """자동 갱신 리더보드 메시지 위치 저장"""
+        try:
+            async with self._connect() as db:
+                await db.execute("""
+                    INSERT INTO live_leaderboards (guild_id, channel_id, message_id)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(guild_id) DO UPDATE SET
+                        channel_id = excluded.channel_id,
+                        message_id = excluded.message_id,
+                        updated_at = CURRENT_TIMESTAMP
+                """, (guild_id, channel_id, message_id))
+                
+                await db.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"자동 갱신 리더보드 저장 실패: {e}")
+            return False
+    
+    async def get_live_leaderboards(self) -> List[Dict[str, Any]]:
+        """저장된 모든 자동 갱신 리더보드 메시지 위치 조회"""
+        try:
+            async with self._connect() as db:
+                db.row_factory = aiosqlite.Row
+                
+                cursor = await db.execute("""
+                    SELECT guild_id, channel_id, message_id FROM live_leaderboards
+                """)
+                
+                rows = await cursor.fetchall()
+                return [dict(row) for row in rows]
+                
+        except Exception as e:
+            logger.error(f"자동 갱신 리더보드 조회 실패: {e}")
+            return []
+    
+    async def delete_live_leaderboard(self, guild_id: int) -> bool:
+        """자동 갱신 리더보드 메시지 위치 삭제"""
+        try:
+            async with self._connect() as db:
+                await db.execute("""
+                    DELETE FROM live_leaderboards WHERE guild_id = ?
+                """, (guild_id,))
+                
+                await db.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"자동 갱신 리더보드 삭제 실패: {e}")
+            return False
+    
+    async def get_rules_message(self, channel_id: int) -> Optional[Dict[str, Any]]:
+        """채널에 게시된 규칙 메시지 정보 조회"""
+        try:
+            async with self._connect() as db:
+                db.row_factory = aiosqlite.Row
+                
+                cursor = await db.execute("""
+                    SELECT channel_id, guild_id, message_id, content_hash
+                    FROM rules_messages
+                    WHERE channel_id = ?
+                """, (channel_id,))
+                
+                row = await cursor.fetchone()
+                return dict(row) if row else None
+                
+        except Exception as e:
+            logger.error(f"규칙 메시지 조회 실패: {e}")
+            return None
+    
+    async def get_rules_messages(self) -> List[Dict[str, Any]]:
+        """게시된 모든 규칙 메시지 위치 조회"""
+        try:
+            async with self._connect() as db:
+                db.row_factory = aiosqlite.Row
+                
+                cursor = await db.execute("""
+                    SELECT channel_id, message_id FROM rules_messages
+                """)
+                
+                rows = await cursor.fetchall()
+                return [dict(row) for row in rows]
+                
+        except Exception as e:
+            logger.error(f"규칙 메시지 목록 조회 실패: {e}")
+            return []
+    
+    async def set_rules_message(self, channel_id: int, guild_id: int, message_id: int, content_hash: str) -> bool:
+        """채널에 게시된 규칙 메시지 정보 저장"""
+        try:
+            async with self._connect() as db:
+                await db.execute("""
+                    INSERT INTO rules_messages (channel_id, guild_id, message_id, content_hash)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(channel_id) DO UPDATE SET
+                        message_id = excluded.message_id,
+                        content_hash = excluded.content_hash,
+                        updated_at = CURRENT_TIMESTAMP
+                """, (channel_id, guild_id, message_id, content_hash))
+                
+                await db.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"규칙 메시지 저장 실패: {e}")
+            return False
+    
+    async def delete_rules_message(self, channel_id: int) -> bool:
+        """채널에 게시된 규칙 메시지 정보 삭제"""
+        try:
+            async with self._connect() as db:
+                await db.execute("""
+                    DELETE FROM rules_messages WHERE channel_id = ?
+                """, (channel_id,))
+                
+                await db.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"규칙 메시지 삭제 실패: {e}")
+            return False
+    
+    async def get_all_guild_settings(self) -> List[Dict[str, Any]]:
+        """모든 길드 설정 조회"""
+        try:
+            async with self._connect() as db:
+                db.row_factory = aiosqlite.Row
+                
+                cursor = await db.execute("""
+                    SELECT guild_id, auto_join, tts_engine, xp_per_attendance, role_levels
+                    FROM guild_settings
+                """)
+                
+                rows = await cursor.fetchall()
+                return [dict(row) for row in rows]
+                
+        except Exception as e:
+            logger.error(f"길드 설정 조회 실패: {e}")
+            return []
+    
+    async def set_guild_settings(
+        self,
+        guild_id: int,
+        auto_join: bool,
+        tts_engine: Optional[str],
+        xp_per_attendance: Optional[int],
+        role_levels: Optional[str]
+    ) -> bool:
+        """길드 설정 저장 (role_levels는 JSON 문자열)"""
+        try:
+            async with self._connect() as db:
+                await db.execute("""
+                    INSERT INTO guild_settings (guild_id, auto_join, tts_engine, xp_per_attendance, role_levels)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(guild_id) DO UPDATE SET
+                        auto_join = excluded.auto_join,
+                        tts_engine = excluded.tts_engine,
+                        xp_per_attendance = excluded.xp_per_attendance,
+                        role_levels = excluded.role_levels,
+                        updated_at = CURRENT_TIMESTAMP
+                """, (guild_id, int(auto_join), tts_engine, xp_per_attendance, role_levels))
+                
+                await db.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"길드 설정 저장 실패: {e}")
+            return False
+    
     async def reset_user_data(self, user_id: int, guild_id: int) -> bool:
         """사용자 데이터 초기화"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 await db.execute("""
                     UPDATE users 
                     SET xp = 0, level = 1, last_attendance = NULL, 
@@ -214,6 +446,7 @@ class DatabaseManager:
                 """, (user_id, guild_id))
                 
                 await db.commit()
+                self._notify_xp_change(guild_id, user_id, 1, 0)
                 return True
                 
         except Exception as e:
@@ -223,7 +456,7 @@ class DatabaseManager:
     async def set_user_xp(self, user_id: int, guild_id: int, new_xp: int) -> bool:
         """사용자 XP 직접 설정 (관리자용)"""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._connect() as db:
                 from utils.config import Config
                 new_level = Config.calculate_level_from_xp(new_xp)
                 
@@ -236,21 +469,55 @@ class DatabaseManager:
                 """, (safe_xp, new_level, user_id, guild_id))
                 
                 await db.commit()
+                self._notify_xp_change(guild_id, user_id, new_level, safe_xp)
                 return True
                 
         except Exception as e:
             logger.error(f"XP 설정 실패: {e}")
             return False
     
-    async def close(self):
-        """데이터베이스 연결 정리"""
-        # SQLite는 연결을 매번 열고 닫기 때문에 특별한 정리가 필요없음
+    @asynccontextmanager
+    async def _track(self) -> AsyncIterator[None]:
+        """진행 중인 DB 작업 수 추적 (종료 시 완료 대기용)"""
+        self._inflight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._idle.set()
+    
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        """추적되는 DB 연결 (작업마다 열고 닫음)"""
+        async with self._track():
+            async with aiosqlite.connect(self.db_path) as conn:
+                yield conn
+    
+    async def close(self, timeout: float = 5.0) -> bool:
+        """
+        데이터베이스 연결 정리
+        
+        연결은 작업마다 열고 닫으므로, 진행 중인 작업(쓰기, 백업)이 끝날 때까지만 기다립니다.
+        
+        Returns:
+            시간 안에 모든 작업이 끝났는지 여부
+        """
+        if self._inflight:
+            logger.info(f"진행 중인 DB 작업 {self._inflight}개 완료 대기 중...")
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"DB 작업 {self._inflight}개가 {timeout:g}초 안에 끝나지 않았습니다")
+                return False
         logger.info("데이터베이스 연결 정리 완료")
+        return True
     
     async def get_schema_version(self) -> int:
         """현재 데이터베이스 스키마 버전 확인"""
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
+            async with self._connect() as conn:
                 await conn.execute("""
                     CREATE TABLE IF NOT EXISTS schema_version (
                         version INTEGER PRIMARY KEY,
@@ -272,7 +539,7 @@ class DatabaseManager:
         
         # 버전 1: schema_version 테이블 생성
         if current_version < 1:
-            async with aiosqlite.connect(self.db_path) as conn:
+            async with self._connect() as conn:
                 await conn.execute("""
                     CREATE TABLE IF NOT EXISTS schema_version (
                         version INTEGER PRIMARY KEY,
@@ -309,7 +576,8 @@ class DatabaseManager:
                     with sqlite3.connect(backup_path) as dest_conn:
                         source_conn.backup(dest_conn, pages=100, progress=None)
 
-            await asyncio.to_thread(_backup_sqlite)
+            async with self._track():
+                await asyncio.to_thread(_backup_sqlite)
 
             logger.info(f"데이터베이스 백업 완료: {backup_path}")
             return str(backup_path)
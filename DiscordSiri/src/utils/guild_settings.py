@@ -0,0 +1,167 @@
+"""
+길드 설정 모듈
+guild_settings 테이블을 시작 시 한 번 읽어 메모리 스냅샷으로 제공
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Optional
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# 레벨 역할 구간: (시작 레벨, 끝 레벨, 역할 ID)
+RoleLevels = tuple[tuple[int, int, int], ...]
+
+# 설정이 없는 길드의 레벨 역할 (기존 Config.ROLE_LEVELS)
+DEFAULT_ROLE_LEVELS: RoleLevels = tuple(
+    sorted((min_level, max_level, role_id) for (min_level, max_level), role_id in Config.ROLE_LEVELS.items())
+)
+
+
+class GuildSettings:
+    """
+    한 길드의 설정 (읽기 전용으로 사용)
+
+    값이 None인 항목은 Config 기본값을 사용합니다.
+    여러 곳에서 같은 객체를 공유하므로 직접 수정하지 말고 replace()로 새 객체를 만듭니다.
+    """
+
+    __slots__ = ("auto_join", "tts_engine", "xp_per_attendance", "role_levels", "level_role_ids")
+
+    def __init__(
+        self,
+        auto_join: bool = False,
+        tts_engine: Optional[str] = None,
+        xp_per_attendance: Optional[int] = None,
+        role_levels: Optional[RoleLevels] = None,
+    ):
+        self.auto_join = auto_join
+        self.tts_engine = tts_engine
+        self.xp_per_attendance = xp_per_attendance
+        self.role_levels = role_levels
+        # 보유 역할 확인용 역할 ID 집합 (미리 계산)
+        self.level_role_ids = frozenset(role_id for _, _, role_id in self.get_role_levels())
+
+    def replace(self, **changes: Any) -> "GuildSettings":
+        """일부 값만 바꾼 새 설정 반환"""
+        values = {
+            "auto_join": self.auto_join,
+            "tts_engine": self.tts_engine,
+            "xp_per_attendance": self.xp_per_attendance,
+            "role_levels": self.role_levels,
+        }
+        values.update(changes)
+        return GuildSettings(**values)
+
+    def get_xp_per_attendance(self) -> int:
+        """출석 시 획득 XP"""
+        if self.xp_per_attendance is None:
+            return Config.XP_PER_ATTENDANCE
+        return self.xp_per_attendance
+
+    def get_role_levels(self) -> RoleLevels:
+        """레벨 역할 구간 목록"""
+        if self.role_levels is None:
+            return DEFAULT_ROLE_LEVELS
+        return self.role_levels
+
+    def get_role_for_level(self, level: int) -> Optional[int]:
+        """레벨에 맞는 역할 ID 반환"""
+        for min_level, max_level, role_id in self.get_role_levels():
+            if min_level <= level <= max_level:
+                return role_id
+        return None
+
+    def __repr__(self) -> str:
+        return (
+            f"<GuildSettings auto_join={self.auto_join} tts_engine={self.tts_engine} "
+            f"xp_per_attendance={self.xp_per_attendance} role_levels={self.role_levels}>"
+        )
+
+
+DEFAULT_SETTINGS = GuildSettings()
+
+
+class GuildSettingsStore:
+    """
+    길드 설정 저장소
+
+    - 시작 시 load()로 전체 설정을 한 번 읽어 스냅샷(길드 ID: GuildSettings)을 만듭니다.
+    - get()은 DB에 접근하지 않고 스냅샷에서 바로 반환합니다.
+    - update()는 DB에 저장한 뒤 스냅샷을 복사해 교체합니다 (copy-on-write).
+      읽는 쪽은 교체 전후 어느 한쪽의 완전한 스냅샷만 보게 됩니다.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self._snapshot: dict[int, GuildSettings] = {}
+        # 같은 길드 설정을 동시에 바꿀 때 변경 내용이 유실되지 않도록 직렬화
+        self._write_lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        """DB에서 모든 길드 설정 로드"""
+        snapshot: dict[int, GuildSettings] = {}
+        for row in await self.database.get_all_guild_settings():
+            try:
+                snapshot[row['guild_id']] = GuildSettings(
+                    auto_join=bool(row['auto_join']),
+                    tts_engine=row['tts_engine'],
+                    xp_per_attendance=row['xp_per_attendance'],
+                    role_levels=self._decode_role_levels(row['role_levels']),
+                )
+            except (TypeError, ValueError) as e:
+                logger.error(f"길드 {row['guild_id']} 설정 형식 오류 (기본값 사용): {e}")
+        self._snapshot = snapshot
+        logger.info(f"길드 설정 로드 완료: {len(snapshot)}개 길드")
+
+    def get(self, guild_id: int) -> GuildSettings:
+        """길드 설정 반환 (없으면 기본값)"""
+        return self._snapshot.get(guild_id, DEFAULT_SETTINGS)
+
+    def items(self) -> list[tuple[int, GuildSettings]]:
+        """현재 스냅샷의 (길드 ID, 설정) 목록"""
+        return list(self._snapshot.items())
+
+    async def update(self, guild_id: int, **changes: Any) -> bool:
+        """
+        길드 설정 변경 후 저장
+
+        Args:
+            guild_id: 길드 ID
+            **changes: 바꿀 항목 (auto_join, tts_engine, xp_per_attendance, role_levels)
+
+        Returns:
+            저장 성공 여부 (실패하면 스냅샷도 바뀌지 않음)
+        """
+        async with self._write_lock:
+            settings = self.get(guild_id).replace(**changes)
+            saved = await self.database.set_guild_settings(
+                guild_id,
+                settings.auto_join,
+                settings.tts_engine,
+                settings.xp_per_attendance,
+                self._encode_role_levels(settings.role_levels),
+            )
+            if not saved:
+                return False
+
+            snapshot = dict(self._snapshot)
+            snapshot[guild_id] = settings
+            self._snapshot = snapshot
+            return True
+
+    @staticmethod
+    def _encode_role_levels(role_levels: Optional[RoleLevels]) -> Optional[str]:
+        if role_levels is None:
+            return None
+        return json.dumps([list(entry) for entry in role_levels])
+
+    @staticmethod
+    def _decode_role_levels(raw: Optional[str]) -> Optional[RoleLevels]:
+        if raw is None:
+            return None
+        entries = json.loads(raw)
+        return tuple(sorted((int(lo), int(hi), int(role_id)) for lo, hi, role_id in entries))
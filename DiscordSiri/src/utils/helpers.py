@@ -170,6 +170,10 @@ class MessageCleanupManager:
 
         self._skip_ids = set(self._persistent_ids)
 
+    def backlog(self) -> int:
+        """삭제 대기 중인 메시지 수"""
+        return self._queue.qsize()
+
     def mark_persistent(self, message: discord.Message) -> None:
         setattr(message, "_siri_skip_cleanup", True)
         self._persistent_ids.add(message.id)
@@ -0,0 +1,141 @@
+"""
+로깅 설정 모듈
+로그 기록(파일/콘솔 쓰기)을 백그라운드 스레드로 넘기고, 파일 교체(rotation)와 샘플링을 적용
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """한 줄에 레코드 하나씩 JSON으로 출력 (로그 수집기용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    로거별 INFO 이하 로그 샘플링
+
+    rates의 값이 N이면 해당 로거(하위 로거 포함)의 INFO 이하 로그 N개 중 1개만 남깁니다.
+    WARNING 이상은 항상 남깁니다.
+    """
+
+    def __init__(self, rates: dict[str, int]):
+        super().__init__()
+        self.rates = {name: rate for name, rate in rates.items() if rate > 1}
+        # 로거 이름: 적용할 비율 (상위 로거 설정 검색 결과 캐시)
+        self._resolved: dict[str, int] = {}
+        self._counters: dict[str, int] = {}
+        self.dropped = 0
+
+    def _rate_for(self, name: str) -> int:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1
+            parts = name.split(".")
+            for i in range(len(parts), 0, -1):
+                configured = self.rates.get(".".join(parts[:i]))
+                if configured is not None:
+                    rate = configured
+                    break
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        rate = self._rate_for(record.name)
+        if rate == 1:
+            return True
+        count = self._counters.get(record.name, 0)
+        self._counters[record.name] = count + 1
+        if count % rate == 0:
+            return True
+        self.dropped += 1
+        return False
+
+
+def setup_logging(
+    log_path: Path,
+    level: int = logging.INFO,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    rotate_when: Optional[str] = None,
+    json_lines: bool = False,
+    sample_rates: Optional[dict[str, int]] = None,
+) -> Optional[logging.handlers.QueueListener]:
+    """
+    루트 로거를 큐 기반 비동기 로깅으로 설정
+
+    이벤트 루프 스레드에서는 레코드를 큐에 넣기만 하고,
+    파일/콘솔 쓰기는 QueueListener 스레드에서 처리합니다.
+    이미 핸들러가 설정되어 있으면 아무것도 하지 않습니다 (basicConfig와 같은 동작).
+
+    Args:
+        log_path: 로그 파일 경로
+        max_bytes: 파일 크기 기준 교체 한도 (rotate_when이 없을 때)
+        backup_count: 보관할 이전 로그 파일 수
+        rotate_when: 시간 기준 교체 주기 (예: 'midnight', TimedRotatingFileHandler의 when)
+        json_lines: 파일 로그를 JSON Lines로 기록
+        sample_rates: 로거 이름: N (INFO 이하를 N개 중 1개만 기록)
+
+    Returns:
+        시작된 QueueListener (이미 설정되어 있었으면 None)
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if rotate_when:
+        file_handler: logging.Handler = logging.handlers.TimedRotatingFileHandler(
+            log_path, when=rotate_when, backupCount=backup_count, encoding="utf-8"
+        )
+    else:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+    file_handler.setFormatter(JSONLinesFormatter() if json_lines else logging.Formatter(LOG_FORMAT))
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # 호출 스레드에서는 큐에 넣기만 함 (큐 크기 제한 없음, 쓰기 지연으로 호출자가 막히지 않음)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    if sample_rates:
+        # 버릴 레코드는 큐에 넣기 전에 거름
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # 프로세스 종료 시 큐에 남은 레코드까지 기록
+    atexit.register(listener.stop)
+
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+    return listener
@@ -0,0 +1,167 @@
+"""
+이벤트 루프 모니터 모듈
+스케줄링 지연(lag)을 주기적으로 측정하고, 루프를 오래 막은 콜백을 기록
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import Counter, deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RollingPercentiles:
+    """최근 size개 표본의 백분위수 (조회할 때만 정렬)"""
+
+    def __init__(self, size: int):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> float:
+        """p 백분위수 (표본이 없으면 0)"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def max(self) -> float:
+        return max(self._samples, default=0.0)
+
+
+# asyncio 디버그 모드가 느린 콜백마다 남기는 경고 (base_events.BaseEventLoop._run_once)
+SLOW_CALLBACK_MESSAGE = "Executing %s took %.3f seconds"
+_TASK_REPR = re.compile(r"name='([^']*)' coro=<([^\s>(]+)")
+
+
+def describe_handle(handle_repr: str) -> str:
+    """
+    asyncio가 기록한 핸들 표현을 짧게 요약 (태스크면 태스크 이름과 코루틴)
+
+    예: "<Task pending name='Task-12' coro=<VoiceCog.on_message() running at ...>>"
+        → "Task-12: VoiceCog.on_message"
+    """
+    match = _TASK_REPR.search(handle_repr)
+    if match:
+        return f"{match.group(1)}: {match.group(2)}"
+    return handle_repr[:200]
+
+
+class SlowCallbackFilter(logging.Filter):
+    """asyncio 로거의 느린 콜백 경고를 가로채 모니터에 기록"""
+
+    def __init__(self, monitor: "LoopMonitor", passthrough_level: int):
+        super().__init__()
+        self.monitor = monitor
+        # 원래 로거 레벨 미만의 다른 asyncio 로그는 계속 걸러냄
+        self.passthrough_level = passthrough_level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.msg == SLOW_CALLBACK_MESSAGE and isinstance(record.args, tuple) and len(record.args) == 2:
+            handle_repr, elapsed = record.args
+            self.monitor._record_slow(describe_handle(str(handle_repr)), float(elapsed))
+            return False  # 모니터가 요약해서 다시 기록
+        return record.levelno >= self.passthrough_level
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연 및 느린 콜백 감시
+
+    - interval초마다 잠들었다 깨어나며, 예정 시각보다 늦게 깨어난 시간을 지연으로 기록합니다.
+    - slow_threshold가 0보다 크면 asyncio 디버그 모드의 느린 콜백 경고
+      (loop.slow_callback_duration)를 켜고, asyncio 로거의 해당 기록을 받아
+      어떤 핸들러였는지와 함께 기록합니다. 디버그 모드는 코루틴 추적 등 부담이 있어
+      필요할 때만 켭니다 (LOOP_SLOW_CALLBACKS=1).
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        window: int = 600,
+        slow_threshold: float = 0.1,
+        recent_slow: int = 20,
+    ):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.lag = RollingPercentiles(window)
+        # 최근 느린 콜백: (발생 시각, 설명, 소요 시간)
+        self.recent_slow: deque[tuple[float, str, float]] = deque(maxlen=recent_slow)
+        # 설명별 누적 발생 횟수
+        self.slow_counts: Counter[str] = Counter()
+        self.slow_total = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._filter: Optional[SlowCallbackFilter] = None
+        self._previous_level = logging.NOTSET
+
+    def start(self) -> None:
+        """현재 이벤트 루프 감시 시작"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._measure_lag(), name="siri-loop-monitor")
+        if self.slow_threshold > 0:
+            self._enable_slow_callbacks()
+
+    def stop(self) -> None:
+        """감시 중지 및 콜백 측정 해제"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._filter is not None:
+            asyncio_logger = logging.getLogger("asyncio")
+            asyncio_logger.removeFilter(self._filter)
+            asyncio_logger.setLevel(self._previous_level)
+            self._filter = None
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.set_debug(False)
+
+    async def _measure_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag.add(max(0.0, loop.time() - expected))
+
+    def _enable_slow_callbacks(self) -> None:
+        self._loop.slow_callback_duration = self.slow_threshold
+        self._loop.set_debug(True)
+        asyncio_logger = logging.getLogger("asyncio")
+        self._previous_level = asyncio_logger.level
+        # 로거 레벨이 경고를 막으면 필터까지 오지 않으므로 경고 레벨까지 열고 나머지는 필터에서 걸러냄
+        self._filter = SlowCallbackFilter(self, asyncio_logger.getEffectiveLevel())
+        asyncio_logger.addFilter(self._filter)
+        if asyncio_logger.getEffectiveLevel() > logging.WARNING:
+            asyncio_logger.setLevel(logging.WARNING)
+
+    def _record_slow(self, description: str, elapsed: float) -> None:
+        self.recent_slow.append((time.time(), description, elapsed))
+        self.slow_counts[description] += 1
+        self.slow_total += 1
+        logger.warning(f"이벤트 루프 차단: {description} ({elapsed * 1000:.0f}ms)")
+
+    def metrics(self) -> dict:
+        """지연 백분위수(ms) 및 느린 콜백 요약"""
+        return {
+            "samples": len(self.lag),
+            "p50_ms": round(self.lag.percentile(50) * 1000, 1),
+            "p95_ms": round(self.lag.percentile(95) * 1000, 1),
+            "p99_ms": round(self.lag.percentile(99) * 1000, 1),
+            "max_ms": round(self.lag.max() * 1000, 1),
+            "slow_total": self.slow_total,
+            "slow_recent": [
+                {"at": at, "callback": description, "ms": round(elapsed * 1000)}
+                for at, description, elapsed in reversed(self.recent_slow)
+            ],
+            "slow_top": self.slow_counts.most_common(3),
+        }
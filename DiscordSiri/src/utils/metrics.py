@@ -0,0 +1,378 @@
+"""
+메트릭 모듈
+명령어, DB, 디스코드 API, TTS, 메시지 정리 지표를 모아 Prometheus 텍스트 형식으로 제공
+
+METRICS_ENABLED가 꺼져 있으면 계측 코드를 아예 설치하지 않고,
+직접 기록하는 곳도 `if metrics.enabled:` 검사 한 번만 하므로 비용이 거의 없습니다.
+"""
+
+import bisect
+import contextvars
+import functools
+import inspect
+import logging
+import math
+import re
+import time
+from typing import Any, Callable, Optional
+
+import aiohttp
+import discord
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+# 지연 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 텍스트 형식의 숫자 (NaN과 무한대는 정해진 표기 사용)"""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return f"{value:g}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """구간 상한으로 근사한 분위수 (마지막 구간이면 최댓값)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class MetricsRegistry:
+    """
+    카운터/히스토그램/게이지 저장소
+
+    지표 이름별로 라벨 조합마다 값을 따로 보관합니다.
+    게이지는 값을 저장하지 않고 내보낼 때 콜백을 호출해 계산합니다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._help: dict[str, tuple[str, str]] = {}  # 이름: (종류, 설명)
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """카운터 증가"""
+        series = self._counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """히스토그램에 소요 시간 기록"""
+        series = self._histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(seconds)
+
+    def gauge(self, name: str, callback: Callable[[], float], help_text: str = "") -> None:
+        """내보낼 때 계산할 게이지 등록"""
+        self._gauges[name] = callback
+        if help_text:
+            self.describe(name, "gauge", help_text)
+
+    def counters(self, name: str) -> dict[LabelKey, float]:
+        return self._counters.get(name, {})
+
+    def histograms(self, name: str) -> dict[LabelKey, Histogram]:
+        return self._histograms.get(name, {})
+
+    def top(self, name: str, limit: int = 5) -> list[tuple[str, Histogram]]:
+        """히스토그램을 호출 수 순으로 정렬 (라벨 값을 ' · '로 이어 붙인 이름과 함께)"""
+        series = sorted(self.histograms(name).items(), key=lambda item: item[1].count, reverse=True)
+        return [(" · ".join(value for _, value in key) or name, histogram) for key, histogram in series[:limit]]
+
+    def counter_total(self, name: str, **labels: Any) -> float:
+        """주어진 라벨이 모두 일치하는 카운터 값의 합"""
+        wanted = set(_label_key(labels))
+        return sum(value for key, value in self.counters(name).items() if wanted <= set(key))
+
+    def gauge_value(self, name: str) -> Optional[float]:
+        callback = self._gauges.get(name)
+        if callback is None:
+            return None
+        try:
+            return float(callback())
+        except Exception:
+            return None
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        lines: list[str] = []
+
+        def header(name: str, default_kind: str) -> None:
+            kind, help_text = self._help.get(name, (default_kind, ""))
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(self._counters.items()):
+            header(name, "counter")
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        for name, series in sorted(self._histograms.items()):
+            header(name, "histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels(key, f'le="{_format_value(bound)}"')
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                bucket_labels = _format_labels(key, 'le="+Inf"')
+                lines.append(f"{name}_bucket{bucket_labels} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+
+        for name, callback in sorted(self._gauges.items()):
+            try:
+                value = float(callback())
+            except Exception as e:
+                logger.debug(f"게이지 {name} 계산 실패: {e}")
+                continue
+            header(name, "gauge")
+            lines.append(f"{name} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 레지스트리 (enable_metrics 전까지는 꺼져 있음)
+metrics = MetricsRegistry()
+
+# 현재 요청 중인 REST 경로 (429 응답을 경로별로 집계할 때 사용)
+_current_route: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("siri_current_route", default=None)
+
+_API_PREFIX_PATTERN = re.compile(r"^/api(/v\d+)?")
+_ID_PATTERN = re.compile(r"/\d{5,}")
+
+
+# 명령어 처리 시작 시각을 담아 둘 Interaction.extras 키
+_COMMAND_STARTED_KEY = "siri_metrics_started"
+
+
+class MetricsCommandTree(app_commands.CommandTree):
+    """
+    슬래시 명령어별 호출 수와 처리 시간을 기록하는 명령어 트리
+
+    discord.py의 공개 확장 지점만 사용합니다.
+    interaction_check에서 시작 시각을 남기고, 성공은 app_command_completion 이벤트,
+    실패는 on_error에서 기록합니다 (성공 리스너는 enable_metrics에서 등록).
+    """
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if metrics.enabled:
+            interaction.extras[_COMMAND_STARTED_KEY] = time.perf_counter()
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError) -> None:
+        if metrics.enabled:
+            _record_command(interaction, "error")
+        await super().on_error(interaction, error)
+
+
+def _record_command(interaction: discord.Interaction, status: str) -> None:
+    command = interaction.command
+    name = command.qualified_name if command is not None else "unknown"
+    started = interaction.extras.pop(_COMMAND_STARTED_KEY, None)
+    if started is not None:
+        metrics.observe("siri_command_seconds", time.perf_counter() - started, command=name)
+    metrics.inc("siri_commands_total", command=name, status=status)
+
+
+async def _on_app_command_completion(interaction: discord.Interaction, command) -> None:
+    _record_command(interaction, "ok")
+
+
+def _instrument_database(database) -> None:
+    """DatabaseManager의 공개 async 메서드를 감싸 호출 수/시간 기록"""
+    for name, method in inspect.getmembers(type(database), inspect.iscoroutinefunction):
+        if name.startswith("_"):
+            continue
+
+        def wrap(func: Callable, method_name: str) -> Callable:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    metrics.observe("siri_db_seconds", time.perf_counter() - started, method=method_name)
+            return wrapper
+
+        setattr(database, name, wrap(getattr(database, name), name))
+
+
+def _instrument_http(http) -> None:
+    """디스코드 REST 요청을 경로(템플릿)별로 기록"""
+    original_request = http.request
+
+    @functools.wraps(original_request)
+    async def request(route, **kwargs):
+        label = f"{route.method} {route.path}"
+        token = _current_route.set(label)
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            return await original_request(route, **kwargs)
+        except discord.HTTPException as e:
+            status = str(e.status)
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            _current_route.reset(token)
+            metrics.observe("siri_discord_request_seconds", time.perf_counter() - started, route=label)
+            metrics.inc("siri_discord_requests_total", route=label, status=status)
+
+    http.request = request
+
+
+def create_http_trace() -> aiohttp.TraceConfig:
+    """
+    디스코드 HTTP 세션 추적 설정 (봇 생성 시 http_trace로 전달)
+
+    discord.py는 429를 받으면 내부에서 기다렸다가 재시도하므로 request() 결과로는 보이지 않습니다.
+    실제로 받은 응답마다 호출되는 aiohttp 추적 콜백에서 429를 세므로
+    하위 요청 제한(sub-ratelimit)이나 재시도 중 받은 429도 빠짐없이 기록됩니다.
+    """
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_end(session, context, params: aiohttp.TraceRequestEndParams) -> None:
+        if not metrics.enabled or params.response.status != 429:
+            return
+        # request() 안에서 보낸 요청이면 경로 템플릿, 아니면 ID를 지운 URL 경로
+        route = _current_route.get()
+        if route is None:
+            path = _ID_PATTERN.sub("/{id}", _API_PREFIX_PATTERN.sub("", params.url.path))
+            route = f"{params.method} {path}"
+        scope = params.response.headers.get("X-RateLimit-Scope", "unknown")
+        metrics.inc("siri_discord_ratelimited_total", route=route, scope=scope)
+
+    trace.on_request_end.append(on_request_end)
+    return trace
+
+
+def enable_metrics(bot) -> None:
+    """
+    메트릭 수집 시작 (setup_hook에서 DB 생성 후 호출)
+
+    명령어 트리는 봇 생성 시 MetricsCommandTree로, 429 집계를 위해
+    http_trace는 create_http_trace()로 지정되어 있어야 합니다.
+    """
+    if metrics.enabled:
+        return
+    metrics.enabled = True
+
+    metrics.describe("siri_commands_total", "counter", "슬래시 명령어 호출 수")
+    metrics.describe("siri_command_seconds", "histogram", "슬래시 명령어 처리 시간")
+    metrics.describe("siri_db_seconds", "histogram", "DatabaseManager 메서드 처리 시간")
+    metrics.describe("siri_discord_requests_total", "counter", "디스코드 REST 요청 수")
+    metrics.describe("siri_discord_request_seconds", "histogram", "디스코드 REST 요청 시간 (재시도 포함)")
+    metrics.describe("siri_discord_ratelimited_total", "counter", "디스코드 REST 429 응답 수 (재시도 포함)")
+    metrics.describe("siri_tts_synthesis_seconds", "histogram", "TTS 합성 시간")
+    metrics.describe("siri_tts_synthesis_failures_total", "counter", "TTS 합성 실패 수")
+    metrics.describe("siri_tts_playback_seconds", "histogram", "TTS 재생 시간")
+
+    bot.add_listener(_on_app_command_completion, "on_app_command_completion")
+    if bot.db is not None:
+        _instrument_database(bot.db)
+    _instrument_http(bot.http)
+
+    metrics.gauge(
+        "siri_cleanup_backlog", bot.cleanup_manager.backlog, "삭제 대기 중인 봇 메시지 수"
+    )
+    metrics.gauge("siri_gateway_latency_seconds", lambda: bot.latency, "게이트웨이 하트비트 지연")
+    loop_monitor = getattr(bot, "loop_monitor", None)
+    if loop_monitor is not None:
+        metrics.gauge(
+            "siri_loop_lag_p99_seconds", lambda: loop_monitor.lag.percentile(99), "이벤트 루프 지연 p99"
+        )
+    logger.info("메트릭 수집 활성화")
+
+
+class MetricsServer:
+    """Prometheus 수집용 로컬 HTTP 엔드포인트 (GET /metrics)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9108):
+        self.host = host
+        self.port = port
+        self._runner = None
+
+    async def start(self) -> None:
+        # 메트릭을 켠 경우에만 필요하므로 사용할 때 불러옴
+        from aiohttp import web
+
+        async def handle_metrics(request: web.Request) -> web.Response:
+            return web.Response(
+                text=metrics.render_prometheus(), content_type="text/plain", charset="utf-8",
+                headers={"X-Content-Type-Options": "nosniff"},
+            )
+
+        app = web.Application()
+        app.router.add_get("/metrics", handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"메트릭 엔드포인트 시작: http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,55 @@
+"""
+시작 시간 측정 모듈
+모듈 import, DB 초기화, Cog 로드, 명령어 동기화, 첫 READY까지의 소요 시간을 기록
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    시작 단계별 소요 시간 기록
+
+    측정은 로깅 설정 전(import 시점)에도 할 수 있도록 값만 모아 두고,
+    report()에서 한 번에 로그로 남깁니다.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        # (단계 이름, 소요 시간) 기록 순서대로
+        self.steps: list[tuple[str, float]] = []
+        self.reported = False
+
+    def record(self, name: str, seconds: float) -> None:
+        """단계 소요 시간 기록"""
+        self.steps.append((name, seconds))
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """with 블록의 소요 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def elapsed(self) -> float:
+        """측정 시작 후 경과 시간 (초)"""
+        return time.perf_counter() - self.started_at
+
+    def report(self, title: str = "시작 시간 보고") -> Optional[str]:
+        """기록된 단계를 로그로 남김 (처음 한 번만)"""
+        if self.reported:
+            return None
+        self.reported = True
+
+        lines = [f"[Siri] {title} (총 {self.elapsed() * 1000:.0f}ms)"]
+        lines.extend(f"  {seconds * 1000:8.1f}ms  {name}" for name, seconds in self.steps)
+        text = "\n".join(lines)
+        logger.info(text)
+        return text
@@ -0,0 +1,120 @@
+"""
+TTS 오디오 모듈
+합성된 음성을 디스코드 오디오 소스로 변환
+"""
+
+import io
+import subprocess
+from pathlib import Path
+from typing import IO, Optional
+
+import discord
+from discord.oggparse import OggStream
+
+from utils.config import Config
+
+
+def transcode_to_opus(data: bytes, timeout: float = 30.0) -> bytes:
+    """
+    오디오 데이터를 Ogg/Opus(48kHz, 20ms 프레임)로 변환 (동기 함수, 스레드에서 호출)
+
+    디스코드 음성 패킷과 같은 형식으로 한 번만 인코딩해 두면
+    재생할 때 디코딩/재인코딩 없이 패킷을 그대로 전송할 수 있습니다.
+    """
+    result = subprocess.run(
+        [
+            Config.get_ffmpeg_path(),
+            "-hide_banner", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-map_metadata", "-1",
+            "-c:a", "libopus",
+            "-b:a", "64k",
+            "-ar", "48000",
+            "-ac", "2",
+            "-frame_duration", "20",
+            "-application", "voip",
+            "-f", "ogg",
+            "pipe:1",
+        ],
+        input=data,
+        capture_output=True,
+        timeout=timeout,
+        check=True,
+    )
+    if not result.stdout:
+        raise ValueError("Opus 변환 결과가 비어있습니다")
+    return result.stdout
+
+
+class OggOpusSource(discord.AudioSource):
+    """
+    미리 인코딩된 Ogg/Opus를 FFmpeg 없이 패킷 단위로 읽는 오디오 소스
+
+    FFmpegOpusAudio(codec='copy')와 같은 방식이지만 프로세스를 띄우지 않습니다.
+    """
+
+    # Ogg/Opus 헤더 패킷 (음성 데이터가 아님)
+    _HEADER_MAGICS = (b"OpusHead", b"OpusTags")
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+        self._packets = OggStream(stream).iter_packets()
+
+    def read(self) -> bytes:
+        for packet in self._packets:
+            if packet.startswith(self._HEADER_MAGICS):
+                continue
+            return packet
+        return b""
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        stream = getattr(self, "_stream", None)
+        if stream is not None:
+            stream.close()
+            self._stream = None
+
+
+class TTSAudio:
+    """
+    재생 준비된 TTS 오디오
+
+    캐시된 파일(path) 또는 메모리 버퍼(data) 중 하나를 가지며,
+    메모리 버퍼는 임시 파일 없이 FFmpeg 표준 입력(pipe)으로 전달합니다.
+    fmt가 'opus'이면 미리 인코딩된 Ogg/Opus로 보고 FFmpeg 없이 재생합니다.
+    """
+
+    __slots__ = ("path", "data", "fmt")
+
+    def __init__(self, *, path: Optional[Path] = None, data: Optional[bytes] = None, fmt: str = "mp3"):
+        if path is None and data is None:
+            raise ValueError("path 또는 data 중 하나는 필요합니다")
+        self.path = path
+        self.data = data
+        self.fmt = fmt
+
+    @property
+    def size(self) -> int:
+        """오디오 크기 (바이트)"""
+        if self.data is not None:
+            return len(self.data)
+        return self.path.stat().st_size if self.path is not None else 0
+
+    def create_source(self) -> discord.AudioSource:
+        """디스코드 재생용 오디오 소스 생성 (재생할 때마다 새로 생성해야 함)"""
+        if self.fmt == "opus":
+            # 미리 인코딩된 Opus는 FFmpeg 없이 패킷을 그대로 전송
+            if self.path is not None:
+                return OggOpusSource(open(self.path, "rb"))
+            return OggOpusSource(io.BytesIO(self.data))
+
+        executable = Config.get_ffmpeg_path()
+        if self.path is not None:
+            return discord.FFmpegPCMAudio(str(self.path), executable=executable)
+        return discord.FFmpegPCMAudio(io.BytesIO(self.data), pipe=True, executable=executable)
+
+    def __repr__(self) -> str:
+        where = self.path.name if self.path is not None else "memory"
+        return f"<TTSAudio {self.fmt} {where} {self.size}B>"
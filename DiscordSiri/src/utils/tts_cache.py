@@ -0,0 +1,160 @@
+"""
+TTS 오디오 캐시 모듈
+(정규화된 텍스트, 언어, 엔진) 해시를 키로 사용하는 디스크 캐시
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTSCache:
+    """
+    크기 제한이 있는 LRU 방식의 TTS 오디오 디스크 캐시
+
+    - 파일 이름은 콘텐츠 키(sha256)이므로 같은 문장은 한 번만 합성됩니다.
+    - 인덱스는 메모리에 유지하며, 총 바이트 수가 한도를 넘으면 오래 사용하지 않은 파일부터 삭제합니다.
+    - 임시 파일에 쓴 뒤 os.replace로 교체하여 재생 중 불완전한 파일을 읽지 않도록 합니다.
+    - 합성 스레드와 이벤트 루프에서 함께 사용하므로 인덱스 접근은 락으로 보호합니다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        # 파일 이름: 크기 (앞쪽일수록 오래 사용하지 않음)
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        # 축출하지 않을 파일 이름 (고정 문구 등)
+        self._pinned: set[str] = set()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """캐시 키용 텍스트 정규화 (유니코드 NFC, 공백 정리)"""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    @classmethod
+    def make_key(cls, text: str, lang: str, engine: str) -> str:
+        """(정규화된 텍스트, 언어, 엔진) 해시 키 생성"""
+        raw = f"{engine}\0{lang}\0{cls.normalize_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _load_index(self) -> None:
+        """시작 시 디렉토리를 스캔하여 인덱스 구성 (수정 시각 순)"""
+        entries = []
+        for path in self.cache_dir.iterdir():
+            if not path.is_file():
+                continue
+            # 이전 실행에서 남은 임시 파일 정리
+            if path.suffix == ".tmp":
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+                continue
+            # 캐시 파일 이름은 <sha256>.<확장자>
+            if len(path.stem) != 64:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total_bytes += size
+
+        if entries:
+            logger.info(f"TTS 캐시 로드: {len(entries)}개 파일, {self._total_bytes / 1024:.1f} KB")
+        self._evict()
+
+    def get(self, key: str, suffix: str = ".mp3") -> Optional[Path]:
+        """캐시된 파일 경로 반환 (없으면 None)"""
+        name = key + suffix
+        with self._lock:
+            if name not in self._index:
+                self.misses += 1
+                return None
+
+            path = self.cache_dir / name
+            if not path.exists():
+                # 외부에서 삭제된 경우 인덱스에서 제거
+                self._total_bytes -= self._index.pop(name)
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(name)
+            self.hits += 1
+            return path
+
+    def put(self, key: str, data: bytes, suffix: str = ".mp3") -> Path:
+        """오디오 데이터를 원자적으로 저장하고 경로 반환"""
+        name = key + suffix
+        path = self.cache_dir / name
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            previous = self._index.pop(name, None)
+            if previous is not None:
+                self._total_bytes -= previous
+            self._index[name] = len(data)
+            self._total_bytes += len(data)
+            self._evict(keep=name)
+        return path
+
+    def pin(self, key: str, suffix: str = ".mp3") -> None:
+        """축출 대상에서 제외 (사전 준비된 고정 문구용)"""
+        with self._lock:
+            self._pinned.add(key + suffix)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """총 용량이 한도를 넘으면 오래된 파일부터 삭제 (락을 잡은 상태에서 호출)"""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        for name in list(self._index):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if name == keep or name in self._pinned:
+                continue
+
+            size = self._index.pop(name)
+            self._total_bytes -= size
+            try:
+                (self.cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"TTS 캐시 파일 삭제 실패 {name}: {e}")
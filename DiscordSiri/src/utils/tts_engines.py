@@ -0,0 +1,220 @@
+"""
+TTS 엔진 모듈
+음성 합성 백엔드(gTTS, 로컬 합성기, 테스트용 가짜 엔진)를 같은 인터페이스로 제공
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import io
+import math
+import shutil
+import struct
+import subprocess
+import wave
+import warnings
+from concurrent.futures import Executor
+from typing import Optional
+
+from utils.config import Config
+
+
+class TTSEngine:
+    """
+    TTS 엔진 기본 클래스
+
+    하위 클래스는 name, output_format, max_concurrency를 정하고
+    synthesize(동기, 스레드에서 호출) 또는 synthesize_async 중 하나를 구현합니다.
+    """
+
+    name = "base"
+    output_format = "mp3"  # 합성 결과 형식 (캐시 확장자로도 사용)
+    max_concurrency = 1  # 엔진별 동시 합성 수
+
+    def __init__(self):
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def is_available(self) -> bool:
+        """현재 환경에서 사용 가능한지 여부"""
+        return True
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        """텍스트를 오디오 바이트로 합성 (동기 함수)"""
+        raise NotImplementedError
+
+    async def synthesize_async(self, text: str, lang: str, executor: Optional[Executor] = None) -> bytes:
+        """
+        텍스트를 오디오 바이트로 합성 (기본 구현은 executor 스레드에서 synthesize 호출)
+
+        호출자가 시간 초과로 취소해도 스레드는 멈추지 않으므로, 동시 실행 슬롯은
+        스레드 작업이 실제로 끝날 때 반환합니다 (멈춘 호출 위에 새 호출이 쌓이지 않음).
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        try:
+            future = loop.run_in_executor(executor, self.synthesize, text, lang)
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(_release_when_done(semaphore))
+        return await asyncio.shield(future)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name} ({self.output_format})>"
+
+
+def _release_when_done(semaphore: asyncio.Semaphore):
+    """스레드 작업이 끝나면 슬롯 반환 (취소된 호출의 예외도 여기서 회수)"""
+    def callback(future: asyncio.Future) -> None:
+        semaphore.release()
+        if not future.cancelled():
+            future.exception()
+    return callback
+
+
+class GTTSEngine(TTSEngine):
+    """Google TTS (인터넷 연결 필요)"""
+
+    name = "gtts"
+    output_format = "mp3"
+    max_concurrency = 3
+
+    def __init__(self, timeout: Optional[float] = None):
+        super().__init__()
+        # 요청별 HTTP 시간 제한 (없으면 응답 없는 서버에서 스레드가 끝나지 않음)
+        self.timeout = Config.TTS_SYNTH_TIMEOUT if timeout is None else timeout
+
+    def is_available(self) -> bool:
+        return importlib.util.find_spec("gtts") is not None
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        # 선택적 의존성이므로 실제로 사용할 때 불러옴
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        # ResourceWarning 경고 억제 (gTTS 내부 세션 경고)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=ResourceWarning)
+            gTTS(text=text, lang=lang, slow=False, timeout=self.timeout).write_to_fp(buffer)
+
+        data = buffer.getvalue()
+        if not data:
+            raise ValueError("TTS 생성 실패 - 빈 오디오")
+        return data
+
+
+class LocalTTSEngine(TTSEngine):
+    """
+    설치된 오프라인 합성기(espeak-ng)를 사용하는 로컬 엔진
+
+    네트워크 없이 동작하므로 gTTS 장애 시 대체 엔진으로 사용합니다.
+    """
+
+    name = "local"
+    output_format = "wav"
+    max_concurrency = 2
+
+    def __init__(self, executable: Optional[str] = None, timeout: float = 15.0):
+        super().__init__()
+        self.executable = executable or Config.get_local_tts_path()
+        self.timeout = timeout
+
+    def is_available(self) -> bool:
+        return shutil.which(self.executable) is not None
+
+    def _command(self, lang: str) -> list[str]:
+        # 텍스트는 인자 대신 표준 입력으로 전달 (옵션으로 해석되지 않도록)
+        return [self.executable, "-v", lang, "--stdout", "--stdin"]
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        result = subprocess.run(
+            self._command(lang),
+            input=text.encode("utf-8"),
+            capture_output=True,
+            timeout=self.timeout,
+        )
+        return self._check_output(result.returncode, result.stdout, result.stderr)
+
+    async def synthesize_async(self, text: str, lang: str, executor: Optional[Executor] = None) -> bytes:
+        # 외부 프로세스는 비동기로 기다리므로 스레드가 필요 없음
+        async with self._get_semaphore():
+            process = await asyncio.create_subprocess_exec(
+                *self._command(lang),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(text.encode("utf-8")), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise RuntimeError(f"{self.executable} 합성 시간 초과")
+        return self._check_output(process.returncode, stdout, stderr)
+
+    def _check_output(self, returncode: Optional[int], stdout: bytes, stderr: bytes) -> bytes:
+        if returncode != 0:
+            raise RuntimeError(
+                f"{self.executable} 실패 (코드 {returncode}): "
+                f"{stderr.decode('utf-8', 'ignore').strip()[:200]}"
+            )
+        if not stdout:
+            raise ValueError("TTS 생성 실패 - 빈 오디오")
+        return stdout
+
+
+class FakeTTSEngine(TTSEngine):
+    """
+    테스트/벤치마크용 가짜 엔진
+
+    네트워크나 외부 프로그램 없이 텍스트에 따라 항상 같은 WAV(짧은 신호음)를 만듭니다.
+    """
+
+    name = "fake"
+    output_format = "wav"
+    max_concurrency = 8
+
+    SAMPLE_RATE = 16000
+    SECONDS_PER_CHAR = 0.05
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay  # 인위적인 합성 지연 (초)
+
+    async def synthesize_async(self, text: str, lang: str, executor: Optional[Executor] = None) -> bytes:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.synthesize(text, lang)
+
+    def synthesize(self, text: str, lang: str) -> bytes:
+        # 텍스트 해시로 음높이를 정해 같은 텍스트는 항상 같은 결과
+        digest = hashlib.sha256(f"{lang}\0{text}".encode("utf-8")).digest()
+        frequency = 300 + digest[0] * 2
+        frames = int(self.SAMPLE_RATE * self.SECONDS_PER_CHAR * max(1, len(text)))
+
+        samples = bytearray()
+        for i in range(frames):
+            value = int(8000 * math.sin(2 * math.pi * frequency * i / self.SAMPLE_RATE))
+            samples += struct.pack("<h", value)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.SAMPLE_RATE)
+            wav.writeframes(bytes(samples))
+        return buffer.getvalue()
+
+
+def create_tts_engines() -> dict[str, TTSEngine]:
+    """사용 가능한 모든 TTS 엔진 생성 (이름: 엔진)"""
+    engines: list[TTSEngine] = [GTTSEngine(), LocalTTSEngine(), FakeTTSEngine()]
+    return {engine.name: engine for engine in engines}
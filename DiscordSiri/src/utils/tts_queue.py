@@ -0,0 +1,380 @@
+"""
+TTS 재생 큐 모듈
+길드별 단일 소비자 큐로 TTS를 순서대로 재생
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+from utils.metrics import metrics
+from utils.tts_audio import TTSAudio
+
+logger = logging.getLogger(__name__)
+
+# 큐가 가득 찼을 때의 처리 방식
+DROP_OLDEST = "drop_oldest"  # 가장 오래된 항목을 버리고 새 항목 추가
+DROP_NEWEST = "drop_newest"  # 새 항목을 버림
+
+# 문장 경계 (종결 부호 뒤 공백 또는 줄바꿈)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。…~])\s+|\n+')
+# 절 경계 (쉼표, 세미콜론 등 뒤)
+_CLAUSE_BOUNDARY = re.compile(r'(?<=[,，;:])\s*')
+# 읽을 수 있는 글자 (없으면 앞 조각에 붙임)
+_READABLE = re.compile(r'[가-힣a-zA-Z0-9]')
+
+
+def split_tts_text(text: str, max_chars: int) -> list[str]:
+    """
+    긴 텍스트를 문장/절 경계에서 max_chars 이하 조각으로 나눔
+
+    조각을 따로 합성하면 첫 조각이 준비되는 즉시 재생을 시작할 수 있습니다.
+    경계가 없는 긴 문장은 공백 위치에서, 공백도 없으면 글자 수로 자릅니다.
+    """
+    text = text.strip()
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text] if text else []
+
+    pieces: list[str] = []
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        for clause in _CLAUSE_BOUNDARY.split(sentence):
+            clause = clause.strip()
+            while len(clause) > max_chars:
+                cut = clause.rfind(" ", 0, max_chars + 1)
+                if cut <= 0:
+                    cut = max_chars
+                pieces.append(clause[:cut].strip())
+                clause = clause[cut:].strip()
+            if clause:
+                pieces.append(clause)
+
+    # 짧은 조각은 한도 안에서 합치고, 읽을 글자가 없는 조각은 앞 조각에 붙임
+    chunks: list[str] = []
+    for piece in pieces:
+        if chunks and (
+            not _READABLE.search(piece)
+            or len(chunks[-1]) + 1 + len(piece) <= max_chars
+        ):
+            chunks[-1] = f"{chunks[-1]} {piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+def _consume_task_result(task: asyncio.Task) -> None:
+    """버려진 합성 작업의 예외를 회수 (미회수 예외 경고 방지)"""
+    if not task.cancelled():
+        task.exception()
+
+
+class TTSQueueItem:
+    """큐에 들어간 TTS 한 건"""
+
+    __slots__ = ("text", "label", "source", "enqueued_at", "done", "audio_tasks")
+
+    def __init__(
+        self,
+        text: str,
+        label: Optional[str] = None,
+        done: Optional[asyncio.Future] = None,
+        source: Optional[int] = None,
+    ):
+        self.text = text
+        self.label = label  # 로그용 표시 이름 (작성자 등)
+        self.source = source  # 같은 작성자의 연속 메시지 병합용 ID
+        self.enqueued_at = time.monotonic()
+        self.done = done  # 재생 완료를 기다리는 호출자가 있을 때만 사용
+        self.audio_tasks: list[asyncio.Task] = []  # 조각별 합성 작업 (재생 순서대로)
+
+    def resolve(self, played: bool) -> None:
+        if self.done is not None and not self.done.done():
+            self.done.set_result(played)
+
+    def release_audio(self) -> None:
+        """조각 합성 작업 정리 (재생 도중 끊겨 남은 조각은 합성을 취소)"""
+        for task in self.audio_tasks:
+            task.cancel()
+            task.add_done_callback(_consume_task_result)
+        self.audio_tasks = []
+
+    def discard(self) -> None:
+        """재생하지 않고 버림 (미리 합성 중이던 오디오도 폐기)"""
+        self.release_audio()
+        self.resolve(False)
+
+
+class GuildTTSQueue:
+    """
+    길드별 TTS 재생 큐
+
+    하나의 소비자 작업이 항목을 꺼내 합성하고, 재생 완료(after 콜백)를 기다린 뒤
+    바로 다음 항목을 재생합니다. 재생 중인지 주기적으로 확인(polling)하지 않습니다.
+    
+    현재 항목을 재생하는 동안 다음 prefetch개 항목의 합성을 미리 시작하며,
+    합성 동시 실행 수는 semaphore로 제한합니다 (재생 순서는 그대로 유지).
+    
+    chunk_chars보다 긴 텍스트는 문장/절 단위로 나누어 동시에 합성하고,
+    첫 조각이 준비되면 나머지를 기다리지 않고 바로 재생합니다.
+    
+    같은 작성자(source)의 짧은 메시지가 연달아 들어오면, 아직 합성을 시작하지 않은
+    마지막 항목에 이어 붙여 한 번에 읽습니다 (합친 길이 coalesce_chars 이하).
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        synthesize: Callable[[str], Awaitable[TTSAudio]],
+        get_voice_client: Callable[[], Optional[discord.VoiceClient]],
+        max_depth: int = 10,
+        drop_policy: str = DROP_OLDEST,
+        playback_timeout: float = 30.0,
+        prefetch: int = 0,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        chunk_chars: int = 0,
+        coalesce_chars: int = 0,
+    ):
+        if drop_policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"알 수 없는 drop_policy: {drop_policy}")
+
+        self.guild_id = guild_id
+        self._synthesize = synthesize
+        self._get_voice_client = get_voice_client
+        self.max_depth = max(1, max_depth)
+        self.drop_policy = drop_policy
+        self.playback_timeout = playback_timeout
+        self.prefetch = max(0, prefetch)
+        self._semaphore = semaphore
+        self.chunk_chars = chunk_chars
+        self.coalesce_chars = coalesce_chars
+
+        self._items: deque[TTSQueueItem] = deque()
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._stopped = False
+
+        # 큐 지표
+        self.enqueued = 0
+        self.played = 0
+        self.dropped = 0
+        self.failed = 0
+        self.max_depth_seen = 0
+        self.total_wait = 0.0  # 큐 대기 시간 합계 (초)
+        self._waited = 0  # 대기 시간이 기록된 항목 수
+        self.prefetched = 0  # 재생 시점에 이미 합성이 끝나 있던 항목 수
+        self.chunks = 0  # 합성한 조각 수
+        self.coalesced = 0  # 앞 항목에 병합된 메시지 수
+        self.total_first_audio = 0.0  # 차례가 된 뒤 첫 소리가 나기까지 걸린 시간 합계 (초)
+        self._first_audio_count = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, text: str, label: Optional[str] = None, source: Optional[int] = None) -> bool:
+        """TTS 항목 추가 (버려졌으면 False, 앞 항목에 병합되었으면 True)"""
+        if source is not None and self._coalesce(text, source):
+            return True
+        return self._put(TTSQueueItem(text, label, source=source))
+
+    def _coalesce(self, text: str, source: int) -> bool:
+        """같은 작성자의 대기 중인 마지막 항목에 이어 붙임 (병합했으면 True)"""
+        if not self._items or self.coalesce_chars <= 0:
+            return False
+        tail = self._items[-1]
+        if (
+            tail.source != source
+            or tail.audio_tasks  # 이미 합성을 시작한 항목은 바꾸지 않음
+            or len(tail.text) + 1 + len(text) > self.coalesce_chars
+        ):
+            return False
+        tail.text = f"{tail.text} {text}"
+        self.coalesced += 1
+        return True
+
+    async def speak(self, text: str) -> bool:
+        """TTS 항목을 추가하고 재생이 끝날 때까지 대기 (재생되었으면 True)"""
+        done = asyncio.get_running_loop().create_future()
+        if not self._put(TTSQueueItem(text, done=done)):
+            return False
+        return await done
+
+    def _put(self, item: TTSQueueItem) -> bool:
+        if self._stopped:
+            item.resolve(False)
+            return False
+
+        if len(self._items) >= self.max_depth:
+            self.dropped += 1
+            if self.drop_policy == DROP_NEWEST:
+                item.resolve(False)
+                return False
+            self._items.popleft().discard()
+
+        self._items.append(item)
+        self.enqueued += 1
+        self.max_depth_seen = max(self.max_depth_seen, len(self._items))
+        self._wakeup.set()
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(
+                self._worker_loop(), name=f"siri-tts-queue-{self.guild_id}"
+            )
+        return True
+
+    def clear(self) -> int:
+        """대기 중인 항목 모두 제거 (채널 퇴장 등, 미리 합성된 오디오도 폐기)"""
+        count = len(self._items)
+        while self._items:
+            self._items.popleft().discard()
+        return count
+
+    async def stop(self) -> None:
+        """소비자 작업 종료 및 대기 항목 정리"""
+        self._stopped = True
+        self.clear()
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def metrics(self) -> dict:
+        """큐 지표 반환"""
+        return {
+            "depth": len(self._items),
+            "enqueued": self.enqueued,
+            "played": self.played,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "max_depth": self.max_depth_seen,
+            "prefetched": self.prefetched,
+            "chunks": self.chunks,
+            "coalesced": self.coalesced,
+            "avg_wait_ms": round(self.total_wait / self._waited * 1000) if self._waited else 0,
+            "avg_first_audio_ms": (
+                round(self.total_first_audio / self._first_audio_count * 1000)
+                if self._first_audio_count else 0
+            ),
+        }
+
+    async def _worker_loop(self) -> None:
+        while not self._stopped:
+            if not self._items:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            item = self._items.popleft()
+            voice_client = self._get_voice_client()
+            if voice_client is None or not voice_client.is_connected():
+                # 음성 채널에 없으면 남은 항목도 의미 없음
+                item.discard()
+                self.clear()
+                continue
+
+            started = time.monotonic()
+            self.total_wait += started - item.enqueued_at
+            self._waited += 1
+            try:
+                self._start_synthesis(item)
+                # 현재 항목을 기다리는/재생하는 동안 다음 항목들도 합성
+                self._prefetch_next()
+                if item.audio_tasks and item.audio_tasks[0].done():
+                    self.prefetched += 1
+                played = await self._play_chunks(voice_client, item, started)
+                item.release_audio()
+                if played:
+                    self.played += 1
+                    if item.label:
+                        logger.info(f"TTS 메시지 읽음: {item.label} - {item.text[:50]}")
+                item.resolve(played)
+            except asyncio.CancelledError:
+                item.discard()
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"TTS 재생 중 오류: {e}")
+                item.discard()
+
+    async def _play_chunks(self, voice_client: discord.VoiceClient, item: TTSQueueItem, started: float) -> bool:
+        """조각을 순서대로 재생 (하나라도 재생했으면 True)"""
+        played = False
+        for task in item.audio_tasks:
+            try:
+                audio = await task
+            except ValueError as e:
+                # TTS 변환 불가능한 조각 (로그만 남기고 조용히 무시)
+                logger.debug(f"TTS 건너뜀 (ValueError): {e}")
+                continue
+            if not voice_client.is_connected():
+                break
+            if not played:
+                self.total_first_audio += time.monotonic() - started
+                self._first_audio_count += 1
+            await self._play(voice_client, audio)
+            played = True
+        return played
+
+    async def _synthesize_bounded(self, text: str) -> TTSAudio:
+        """동시 합성 수 제한 하에 합성"""
+        if self._semaphore is None:
+            return await self._synthesize(text)
+        async with self._semaphore:
+            return await self._synthesize(text)
+
+    def _start_synthesis(self, item: TTSQueueItem) -> None:
+        """항목의 모든 조각 합성을 시작 (이미 시작했으면 무시)"""
+        if item.audio_tasks:
+            return
+        chunks = split_tts_text(item.text, self.chunk_chars) or [item.text]
+        self.chunks += len(chunks)
+        item.audio_tasks = [
+            asyncio.create_task(self._synthesize_bounded(chunk)) for chunk in chunks
+        ]
+
+    def _prefetch_next(self) -> None:
+        """대기열 앞쪽 prefetch개 항목의 합성을 미리 시작"""
+        for index in range(min(self.prefetch, len(self._items))):
+            self._start_synthesis(self._items[index])
+
+    async def _play(self, voice_client: discord.VoiceClient, audio: TTSAudio) -> None:
+        """재생 시작 후 after 콜백으로 완료 통지를 받음"""
+        loop = asyncio.get_running_loop()
+        finished = loop.create_future()
+
+        def after_playing(error):
+            # 재생 스레드에서 호출되므로 이벤트 루프로 넘겨서 처리
+            def resolve():
+                if not finished.done():
+                    if error:
+                        finished.set_exception(error)
+                    else:
+                        finished.set_result(None)
+            loop.call_soon_threadsafe(resolve)
+
+        if voice_client.is_playing():
+            # 큐 밖에서 시작된 재생(종료 인사 등)은 중단
+            voice_client.stop()
+        voice_client.play(audio.create_source(), after=after_playing)
+        play_started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(finished, timeout=self.playback_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("TTS 재생 타임아웃")
+            voice_client.stop()
+        finally:
+            if metrics.enabled:
+                metrics.observe("siri_tts_playback_seconds", time.perf_counter() - play_started)
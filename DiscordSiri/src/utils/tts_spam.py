@@ -0,0 +1,113 @@
+"""
+TTS 도배 방지 모듈
+같은 문장 반복과 과도한 채팅을 TTS 큐에 넣기 전에 걸러냄
+"""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# 지문 계산용 정규식 (문장 부호/공백 제거, 같은 글자 반복 축약)
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+_REPEAT_PATTERN = re.compile(r'(.)\1+')
+
+
+class TTSSpamGuard:
+    """
+    길드별 중복 문장 차단 및 사용자별 글자 수 한도
+
+    - 최근 window초 안에 같은(또는 거의 같은) 문장이 있었으면 버립니다.
+      대소문자, 공백, 문장 부호, 같은 글자의 반복 횟수 차이는 무시합니다.
+    - 사용자마다 분당 chars_per_minute 글자까지만 읽습니다 (토큰 버킷).
+    """
+
+    # 버킷이 가득 찬 사용자 정리를 시작할 항목 수
+    _PRUNE_THRESHOLD = 1000
+
+    def __init__(self, window: float = 30.0, chars_per_minute: int = 300):
+        self.window = window
+        self.chars_per_minute = chars_per_minute
+        # 길드 ID: (지문: 마지막으로 본 시각), 오래된 순서
+        self._recent: dict[int, OrderedDict[str, float]] = {}
+        # (길드 ID, 사용자 ID): [남은 글자 수, 마지막 갱신 시각]
+        self._budgets: dict[tuple[int, int], list[float]] = {}
+
+        # 지표
+        self.duplicates = 0
+        self.over_budget = 0
+
+    @staticmethod
+    def fingerprint(text: str) -> str:
+        """중복 판정용 텍스트 지문"""
+        compact = _NON_WORD_PATTERN.sub('', text.lower())
+        return _REPEAT_PATTERN.sub(r'\1', compact)
+
+    def check(self, guild_id: int, user_id: int, text: str, now: Optional[float] = None) -> Optional[str]:
+        """
+        TTS로 읽어도 되는지 확인
+
+        Returns:
+            버려야 하면 그 이유, 읽어도 되면 None
+        """
+        now = time.monotonic() if now is None else now
+
+        if self._is_duplicate(guild_id, self.fingerprint(text), now):
+            self.duplicates += 1
+            return "최근에 읽은 문장과 중복"
+
+        if not self._consume_budget(guild_id, user_id, len(text), now):
+            self.over_budget += 1
+            return "사용자 글자 수 한도 초과"
+
+        return None
+
+    def _is_duplicate(self, guild_id: int, key: str, now: float) -> bool:
+        recent = self._recent.setdefault(guild_id, OrderedDict())
+
+        # 창을 벗어난 항목 정리 (오래된 순서로 정렬되어 있음)
+        while recent:
+            oldest_key, seen_at = next(iter(recent.items()))
+            if now - seen_at <= self.window:
+                break
+            del recent[oldest_key]
+
+        duplicate = key in recent
+        # 반복해서 붙여넣는 동안에는 계속 차단되도록 시각 갱신
+        recent[key] = now
+        recent.move_to_end(key)
+        return duplicate
+
+    def _consume_budget(self, guild_id: int, user_id: int, cost: int, now: float) -> bool:
+        if self.chars_per_minute <= 0:
+            return True
+
+        capacity = float(self.chars_per_minute)
+        rate = capacity / 60.0
+        bucket = self._budgets.get((guild_id, user_id))
+        if bucket is None:
+            if len(self._budgets) >= self._PRUNE_THRESHOLD:
+                self._prune_budgets(now, capacity, rate)
+            bucket = self._budgets[(guild_id, user_id)] = [capacity, now]
+
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens < cost:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - cost
+        return True
+
+    def _prune_budgets(self, now: float, capacity: float, rate: float) -> None:
+        """한도가 모두 회복된 사용자 항목 제거 (새로 만들어도 같은 상태)"""
+        for key, (tokens, updated) in list(self._budgets.items()):
+            if tokens + (now - updated) * rate >= capacity:
+                del self._budgets[key]
+
+    def forget_guild(self, guild_id: int) -> None:
+        """길드의 최근 문장 기록 삭제 (채널 퇴장 등)"""
+        self._recent.pop(guild_id, None)
+
+    def metrics(self) -> dict:
+        """차단 지표 반환"""
+        return {"duplicates": self.duplicates, "over_budget": self.over_budget}
@@ -0,0 +1,306 @@
+"""
+TTS 작업 프로세스 모듈
+음성 합성과 Opus 인코딩을 별도 프로세스에서 실행하여 게이트웨이 이벤트 루프(GIL)와 분리
+
+프로토콜 (표준 입출력, 프레임 단위):
+    [헤더 길이 4바이트][본문 길이 4바이트][헤더 JSON][본문]
+    요청 헤더: {"id", "engine", "text", "lang", "opus"} (본문 없음)
+    응답 헤더: {"id", "ok", "fmt", "error", "error_type"} (본문: 오디오 데이터)
+
+봇 프로세스에서는 TTSWorkerClient를 사용하고,
+작업 프로세스는 `python -m utils.tts_worker`로 실행됩니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+_FRAME_HEADER = struct.Struct(">II")
+
+# 작업 프로세스를 실행할 디렉터리 (utils 패키지를 찾을 수 있는 src)
+_SRC_DIR = Path(__file__).resolve().parent.parent
+
+
+def encode_frame(header: dict, payload: bytes = b"") -> bytes:
+    """헤더와 본문을 프레임 하나로 인코딩"""
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    return _FRAME_HEADER.pack(len(header_bytes), len(payload)) + header_bytes + payload
+
+
+def _read_frame_sync(stream: BinaryIO) -> Optional[tuple[dict, bytes]]:
+    """블로킹 스트림에서 프레임 하나 읽기 (EOF면 None)"""
+    prefix = stream.read(_FRAME_HEADER.size)
+    if len(prefix) < _FRAME_HEADER.size:
+        return None
+    header_len, payload_len = _FRAME_HEADER.unpack(prefix)
+    header = stream.read(header_len)
+    payload = stream.read(payload_len) if payload_len else b""
+    if len(header) < header_len or len(payload) < payload_len:
+        return None
+    return json.loads(header), payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Optional[tuple[dict, bytes]]:
+    """비동기 스트림에서 프레임 하나 읽기 (EOF면 None)"""
+    try:
+        header_len, payload_len = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+        header = await reader.readexactly(header_len)
+        payload = await reader.readexactly(payload_len) if payload_len else b""
+    except asyncio.IncompleteReadError:
+        return None
+    return json.loads(header), payload
+
+
+class TTSWorkerUnavailable(RuntimeError):
+    """작업 프로세스가 실행 중이 아니거나 처리 중에 종료됨 (엔진 장애와 구분)"""
+
+
+class TTSWorkerClient:
+    """
+    TTS 작업 프로세스 클라이언트
+
+    - 요청마다 ID를 붙여 보내고, 응답 순서와 관계없이 ID로 결과를 돌려줍니다.
+    - 동시에 처리 중인 요청은 max_pending개로 제한합니다 (초과 시 자리가 날 때까지 대기).
+    - 작업 프로세스가 종료되면 처리 중인 요청을 실패시키고 자동으로 다시 시작합니다.
+      연달아 죽으면 재시작 간격을 두 배씩 늘립니다 (최대 max_restart_delay초).
+    """
+
+    # 이 시간(초)보다 오래 살아 있던 프로세스가 죽으면 재시작 간격을 초기화
+    _STABLE_SECONDS = 30.0
+
+    def __init__(self, max_pending: int = 16, max_restart_delay: float = 30.0):
+        self.max_pending = max_pending
+        self.max_restart_delay = max_restart_delay
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._restart_task: Optional[asyncio.Task] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._slots = asyncio.Semaphore(max_pending)
+        self._start_lock = asyncio.Lock()
+        self._started_at = 0.0
+        self._restart_delay = 0.0
+        self._closing = False
+
+        # 지표
+        self.requests = 0
+        self.failures = 0
+        self.restarts = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        if self._process is None or self._process.returncode is not None:
+            return None
+        return self._process.pid
+
+    async def start(self) -> None:
+        """작업 프로세스 시작 (이미 실행 중이면 아무것도 하지 않음)"""
+        async with self._start_lock:
+            if self._closing or self.pid is not None:
+                return
+            if self._process is not None:
+                self.restarts += 1
+            self._process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "utils.tts_worker",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                cwd=str(_SRC_DIR),
+            )
+            self._started_at = time.monotonic()
+            self._reader_task = asyncio.create_task(
+                self._read_responses(self._process), name="siri-tts-worker-reader"
+            )
+            logger.info(f"TTS 작업 프로세스 시작 (PID {self._process.pid})")
+
+    async def synthesize(self, engine: str, text: str, lang: str, opus: bool = True) -> tuple[bytes, str]:
+        """
+        작업 프로세스에 합성 요청
+
+        Args:
+            opus: True면 재생 가능한 Ogg/Opus로 인코딩까지 요청 (실패 시 엔진 원본 형식)
+
+        Returns:
+            (오디오 데이터, 형식)
+
+        Raises:
+            ValueError: 합성할 수 없는 텍스트
+            RuntimeError: 합성 실패
+            TTSWorkerUnavailable: 작업 프로세스 종료 또는 재시작 대기 중
+        """
+        async with self._slots:
+            if self._restart_task is not None and not self._restart_task.done():
+                raise TTSWorkerUnavailable("TTS 작업 프로세스 재시작 대기 중")
+            if self.pid is None:
+                await self.start()
+            process = self._process
+            if process is None or process.stdin is None or self.pid is None:
+                raise TTSWorkerUnavailable("TTS 작업 프로세스가 실행 중이 아닙니다")
+
+            self._next_id += 1
+            request_id = self._next_id
+            future = asyncio.get_running_loop().create_future()
+            self._pending[request_id] = future
+            self.requests += 1
+            try:
+                process.stdin.write(encode_frame(
+                    {"id": request_id, "engine": engine, "text": text, "lang": lang, "opus": opus}
+                ))
+                await process.stdin.drain()
+                header, payload = await future
+            except (BrokenPipeError, ConnectionResetError) as e:
+                self.failures += 1
+                raise TTSWorkerUnavailable(f"TTS 작업 프로세스 연결 끊김: {e}") from e
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self._pending.pop(request_id, None)
+
+        if not header.get("ok"):
+            self.failures += 1
+            if header.get("error_type") == "ValueError":
+                raise ValueError(header.get("error") or "TTS 생성 실패")
+            raise RuntimeError(header.get("error") or "TTS 작업 프로세스 오류")
+        return payload, header["fmt"]
+
+    async def _read_responses(self, process: asyncio.subprocess.Process) -> None:
+        """응답을 읽어 요청 ID별로 전달 (프로세스가 끝날 때까지)"""
+        assert process.stdout is not None
+        try:
+            while True:
+                frame = await _read_frame(process.stdout)
+                if frame is None:
+                    break
+                header, payload = frame
+                future = self._pending.get(header.get("id"))
+                # 시간 초과 등으로 이미 포기한 요청의 응답은 버림
+                if future is not None and not future.done():
+                    future.set_result((header, payload))
+        finally:
+            returncode = await process.wait()
+            error = TTSWorkerUnavailable(f"TTS 작업 프로세스 종료 (코드 {returncode})")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            if not self._closing:
+                logger.warning(f"TTS 작업 프로세스가 종료되었습니다 (코드 {returncode}), 재시작 예약")
+                self._schedule_restart()
+
+    def _schedule_restart(self) -> None:
+        if self._restart_task is not None and not self._restart_task.done():
+            return
+        lifetime = time.monotonic() - self._started_at
+        if lifetime >= self._STABLE_SECONDS:
+            self._restart_delay = 0.0
+        else:
+            self._restart_delay = min(max(1.0, self._restart_delay * 2), self.max_restart_delay)
+        self._restart_task = asyncio.create_task(self._restart(self._restart_delay), name="siri-tts-worker-restart")
+
+    async def _restart(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            await self.start()
+        except Exception as e:
+            logger.error(f"TTS 작업 프로세스 재시작 실패: {e}")
+
+    async def close(self, timeout: float = 2.0) -> None:
+        """작업 프로세스 종료 (표준 입력을 닫고 기다린 뒤, 시간이 지나면 강제 종료)"""
+        self._closing = True
+        if self._restart_task is not None:
+            self._restart_task.cancel()
+        process = self._process
+        if process is None or process.returncode is not None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        logger.info("TTS 작업 프로세스 종료")
+
+    def metrics(self) -> dict:
+        """작업 프로세스 지표 반환"""
+        return {
+            "pid": self.pid,
+            "pending": len(self._pending),
+            "requests": self.requests,
+            "failures": self.failures,
+            "restarts": self.restarts,
+        }
+
+
+def _handle_request(engines: dict, header: dict) -> tuple[dict, bytes]:
+    """합성 요청 하나 처리 (작업 프로세스의 스레드에서 실행)"""
+    from utils.tts_audio import transcode_to_opus
+
+    response = {"id": header.get("id"), "ok": False}
+    try:
+        engine = engines.get(header["engine"])
+        if engine is None:
+            raise RuntimeError(f"알 수 없는 TTS 엔진: {header['engine']}")
+        data = engine.synthesize(header["text"], header["lang"])
+        fmt = engine.output_format
+        if header.get("opus"):
+            try:
+                data, fmt = transcode_to_opus(data), "opus"
+            except Exception as e:
+                logger.warning(f"Opus 변환 실패, {fmt.upper()}로 전달합니다: {e}")
+        response.update(ok=True, fmt=fmt)
+        return response, data
+    except Exception as e:
+        response.update(error=str(e) or e.__class__.__name__, error_type=e.__class__.__name__)
+        return response, b""
+
+
+def worker_main() -> None:
+    """작업 프로세스 진입점 (표준 입력의 요청을 스레드 풀에서 처리)"""
+    from utils.config import Config
+    from utils.tts_engines import create_tts_engines
+
+    # 프로토콜 전용 출력만 남기고, 라이브러리의 print 등은 모두 stderr로 보냄
+    output = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - tts_worker - %(levelname)s - %(message)s',
+        stream=sys.stderr,
+    )
+
+    engines = create_tts_engines()
+    write_lock = threading.Lock()
+
+    def run(header: dict) -> None:
+        response, payload = _handle_request(engines, header)
+        with write_lock:
+            output.write(encode_frame(response, payload))
+            output.flush()
+
+    stdin = sys.stdin.buffer
+    with ThreadPoolExecutor(max_workers=Config.TTS_EXECUTOR_WORKERS, thread_name_prefix="siri-tts-worker") as pool:
+        while True:
+            frame = _read_frame_sync(stdin)
+            if frame is None:
+                break
+            pool.submit(run, frame[0])
+
+
+if __name__ == "__main__":
+    try:
+        worker_main()
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
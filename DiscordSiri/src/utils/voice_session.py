@@ -0,0 +1,194 @@
+"""
+음성 세션 관리 모듈
+길드별 음성 연결을 재사용하고, 빈 채널에서는 잠시 기다렸다가 퇴장
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+
+class VoiceSessionManager:
+    """
+    길드별 음성 연결 관리
+
+    - connect(): 이미 연결되어 있으면 그대로 쓰고, 다른 채널이면 move_to로 이동합니다.
+      channel.connect()/move_to()가 연결 완료까지 기다리므로 별도로 대기하지 않습니다.
+    - schedule_leave(): 채널이 비어도 linger초 동안 연결을 유지합니다.
+      그 사이 사용자가 돌아오거나 다시 부르면 음성 핸드셰이크 없이 바로 재사용합니다.
+    """
+
+    def __init__(self, linger_seconds: float = 60.0, connect_timeout: float = 15.0):
+        self.linger_seconds = linger_seconds
+        self.connect_timeout = connect_timeout
+        # 길드 ID: 연결/이동 직렬화용 잠금 (동시에 여러 사용자가 입장해도 한 번만 연결)
+        self._locks: dict[int, asyncio.Lock] = {}
+        # 길드 ID: 대기 후 퇴장 작업
+        self._leave_tasks: dict[int, asyncio.Task] = {}
+        # 대기가 끝나 실제로 퇴장(on_leave) 중인 길드 ID (이 단계에서는 취소하지 않음)
+        self._leaving: set[int] = set()
+
+        # 지표
+        self.connects = 0  # 새 음성 연결
+        self.moves = 0  # move_to로 채널 이동
+        self.reuses = 0  # 기존 연결 재사용 (이미 같은 채널)
+        self.rejoins = 0  # 퇴장 대기 중 다시 사용되어 퇴장 취소
+        self.lingered_leaves = 0  # 대기 후 실제로 퇴장
+        self.failures = 0
+        self._connect_latency_total = 0.0
+        self._connect_latency_max = 0.0
+        self._move_latency_total = 0.0
+
+    def _get_lock(self, guild_id: int) -> asyncio.Lock:
+        lock = self._locks.get(guild_id)
+        if lock is None:
+            lock = self._locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def connect(self, channel: discord.VoiceChannel) -> discord.VoiceClient:
+        """
+        채널에 연결된 음성 클라이언트 반환 (필요할 때만 새로 연결)
+
+        Raises:
+            asyncio.TimeoutError: connect_timeout초 안에 연결/이동이 끝나지 않음
+            discord.ClientException: 음성 연결 실패
+        """
+        guild = channel.guild
+        async with self._get_lock(guild.id):
+            self.keep_alive(guild.id)
+
+            voice_client = guild.voice_client
+            if isinstance(voice_client, discord.VoiceClient) and voice_client.is_connected():
+                if voice_client.channel == channel:
+                    self.reuses += 1
+                    return voice_client
+
+                started = time.perf_counter()
+                try:
+                    await voice_client.move_to(channel, timeout=self.connect_timeout)
+                    # move_to는 시간 초과 시 예외 없이 이전 상태로 되돌리므로 결과 확인
+                    if not voice_client.is_connected() or voice_client.channel != channel:
+                        raise asyncio.TimeoutError("음성 채널 이동 시간 초과")
+                except Exception:
+                    self.failures += 1
+                    raise
+                elapsed = time.perf_counter() - started
+                self.moves += 1
+                self._move_latency_total += elapsed
+                logger.debug(f"{guild.name}: 음성 채널 이동 {elapsed * 1000:.0f}ms ({channel.name})")
+                return voice_client
+
+            # 끊긴 채로 남아 있는 클라이언트 정리 후 새로 연결
+            if voice_client is not None:
+                await voice_client.disconnect(force=True)
+
+            started = time.perf_counter()
+            try:
+                voice_client = await channel.connect(timeout=self.connect_timeout)
+            except Exception:
+                self.failures += 1
+                raise
+            elapsed = time.perf_counter() - started
+            self.connects += 1
+            self._connect_latency_total += elapsed
+            self._connect_latency_max = max(self._connect_latency_max, elapsed)
+            logger.info(f"{guild.name}: 음성 연결 {elapsed * 1000:.0f}ms ({channel.name})")
+            return voice_client
+
+    def schedule_leave(
+        self,
+        guild: discord.Guild,
+        still_idle: Callable[[], bool],
+        on_leave: Callable[[], Awaitable[None]],
+    ) -> None:
+        """
+        linger초 뒤 퇴장 예약 (이미 예약되어 있으면 그대로 둠)
+
+        Args:
+            still_idle: 퇴장 직전 다시 확인할 조건 (False면 퇴장하지 않음)
+            on_leave: 퇴장 시 실행할 코루틴 (큐 정리, 연결 종료 등)
+        """
+        task = self._leave_tasks.get(guild.id)
+        if task is not None and not task.done():
+            return
+        self._leave_tasks[guild.id] = asyncio.create_task(
+            self._leave_later(guild, still_idle, on_leave), name=f"siri-voice-linger-{guild.id}"
+        )
+
+    async def _leave_later(
+        self,
+        guild: discord.Guild,
+        still_idle: Callable[[], bool],
+        on_leave: Callable[[], Awaitable[None]],
+    ) -> None:
+        try:
+            await asyncio.sleep(self.linger_seconds)
+            async with self._get_lock(guild.id):
+                if not still_idle():
+                    return
+                self.lingered_leaves += 1
+                self._leaving.add(guild.id)
+                try:
+                    await on_leave()
+                finally:
+                    self._leaving.discard(guild.id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"{guild.name}: 대기 후 퇴장 중 오류: {e}")
+        finally:
+            if self._leave_tasks.get(guild.id) is asyncio.current_task():
+                del self._leave_tasks[guild.id]
+
+    def keep_alive(self, guild_id: int) -> None:
+        """다시 사용되어 예약된 퇴장 취소 (사용자 복귀, 재호출 등)"""
+        if self.cancel_leave(guild_id):
+            self.rejoins += 1
+            logger.debug(f"길드 {guild_id}: 퇴장 대기 중 복귀, 음성 연결 재사용")
+
+    def cancel_leave(self, guild_id: int) -> bool:
+        """
+        예약된 퇴장 취소 (취소했으면 True)
+
+        대기 중일 때만 취소합니다. 이미 연결을 끊는 중이면 중간에 끊지 않고
+        그대로 마치게 두며, 다음 connect()가 잠금을 얻은 뒤 새로 연결합니다.
+        """
+        task = self._leave_tasks.get(guild_id)
+        if task is None or task.done() or guild_id in self._leaving:
+            return False
+        del self._leave_tasks[guild_id]
+        task.cancel()
+        return True
+
+    def is_leaving(self, guild_id: int) -> bool:
+        """퇴장 대기 중인지 여부"""
+        task = self._leave_tasks.get(guild_id)
+        return task is not None and not task.done()
+
+    def close(self) -> None:
+        """모든 퇴장 예약 취소 (봇 종료 시)"""
+        for task in self._leave_tasks.values():
+            task.cancel()
+        self._leave_tasks.clear()
+
+    def metrics(self) -> dict:
+        """연결 지표 반환"""
+        avg_connect_ms = self._connect_latency_total / self.connects * 1000 if self.connects else 0.0
+        avg_move_ms = self._move_latency_total / self.moves * 1000 if self.moves else 0.0
+        return {
+            "connects": self.connects,
+            "moves": self.moves,
+            "reuses": self.reuses,
+            "rejoins": self.rejoins,
+            "lingered_leaves": self.lingered_leaves,
+            "failures": self.failures,
+            "lingering": sum(1 for task in self._leave_tasks.values() if not task.done()),
+            "avg_connect_ms": round(avg_connect_ms),
+            "max_connect_ms": round(self._connect_latency_max * 1000),
+            "avg_move_ms": round(avg_move_ms),
+        }
@@ -0,0 +1,91 @@
+"""
+슬래시 명령어 동기화 테스트
+디스코드에 요청하지 않는 가짜 트리로 해시가 같으면 동기화를 건너뛰는지 확인
+"""
+
+import asyncio
+
+import discord
+import pytest
+from discord import app_commands
+
+from utils.command_sync import CommandSyncManager, compute_tree_hash
+
+APPLICATION_ID = 1234
+
+
+class RecordingTree(app_commands.CommandTree):
+    """sync 호출을 기록만 하는 명령어 트리"""
+
+    def __init__(self):
+        super().__init__(discord.Client(intents=discord.Intents.none()))
+        self.synced: list = []
+
+    async def sync(self, *, guild=None):
+        self.synced.append(guild.id if guild is not None else None)
+        return self.get_commands(guild=guild)
+
+
+def add_command(tree: app_commands.CommandTree, name: str, description: str = "설명") -> None:
+    async def callback(interaction: discord.Interaction):
+        pass
+
+    tree.add_command(app_commands.Command(name=name, description=description, callback=callback))
+
+
+@pytest.fixture
+def tree():
+    tree = RecordingTree()
+    add_command(tree, "ping")
+    add_command(tree, "hello")
+    return tree
+
+
+def test_hash_ignores_registration_order():
+    first, second = RecordingTree(), RecordingTree()
+    add_command(first, "ping")
+    add_command(first, "hello")
+    add_command(second, "hello")
+    add_command(second, "ping")
+    assert compute_tree_hash(first) == compute_tree_hash(second)
+
+
+def test_skips_sync_when_hash_unchanged(tree, tmp_path):
+    manager = CommandSyncManager(tree, tmp_path / "command_tree.json")
+    assert asyncio.run(manager.sync(APPLICATION_ID)) == 2
+    # 재시작해도 저장된 해시로 건너뜀
+    restarted = CommandSyncManager(tree, tmp_path / "command_tree.json")
+    assert asyncio.run(restarted.sync(APPLICATION_ID)) is None
+    assert tree.synced == [None]
+
+
+def test_syncs_again_when_tree_changes(tree, tmp_path):
+    manager = CommandSyncManager(tree, tmp_path / "command_tree.json")
+    asyncio.run(manager.sync(APPLICATION_ID))
+    add_command(tree, "bye")
+    assert asyncio.run(manager.sync(APPLICATION_ID)) == 3
+    assert tree.synced == [None, None]
+
+
+def test_force_and_other_application_sync(tree, tmp_path):
+    manager = CommandSyncManager(tree, tmp_path / "command_tree.json")
+    asyncio.run(manager.sync(APPLICATION_ID))
+    assert asyncio.run(manager.sync(APPLICATION_ID, force=True)) == 2
+    assert asyncio.run(manager.sync(APPLICATION_ID + 1)) == 2
+    assert len(tree.synced) == 3
+
+
+def test_dev_guild_scope_is_tracked_separately(tree, tmp_path):
+    state_path = tmp_path / "command_tree.json"
+    asyncio.run(CommandSyncManager(tree, state_path).sync(APPLICATION_ID))
+    guild_manager = CommandSyncManager(tree, state_path, dev_guild_id=42)
+    assert asyncio.run(guild_manager.sync(APPLICATION_ID)) == 2
+    assert asyncio.run(guild_manager.sync(APPLICATION_ID)) is None
+    assert tree.synced == [None, 42]
+
+
+def test_corrupt_state_file_triggers_sync(tree, tmp_path):
+    state_path = tmp_path / "command_tree.json"
+    state_path.write_text("{깨진 JSON", encoding="utf-8")
+    assert asyncio.run(CommandSyncManager(tree, state_path).sync(APPLICATION_ID)) == 2
+    assert tree.synced == [None]
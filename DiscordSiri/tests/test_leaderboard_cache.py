@@ -0,0 +1,123 @@
+"""
+리더보드 캐시 테스트
+가짜 DB로 XP 변경 시 N번째 점수(floor) 기준 무효화와 조회 중 쓰기 처리를 확인
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from cogs.leaderboard import LeaderboardCog
+from utils.config import Config
+
+GUILD_ID = 1
+
+
+class FakeDatabase:
+    """길드별 (유저 ID: (레벨, XP))에서 상위 N명을 돌려주는 DB (조회 횟수 기록)"""
+
+    def __init__(self, users: dict[int, dict[int, tuple[int, int]]]):
+        self.users = users
+        self.queries = 0
+        self.gate: asyncio.Event | None = None  # 설정하면 조회가 풀릴 때까지 대기
+
+    async def get_leaderboard(self, guild_id: int, limit: int = 10) -> list[dict]:
+        self.queries += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        rows = sorted(self.users.get(guild_id, {}).items(), key=lambda item: item[1], reverse=True)
+        return [{"user_id": user_id, "level": level, "xp": xp} for user_id, (level, xp) in rows[:limit]]
+
+    def set(self, guild_id: int, user_id: int, level: int, xp: int, cog: LeaderboardCog) -> None:
+        """값을 바꾸고 DatabaseManager처럼 커밋 후 리스너 호출"""
+        self.users.setdefault(guild_id, {})[user_id] = (level, xp)
+        cog._on_xp_change(guild_id, user_id, level, xp)
+
+
+@pytest.fixture(autouse=True)
+def small_leaderboard(monkeypatch):
+    monkeypatch.setattr(Config, "LEADERBOARD_SIZE", 3)
+
+
+def make_cog(users: dict[int, tuple[int, int]]) -> tuple[LeaderboardCog, FakeDatabase]:
+    db = FakeDatabase({GUILD_ID: dict(users)})
+    return LeaderboardCog(SimpleNamespace(db=db, guilds=[])), db
+
+
+FULL_BOARD = {10: (5, 500), 11: (4, 400), 12: (3, 300), 13: (2, 200)}
+
+
+def test_change_below_floor_keeps_cache():
+    async def scenario():
+        cog, db = make_cog(FULL_BOARD)
+        entry = await cog._get_entry(GUILD_ID)
+        db.set(GUILD_ID, 13, 2, 250, cog)  # 여전히 3위(레벨 3, 300) 미만
+        return entry, await cog._get_entry(GUILD_ID), db.queries
+
+    before, after, queries = asyncio.run(scenario())
+    assert before["floor"] == (3, 300)
+    assert after is before
+    assert queries == 1
+
+
+@pytest.mark.parametrize(
+    "user_id, level, xp",
+    [
+        (12, 3, 310),  # 상위 N명에 있던 유저
+        (13, 3, 300),  # floor와 같은 점수로 올라옴 (동점 순서는 DB가 정함)
+        (14, 6, 600),  # 새 유저가 1위로 진입
+    ],
+)
+def test_change_at_or_above_floor_invalidates(user_id, level, xp):
+    async def scenario():
+        cog, db = make_cog(FULL_BOARD)
+        before = await cog._get_entry(GUILD_ID)
+        db.set(GUILD_ID, user_id, level, xp, cog)
+        return before, await cog._get_entry(GUILD_ID), db.queries
+
+    before, after, queries = asyncio.run(scenario())
+    assert after is not before
+    assert queries == 2
+
+
+def test_board_not_full_invalidates_on_any_change():
+    async def scenario():
+        cog, db = make_cog({10: (5, 500)})
+        entry = await cog._get_entry(GUILD_ID)
+        db.set(GUILD_ID, 11, 1, 1, cog)
+        return entry, await cog._get_entry(GUILD_ID), db.queries
+
+    before, after, queries = asyncio.run(scenario())
+    assert before["floor"] is None
+    assert queries == 2
+    assert len(after["signature"]) == 2
+
+
+def test_write_during_build_is_not_cached():
+    async def scenario():
+        cog, db = make_cog(FULL_BOARD)
+        db.gate = asyncio.Event()
+        building = asyncio.create_task(cog._get_entry(GUILD_ID))
+        await asyncio.sleep(0)  # 조회 시작
+        db.set(GUILD_ID, 13, 1, 0, cog)  # 캐시가 없으므로 floor와 무관하게 버전만 증가
+        db.gate.set()
+        await building
+        return GUILD_ID in cog._cache
+
+    assert asyncio.run(scenario()) is False
+
+
+def test_global_cache_invalidated_only_when_guild_cache_is():
+    async def scenario():
+        cog, db = make_cog(FULL_BOARD)
+        await cog._get_entry(GUILD_ID)
+        version = cog._global_version
+        db.set(GUILD_ID, 13, 2, 210, cog)
+        unchanged = cog._global_version
+        db.set(GUILD_ID, 13, 9, 900, cog)
+        return version, unchanged, cog._global_version
+
+    version, unchanged, invalidated = asyncio.run(scenario())
+    assert unchanged == version
+    assert invalidated == version + 1
@@ -0,0 +1,110 @@
+"""
+TTS 오디오 캐시 테스트
+바이트 기준 LRU 축출, 고정 문구 보호, 원자적 교체, 시작 시 인덱스 복구를 확인
+"""
+
+import os
+
+import pytest
+
+from utils.tts_cache import TTSCache
+
+
+def key(text: str) -> str:
+    return TTSCache.make_key(text, "ko", "gtts")
+
+
+def test_make_key_normalizes_whitespace():
+    assert key("안녕  하세요\n") == key("안녕 하세요")
+    assert key("안녕") != TTSCache.make_key("안녕", "ko", "local")
+
+
+def test_evicts_least_recently_used_by_bytes(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=250)
+    cache.put(key("a"), b"a" * 100)
+    cache.put(key("b"), b"b" * 100)
+    assert cache.get(key("a")) is not None  # a를 최근 사용으로 갱신
+
+    cache.put(key("c"), b"c" * 100)
+
+    assert cache.get(key("b")) is None
+    assert cache.get(key("a")) is not None
+    assert cache.get(key("c")) is not None
+    assert cache.total_bytes == 200
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([key("a") + ".mp3", key("c") + ".mp3"])
+
+
+def test_newly_put_entry_is_kept_even_if_over_limit(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=100)
+    cache.put(key("a"), b"a" * 50)
+    cache.put(key("big"), b"x" * 150)
+
+    assert cache.get(key("a")) is None
+    assert cache.get(key("big")) is not None
+    assert len(cache) == 1
+
+
+def test_pinned_entries_are_not_evicted(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=250)
+    cache.put(key("고정"), b"p" * 100)
+    cache.pin(key("고정"))
+    cache.put(key("b"), b"b" * 100)
+    cache.put(key("c"), b"c" * 100)
+
+    assert cache.get(key("고정")) is not None
+    assert cache.get(key("b")) is None
+    assert cache.total_bytes == 200
+
+
+def test_put_replaces_existing_entry(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=1000)
+    path = cache.put(key("a"), b"old")
+    assert cache.put(key("a"), b"newer") == path
+
+    assert path.read_bytes() == b"newer"
+    assert cache.total_bytes == len(b"newer")
+    assert len(cache) == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_failed_write_keeps_previous_file(tmp_path, monkeypatch):
+    cache = TTSCache(tmp_path, max_bytes=1000)
+    path = cache.put(key("a"), b"old")
+
+    def fail_replace(src, dst):
+        raise OSError("디스크 오류")
+
+    monkeypatch.setattr("utils.tts_cache.os.replace", fail_replace)
+    with pytest.raises(OSError):
+        cache.put(key("a"), b"new")
+
+    assert path.read_bytes() == b"old"
+    assert cache.total_bytes == len(b"old")
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_get_drops_externally_deleted_file(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=1000)
+    cache.put(key("a"), b"a" * 10).unlink()
+
+    assert cache.get(key("a")) is None
+    assert cache.total_bytes == 0
+    assert cache.misses == 1
+
+
+def test_reload_restores_index_and_removes_temp_files(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=1000)
+    older = cache.put(key("older"), b"o" * 10)
+    newer = cache.put(key("newer"), b"n" * 10)
+    os.utime(older, (1, 1))
+    os.utime(newer, (2, 2))
+    (tmp_path / "leftover.tmp").write_bytes(b"partial")
+    (tmp_path / "unrelated.txt").write_bytes(b"skip")
+
+    # 한도를 줄여 다시 열면 수정 시각이 오래된 파일부터 축출
+    reloaded = TTSCache(tmp_path, max_bytes=15)
+
+    assert not (tmp_path / "leftover.tmp").exists()
+    assert reloaded.get(key("older")) is None
+    assert reloaded.get(key("newer")) == newer
+    assert reloaded.total_bytes == 10
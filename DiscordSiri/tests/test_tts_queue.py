@@ -0,0 +1,175 @@
+"""
+TTS 재생 큐 테스트
+가짜 합성 함수와 가짜 음성 클라이언트로 버림 정책, 병합, 미리 합성, 완료 통지를 확인
+"""
+
+import asyncio
+
+import pytest
+
+from utils.tts_queue import DROP_NEWEST, DROP_OLDEST, GuildTTSQueue
+
+
+class FakeAudio:
+    """재생할 텍스트만 담은 오디오 (FFmpeg 없이 재생 순서 확인용)"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def create_source(self) -> str:
+        return self.text
+
+
+class FakeVoiceClient:
+    """play()를 기록하고 play_seconds 뒤에 after 콜백을 호출하는 음성 클라이언트"""
+
+    def __init__(self, play_seconds: float = 0.0, disconnect_after: int = 0):
+        self.play_seconds = play_seconds
+        self.disconnect_after = disconnect_after  # 이 횟수만큼 재생하면 연결 끊김 (0이면 유지)
+        self.connected = True
+        self.played: list[str] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def is_playing(self) -> bool:
+        return False
+
+    def stop(self) -> None:
+        pass
+
+    def play(self, source: str, after) -> None:
+        self.played.append(source)
+        if self.disconnect_after and len(self.played) >= self.disconnect_after:
+            self.connected = False
+        asyncio.get_running_loop().call_later(self.play_seconds, after, None)
+
+
+class FakeSynthesizer:
+    """호출한 텍스트를 기록하는 합성 함수 (blocked 텍스트는 풀어 줄 때까지 대기)"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls: list[str] = []
+        self.blocked: dict[str, asyncio.Event] = {}
+        self.tasks: dict[str, asyncio.Task] = {}
+
+    async def __call__(self, text: str) -> FakeAudio:
+        self.calls.append(text)
+        self.tasks[text] = asyncio.current_task()
+        if text in self.blocked:
+            await self.blocked[text].wait()
+        if self.fail:
+            raise RuntimeError("합성 실패")
+        return FakeAudio(text)
+
+
+def make_queue(voice: FakeVoiceClient, synthesize: FakeSynthesizer, **kwargs) -> GuildTTSQueue:
+    return GuildTTSQueue(1, synthesize, lambda: voice, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "policy, expected_results, expected_played",
+    [
+        (DROP_OLDEST, [False, True, True], ["b", "c"]),
+        (DROP_NEWEST, [True, True, False], ["a", "b"]),
+    ],
+)
+def test_drop_policy_at_max_depth(policy, expected_results, expected_played):
+    async def scenario():
+        voice = FakeVoiceClient()
+        queue = make_queue(voice, FakeSynthesizer(), max_depth=2, drop_policy=policy)
+        # 소비자 작업이 돌기 전에 세 항목이 모두 들어감
+        results = await asyncio.gather(queue.speak("a"), queue.speak("b"), queue.speak("c"))
+        await queue.stop()
+        return results, voice.played, queue.metrics()
+
+    results, played, stats = asyncio.run(scenario())
+    assert results == expected_results
+    assert played == expected_played
+    assert stats["dropped"] == 1
+    assert stats["max_depth"] == 2
+
+
+def test_coalesces_consecutive_messages_from_same_source():
+    async def scenario():
+        voice = FakeVoiceClient()
+        queue = make_queue(voice, FakeSynthesizer(), coalesce_chars=20)
+        queue.put("안녕", source=1)
+        queue.put("하세요", source=1)
+        queue.put("다른 사람", source=2)
+        queue.put("아주 긴 메시지라서 합칠 수 없음", source=2)
+        await queue.speak("끝")
+        await queue.stop()
+        return voice.played, queue.metrics()
+
+    played, stats = asyncio.run(scenario())
+    assert played == ["안녕 하세요", "다른 사람", "아주 긴 메시지라서 합칠 수 없음", "끝"]
+    assert stats["coalesced"] == 1
+
+
+@pytest.mark.parametrize("prefetch, expected", [(0, 0), (1, 3)])
+def test_prefetch_counts_items_ready_before_their_turn(prefetch, expected):
+    async def scenario():
+        voice = FakeVoiceClient(play_seconds=0.01)
+        synthesize = FakeSynthesizer()
+        queue = make_queue(voice, synthesize, prefetch=prefetch)
+        queue.put("a")
+        queue.put("b")
+        queue.put("c")
+        await queue.speak("d")
+        await queue.stop()
+        return voice.played, synthesize.calls, queue.metrics()
+
+    played, calls, stats = asyncio.run(scenario())
+    assert played == calls == ["a", "b", "c", "d"]
+    assert stats["prefetched"] == expected
+    assert stats["played"] == 4
+
+
+def test_done_future_resolves_false_when_disconnected():
+    async def scenario():
+        voice = FakeVoiceClient()
+        voice.connected = False
+        synthesize = FakeSynthesizer()
+        queue = make_queue(voice, synthesize)
+        result = await queue.speak("안녕")
+        await queue.stop()
+        return result, synthesize.calls
+
+    result, calls = asyncio.run(scenario())
+    assert result is False
+    assert calls == []
+
+
+def test_done_future_resolves_false_when_synthesis_fails():
+    async def scenario():
+        voice = FakeVoiceClient()
+        queue = make_queue(voice, FakeSynthesizer(fail=True))
+        result = await queue.speak("안녕")
+        await queue.stop()
+        return result, voice.played, queue.metrics()
+
+    result, played, stats = asyncio.run(scenario())
+    assert result is False
+    assert played == []
+    assert stats["failed"] == 1
+
+
+def test_disconnect_mid_item_cancels_remaining_chunks():
+    async def scenario():
+        voice = FakeVoiceClient(disconnect_after=1)
+        synthesize = FakeSynthesizer()
+        synthesize.blocked["셋째 문장."] = asyncio.Event()
+        queue = make_queue(voice, synthesize, chunk_chars=8)
+        result = await queue.speak("첫째 문장. 둘째 문장. 셋째 문장.")
+        await asyncio.sleep(0)
+        # 큐를 멈추기 전에 확인 (asyncio.run 종료 시 남은 작업은 어차피 취소됨)
+        cancelled = synthesize.tasks["셋째 문장."].cancelled()
+        await queue.stop()
+        return result, voice.played, cancelled
+
+    result, played, cancelled = asyncio.run(scenario())
+    assert result is True  # 첫 조각은 재생됨
+    assert played == ["첫째 문장."]
+    assert cancelled
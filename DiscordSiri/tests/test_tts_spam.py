@@ -0,0 +1,67 @@
+"""
+TTS 도배 방지 테스트
+now 인자로 시각을 직접 넘겨(가짜 시계) 중복 차단 창과 토큰 버킷 회복을 확인
+"""
+
+import pytest
+
+from utils.tts_spam import TTSSpamGuard
+
+
+@pytest.mark.parametrize("a, b", [("안녕하세요", "안녕하세요!!"), ("ㅋㅋㅋ 웃겨", "ㅋㅋㅋㅋㅋㅋ 웃겨"), ("Hello World", "hello   world")])
+def test_fingerprint_ignores_case_punctuation_and_repeats(a, b):
+    assert TTSSpamGuard.fingerprint(a) == TTSSpamGuard.fingerprint(b)
+
+
+def test_duplicate_blocked_within_window():
+    guard = TTSSpamGuard(window=30.0, chars_per_minute=0)
+    assert guard.check(1, 10, "안녕하세요", now=0.0) is None
+    assert guard.check(1, 20, "안녕하세요!", now=10.0) is not None
+    # 다른 길드는 따로 판정
+    assert guard.check(2, 10, "안녕하세요", now=10.0) is None
+    assert guard.metrics() == {"duplicates": 1, "over_budget": 0}
+
+
+def test_repeated_pasting_keeps_extending_window():
+    guard = TTSSpamGuard(window=30.0, chars_per_minute=0)
+    assert guard.check(1, 10, "도배", now=0.0) is None
+    assert guard.check(1, 10, "도배", now=25.0) is not None
+    # 마지막으로 본 시각(25초)부터 다시 30초
+    assert guard.check(1, 10, "도배", now=50.0) is not None
+    assert guard.check(1, 10, "도배", now=81.0) is None
+
+
+def test_forget_guild_clears_recent_messages():
+    guard = TTSSpamGuard(window=30.0, chars_per_minute=0)
+    guard.check(1, 10, "안녕", now=0.0)
+    guard.forget_guild(1)
+    assert guard.check(1, 10, "안녕", now=1.0) is None
+
+
+def test_token_bucket_limits_and_refills_per_user():
+    guard = TTSSpamGuard(window=0.0, chars_per_minute=60)  # 초당 1글자 회복
+    assert guard.check(1, 10, "가" * 50, now=0.0) is None
+    assert guard.check(1, 10, "나" * 20, now=1.0) is not None  # 남은 11글자
+    # 다른 사용자는 별도 한도
+    assert guard.check(1, 20, "다" * 60, now=1.0) is None
+    # 10초 뒤 11 + 10 = 21글자
+    assert guard.check(1, 10, "라" * 20, now=11.0) is None
+    assert guard.metrics() == {"duplicates": 0, "over_budget": 1}
+
+
+def test_token_bucket_caps_at_capacity():
+    guard = TTSSpamGuard(window=0.0, chars_per_minute=60)
+    assert guard.check(1, 10, "가" * 60, now=0.0) is None
+    # 오래 쉬어도 한도(60글자) 이상 쌓이지 않음
+    assert guard.check(1, 10, "나" * 61, now=1000.0) is not None
+
+
+def test_prune_removes_only_refilled_buckets():
+    guard = TTSSpamGuard(window=0.0, chars_per_minute=60)
+    guard._PRUNE_THRESHOLD = 3
+    guard.check(1, 1, "가" * 60, now=0.0)
+    guard.check(1, 2, "가" * 30, now=50.0)
+    guard.check(1, 3, "가" * 60, now=55.0)
+    # 새 사용자가 들어오며 정리: 1번은 60초 뒤 가득 참, 2·3번은 아직 회복 중
+    guard.check(1, 4, "가", now=60.0)
+    assert set(guard._budgets) == {(1, 2), (1, 3), (1, 4)}
@@ -0,0 +1,36 @@
+"""
+TTS 텍스트 전처리 테스트
+미리 컴파일한 정규식 구현이 이전 구현과 같은 결과를 내는지 임의 문장으로 비교
+"""
+
+import random
+
+import pytest
+
+from cogs.voice import VoiceCog
+from scripts.bench_tts_text import SAMPLE_MESSAGES, legacy_process_message_for_tts, random_message
+
+
+@pytest.fixture(scope="module")
+def cog():
+    cog = VoiceCog(None)
+    yield cog
+    cog.tts_executor.shutdown(wait=False)
+    cog.tts_cache_executor.shutdown(wait=False)
+
+
+@pytest.mark.parametrize("message", SAMPLE_MESSAGES)
+def test_sample_messages_match_legacy(cog, message):
+    assert cog.process_message_for_tts(message) == legacy_process_message_for_tts(cog, message)
+
+
+def test_random_messages_match_legacy(cog):
+    rng = random.Random(20260101)
+    for _ in range(20000):
+        message = random_message(rng, cog)
+        assert cog.process_message_for_tts(message) == legacy_process_message_for_tts(cog, message), message
+
+
+@pytest.mark.parametrize("count, expected", [(2, "크크크"), (3, "크크크"), (4, "크크크 크크크"), (7, "크크크 크크크 크크크")])
+def test_repeat_count(cog, count, expected):
+    assert cog.process_message_for_tts("ㅋ" * count) == expected